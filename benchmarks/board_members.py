@@ -0,0 +1,133 @@
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import cyclopts
+
+from src.app.task.domain import entity as entity_domain
+
+_BOARD_ID = "benchmark-board"
+
+app = cyclopts.App(
+    name="benchmark-board-members",
+    help="Member lookups of a Board aggregate, linear scans against the indexes",
+)
+
+
+def _board(members: int) -> entity_domain.Board:
+    return entity_domain.Board(
+        id=_BOARD_ID,
+        name="benchmark",
+        description="benchmark",
+        members=[
+            entity_domain.BoardMember(
+                user_id=f"user-{position}",
+                board_id=_BOARD_ID,
+                role=(
+                    entity_domain.RoleMemberType.ADMIN
+                    if position == 0
+                    else entity_domain.RoleMemberType.EDITOR
+                ),
+            )
+            for position in range(members)
+        ],
+    )
+
+
+def _linear_member(
+    board: entity_domain.Board, user_id: str
+) -> entity_domain.BoardMember | None:
+    for member in board.members:
+        if member.user_id == user_id:
+            return member
+    return None
+
+
+def _linear_is_admin(board: entity_domain.Board, user_id: str) -> bool:
+    if not any(member.user_id == user_id for member in board.members):
+        return False
+    member = _linear_member(board, user_id)
+    return member is not None and member.role == entity_domain.RoleMemberType.ADMIN
+
+
+def _indexed_member(
+    board: entity_domain.Board, user_id: str
+) -> entity_domain.BoardMember | None:
+    try:
+        return board.get_member_by_user_id(user_id)
+    except entity_domain.IsNotMemberofBoardError:
+        return None
+
+
+_LOOKUPS: Dict[str, Dict[str, Callable[[entity_domain.Board, str], Any]]] = {
+    "linear": {"member": _linear_member, "is_admin": _linear_is_admin},
+    "indexed": {
+        "member": _indexed_member,
+        "is_admin": lambda board, user_id: board.is_admin(user_id),
+    },
+}
+
+
+def _time(
+    lookup: Callable[[entity_domain.Board, str], Any],
+    board: entity_domain.Board,
+    user_ids: List[str],
+) -> List[float]:
+    timings: List[float] = []
+    for user_id in user_ids:
+        started = time.perf_counter()
+        lookup(board, user_id)
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+
+def _report(
+    members: int, mode: str, operation: str, timings: List[float]
+) -> Dict[str, Any]:
+    first, rest = timings[0], timings[1:]
+    ordered = sorted(rest)
+    return {
+        "members": members,
+        "mode": mode,
+        "operation": operation,
+        "lookups": len(rest),
+        "first_us": round(first, 3),
+        "mean_us": round(statistics.fmean(rest), 3),
+        "p95_us": round(ordered[int(len(ordered) * 0.95) - 1], 3),
+    }
+
+
+@app.default
+def benchmark(
+    members: List[int] = [10_000, 50_000, 100_000],
+    lookups: int = 200,
+    seed: int = 7,
+) -> None:
+    randomizer = random.Random(seed)
+
+    results: List[Dict[str, Any]] = []
+    for total_members in members:
+        board = _board(total_members)
+        user_ids = [
+            f"user-{randomizer.randrange(total_members * 2)}"
+            for _ in range(lookups + 1)
+        ]
+        for mode, operations in _LOOKUPS.items():
+            for operation, lookup in operations.items():
+                timings = _time(lookup, board, user_ids)
+                results.append(_report(total_members, mode, operation, timings))
+
+    print(
+        f"{'members':>8} {'mode':>8} {'operation':>9} {'lookups':>7} "
+        f"{'first us':>10} {'mean us':>10} {'p95 us':>10}"
+    )
+    for result in results:
+        print(
+            "{members:>8} {mode:>8} {operation:>9} {lookups:>7} "
+            "{first_us:>10} {mean_us:>10} {p95_us:>10}".format(**result)
+        )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,184 @@
+import statistics
+import time
+from typing import Any, Dict, List
+
+import cyclopts
+
+from src import main
+from src.domain.models import filter as filter_domain
+from src.domain.models import repository
+from src.infra.filter import filter_builder
+from src.infra.mixin import postgres
+from src.infra.uow import model as uow_model
+
+_TABLE = "tbl_benchmark_pagination"
+
+_CREATE_TABLE = f"""
+DROP TABLE IF EXISTS {_TABLE};
+CREATE UNLOGGED TABLE {_TABLE}(
+    id VARCHAR(40) PRIMARY KEY NOT NULL,
+    position INTEGER NOT NULL,
+    is_activated BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP NOT NULL
+);
+"""
+
+_SEED_TABLE = f"""
+INSERT INTO {_TABLE} (id, position, created_at)
+SELECT
+    lpad(serie::text, 12, '0'),
+    serie,
+    TIMESTAMP '2024-01-01' + serie * INTERVAL '1 second'
+FROM generate_series(1, %s) AS serie;
+"""
+
+_INDEX_TABLE = f"""
+CREATE INDEX ON {_TABLE}(created_at, id);
+ANALYZE {_TABLE};
+"""
+
+_DROP_TABLE = f"DROP TABLE IF EXISTS {_TABLE};"
+
+app = cyclopts.App(
+    name="benchmark-pagination",
+    help="Page-walk cost of offset and keyset pagination",
+)
+
+
+class BenchmarkPaginationRepository(
+    postgres.PostgresGetterListMixin, repository.Repository
+):
+    def __init__(self, *args, **kwargs) -> None:
+        kwargs["repository_persistence"] = kwargs["persistency"] = (
+            repository.RepositoryPersistence(
+                table_name=_TABLE,
+                fields=["id", "position", "is_activated", "created_at"],
+                sortable_fields=["id", "created_at"],
+            )
+        )
+        super().__init__(*args, **kwargs)
+
+    def serialize(self, data: Any) -> Any:
+        return data
+
+
+def _dependencies() -> Dict[str, Any]:
+    configuration = main.build_configuration()
+    dependencies: Dict[str, Any] = {"configuration": configuration}
+
+    env_adapter = main.build_env_adapter(configuration).selected_with_configuration(
+        dependencies=dependencies
+    )
+    configuration.inject(env_adapter.all())
+
+    dependencies["logger"] = main.build_logger_adapter(
+        configuration
+    ).selected_with_configuration(dependencies=dependencies)
+    dependencies["uow"] = main.build_uow_adapter(
+        configuration
+    ).selected_with_configuration(dependencies=dependencies)
+    return dependencies
+
+
+def _criteria(
+    page_quantity: int, page_number: int, cursor: str | None = None
+) -> filter_domain.Criteria:
+    is_activated = filter_builder.build(type_filter=filter_domain.FilterType.EQUAL)
+    order_by = filter_builder.build_order(type_order=filter_domain.OrderType.ASC)
+    return filter_domain.Criteria(
+        filters=[is_activated("is_activated")(True)],
+        order_by=[order_by("created_at")],
+        page_quantity=page_quantity,
+        page_number=page_number,
+        cursor=filter_domain.Cursor.decode(cursor) if cursor else None,
+    )
+
+
+def _walk(
+    repository_benchmark: BenchmarkPaginationRepository,
+    mode: str,
+    start_page: int,
+    pages: int,
+    page_quantity: int,
+) -> List[float]:
+    timings: List[float] = []
+    cursor: str | None = None
+
+    if mode == "keyset" and start_page > 1:
+        cursor = repository_benchmark.filter(
+            criteria=_criteria(page_quantity, start_page - 1)
+        ).next_cursor
+
+    for page in range(start_page, start_page + pages):
+        started = time.perf_counter()
+        if mode == "offset":
+            repository_benchmark.filter(criteria=_criteria(page_quantity, page))
+        else:
+            cursor = repository_benchmark.filter(
+                criteria=_criteria(page_quantity, 1, cursor)
+            ).next_cursor
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _report(rows: int, depth: str, mode: str, timings: List[float]) -> Dict[str, Any]:
+    ordered = sorted(timings)
+    return {
+        "rows": rows,
+        "depth": depth,
+        "mode": mode,
+        "pages": len(timings),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 3),
+    }
+
+
+@app.default
+def benchmark(
+    rows: List[int] = [10_000, 100_000, 1_000_000],
+    pages: int = 50,
+    page_quantity: int = 30,
+) -> None:
+    dependencies = _dependencies()
+    uow: uow_model.UOW = dependencies["uow"]
+
+    results: List[Dict[str, Any]] = []
+    for total_rows in rows:
+        with uow.session() as session:
+            session.atomic_execute(_CREATE_TABLE)
+            session.atomic_execute(_SEED_TABLE, (total_rows,))
+            session.atomic_execute(_INDEX_TABLE)
+            session.commit()
+
+        with uow.session() as session:
+            repository_benchmark = BenchmarkPaginationRepository(
+                configuration=dependencies["configuration"],
+                log=dependencies["logger"],
+                session=session,
+                filter_builder=filter_builder,
+            )
+            last_page = max(total_rows // page_quantity - pages, 1)
+            for depth, start_page in (("head", 1), ("tail", last_page)):
+                for mode in ("offset", "keyset"):
+                    timings = _walk(
+                        repository_benchmark, mode, start_page, pages, page_quantity
+                    )
+                    results.append(_report(total_rows, depth, mode, timings))
+
+        with uow.session() as session:
+            session.atomic_execute(_DROP_TABLE)
+            session.commit()
+
+    print(
+        f"{'rows':>9} {'depth':>5} {'mode':>7} {'pages':>5} {'mean ms':>9} {'p95 ms':>9}"
+    )
+    for result in results:
+        print(
+            "{rows:>9} {depth:>5} {mode:>7} {pages:>5} {mean_ms:>9} {p95_ms:>9}".format(
+                **result
+            )
+        )
+
+
+if __name__ == "__main__":
+    app()
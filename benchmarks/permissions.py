@@ -0,0 +1,74 @@
+import datetime
+import timeit
+from typing import Any, Callable, Dict, List
+
+import cyclopts
+
+from src.domain.services import user
+from src.infra.jwt import model as jwt_model
+
+app = cyclopts.App(
+    name="benchmark-permissions",
+    help="Audience checks of a token, audience lists against bitmasks",
+)
+
+
+def _list_has_permission(data: jwt_model.JWTData, audiences: List[str]) -> bool:
+    role = list(filter(lambda aud: aud.startswith("role:"), data.aud))[0]
+    all_audiences_with_role = user.ROLE_PERMISSIONS[user.Role(role)]
+    current_user_audiences = [
+        user.Audience(aud) for aud in data.aud if user.Audience.exists(aud)
+    ] + all_audiences_with_role
+    return any(user.Audience(aud) in current_user_audiences for aud in audiences)
+
+
+def _data(claims: int) -> jwt_model.JWTData:
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    return jwt_model.JWTData(
+        user=user.AuthUser(id="1", name="name", last_name="last", username="user"),
+        aud=["role:client"] + [f"scope:{position}" for position in range(claims)],
+        gen=now,
+        exp=now + datetime.timedelta(hours=1),
+    )
+
+
+def _checks(
+    data: jwt_model.JWTData, audiences: List[str]
+) -> Dict[str, Callable[[], Any]]:
+    audiences_mask = user.audiences_mask(audiences)
+    permissions_mask = data.permissions_mask
+    return {
+        "list": lambda: _list_has_permission(data, audiences),
+        "mask": lambda: data.has_permission(audiences_mask=audiences_mask),
+        "cached mask": lambda: data.has_permission(
+            audiences_mask=audiences_mask, permissions_mask=permissions_mask
+        ),
+    }
+
+
+@app.default
+def benchmark(
+    claims: List[int] = [0, 8],
+    iterations: int = 20_000,
+    repeat: int = 5,
+) -> None:
+    cases = {
+        "first": [user.Audience.GET_PROFILE.value],
+        "last": [user.Audience.GET_TASKS_ALL.value],
+        "denied": [user.Audience.CREATE_PROFILE.value],
+    }
+
+    print(f"{'claims':>6} {'audience':>8} {'check':>12} {'ns/check':>10}")
+    for extra_claims in claims:
+        data = _data(extra_claims)
+        for case, audiences in cases.items():
+            for check, function in _checks(data, audiences).items():
+                best = min(timeit.repeat(function, number=iterations, repeat=repeat))
+                print(
+                    f"{extra_claims:>6} {case:>8} {check:>12} "
+                    f"{best / iterations * 1_000_000_000:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    app()
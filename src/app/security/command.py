@@ -3,12 +3,12 @@ from typing import List, cast
 
 import pydantic
 
-from src.domain import libtools
 from src.domain.models import repository as repository_model
 from src.domain.models.filter import FilterBuilder
 from src.domain.services import command
 from src.infra.jwt import model as jwt_model
 from src.infra.log import model as log_model
+from src.infra.password import model as password_model
 from src.infra.uow.model import UOW
 
 from . import domain as domain_security
@@ -50,14 +50,16 @@ class CreateUserData(command.CommandRequest):
             raise ValueError("Current Password and Repeat Password must match!")
         return self
 
-    def to_repository_user(self, permissions: List[str]) -> domain_security.UserData:
+    def to_repository_user(
+        self, permissions: List[str], hashed_password: str
+    ) -> domain_security.UserData:
         return domain_security.UserData(
             id=str(uuid.uuid4()),
             name=self.name,
             last_name=self.last_name,
             username=self.username,
             email=self.email,
-            password=pydantic.SecretStr(libtools.encrypt_password(self.password)),
+            password=pydantic.SecretStr(hashed_password),
             permissions=permissions,
         )
 
@@ -80,10 +82,17 @@ class CreateSuperUserCommand(command.Command):
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
     filter_builder: FilterBuilder
+    password_hasher: password_model.PasswordHasher
 
     def __init__(self):
         super().__init__(
-            requirements=["logger", "repository_getter", "uow", "filter_builder"],
+            requirements=[
+                "logger",
+                "repository_getter",
+                "uow",
+                "filter_builder",
+                "password_hasher",
+            ],
             request_type=CreateSuperUserCommandData,
         )
 
@@ -94,9 +103,11 @@ class CreateSuperUserCommand(command.Command):
         )
         self.uow = self._deps["uow"]
         self.filter_builder = self._deps["filter_builder"]
+        self.password_hasher = self._deps["password_hasher"]
         self.logger.info("Executing GetDataCommand")
 
         current_request = cast(CreateSuperUserCommandData, self.request)
+        hashed_password = await self.password_hasher.hash(current_request.password)
 
         with self.uow.session() as session:
             repository_user = cast(
@@ -118,7 +129,8 @@ class CreateSuperUserCommand(command.Command):
             new_repository_user = current_request.to_repository_user(
                 [
                     "role:admin",
-                ]
+                ],
+                hashed_password=hashed_password,
             )
             user_service.create_user(
                 new_user=new_repository_user,
@@ -150,10 +162,17 @@ class AuthenticateCommand(command.Command):
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
     jwt: jwt_model.AuthJWT
+    password_hasher: password_model.PasswordHasher
 
     def __init__(self):
         super().__init__(
-            requirements=["logger", "uow", "jwt", "repository_getter"],
+            requirements=[
+                "logger",
+                "uow",
+                "jwt",
+                "repository_getter",
+                "password_hasher",
+            ],
             request_type=AuthenticateUserCommandData,
         )
 
@@ -162,6 +181,7 @@ class AuthenticateCommand(command.Command):
         self.uow = self._deps["uow"]
         self.jwt = self._deps["jwt"]
         self.repository_getter = self._deps["repository_getter"]
+        self.password_hasher = self._deps["password_hasher"]
 
         if self.parameters.get("version") != "v1":
             raise ValueError("Version not found")
@@ -179,14 +199,17 @@ class AuthenticateCommand(command.Command):
                     session=session,
                 ),
             )
-            authentication_response = authenticate_service.authenticate(
+            authentication_response = await authenticate_service.authenticate(
                 jwt=self.jwt,
                 logger=self.logger,
                 user_repository=repository_user,
                 email=current_request.email,
                 password=current_request.password,
+                password_hasher=self.password_hasher,
             )
 
+            session.commit()
+
         return command.CommandResponse(
             trace_id=getattr(current_request, "trace_id", uuid.uuid4()),
             payload=authentication_response.model_dump(),
@@ -226,7 +249,7 @@ class RefreshAuthenticateCommand(command.Command):
 
         current_request = cast(RefreshAuthenticateCommandData, self.request)
 
-        with self.uow.session() as session:
+        with self.uow.read_session() as session:
             repository_user = cast(
                 domain_security.UserRepository,
                 self.repository_getter(
@@ -263,10 +286,11 @@ class CreateBasicUserCommand(command.Command):
     logger: log_model.LogAdapter
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
+    password_hasher: password_model.PasswordHasher
 
     def __init__(self):
         super().__init__(
-            requirements=["logger", "uow", "repository_getter"],
+            requirements=["logger", "uow", "repository_getter", "password_hasher"],
             request_type=CreateBasicUserCommandData,
         )
 
@@ -274,6 +298,7 @@ class CreateBasicUserCommand(command.Command):
         self.logger = self._deps["logger"]
         self.uow = self._deps["uow"]
         self.repository_getter = self._deps["repository_getter"]
+        self.password_hasher = self._deps["password_hasher"]
 
         if self.parameters.get("version") != "v1":
             raise ValueError("Version not found")
@@ -282,6 +307,7 @@ class CreateBasicUserCommand(command.Command):
             raise ValueError("Request not found")
 
         current_request = cast(CreateBasicUserCommandData, self.request)
+        hashed_password = await self.password_hasher.hash(current_request.password)
 
         with self.uow.session() as session:
             repository_user = cast(
@@ -303,7 +329,8 @@ class CreateBasicUserCommand(command.Command):
             new_repository_user = current_request.to_repository_user(
                 [
                     "role:client",
-                ]
+                ],
+                hashed_password=hashed_password,
             )
             new_repository_profile = current_request.to_repository_profile(
                 str(new_repository_user.id)
@@ -373,7 +400,7 @@ class GetProfileCommand(command.Command):
         if not self.request:
             raise ValueError("Request not found")
 
-        with self.uow.session() as session:
+        with self.uow.read_session() as session:
             repository_user = cast(
                 domain_security.UserRepository,
                 self.repository_getter(
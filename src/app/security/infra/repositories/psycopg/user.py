@@ -85,7 +85,7 @@ class PostgresUserRepository(
         return self.serialize(found)
 
     def serialize(self, data: Any) -> security_domain.UserData | None:
-        return security_domain.UserData(
+        user_data = security_domain.UserData(
             id=data[0],
             name=data[1],
             last_name=data[2],
@@ -98,3 +98,5 @@ class PostgresUserRepository(
             permissions=cast(str, data[9]).split(","),
             password=data[10],
         )
+        user_data.mark_clean()
+        return user_data
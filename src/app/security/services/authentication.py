@@ -9,6 +9,7 @@ from src.domain.services import user as service_user
 from src.infra.jwt import model as jwt_model
 from src.infra.jwt.model import RefreshAuthUser
 from src.infra.log import model as log_model
+from src.infra.password import model as password_model
 
 
 class AuthenticationResponse(pydantic.BaseModel):
@@ -40,12 +41,13 @@ _INVALID_REFRESH_AUTHENTICATION = AuthenticationResponse(
 )
 
 
-def authenticate(
+async def authenticate(
     jwt: jwt_model.AuthJWT,
     user_repository: domain_security.UserRepository,
     email: str,
     password: pydantic.SecretStr,
     logger: log_model.LogAdapter,
+    password_hasher: password_model.PasswordHasher,
 ) -> AuthenticationResponse:
     user_data = user_services.find_user_by_email(
         email=email, user_repository=user_repository
@@ -53,10 +55,15 @@ def authenticate(
     if not user_data:
         logger.warning(f"User {email} not found")
         return _INVALID_AUTHENTICATION
-    if not user_data.is_auth(password=password):
+    if not await password_hasher.verify(password, user_data.password):
         logger.warning(f"User {email} not authenticated")
         return _INVALID_AUTHENTICATION
 
+    if password_hasher.needs_rehash(user_data.password):
+        logger.info(f"Rehashing password of user {user_data.id}")
+        user_data.password = pydantic.SecretStr(await password_hasher.hash(password))
+        user_repository.update(id=user_data.id, to_update=user_data)
+
     auth_user = service_user.AuthUser(
         id=user_data.id,
         name=user_data.name,
@@ -29,4 +29,5 @@ def command_query_to_criteria(
         order_by=current_order_by,
         page_quantity=query.limit or 30,
         page_number=query.offset or 1,
+        cursor=filter_domain.Cursor.decode(query.cursor) if query.cursor else None,
     )
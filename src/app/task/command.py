@@ -1,11 +1,13 @@
 from typing import cast
 
+from src import settings
 from src.app.security import domain as domain_security
 from src.domain.models import repository as repository_model
 from src.domain.models.filter import FilterBuilder
 from src.domain.services import command
 from src.infra.log import model as log_model
-from src.infra.uow.model import UOW
+from src.infra.membership_cache.model import MembershipCache
+from src.infra.uow.model import UOW, AsyncUOW
 
 from .domain import repository as domain_repository
 from .domain.entity import RoleMemberType
@@ -18,6 +20,7 @@ class CreateBoardCommand(command.Command):
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
     filter_builder: FilterBuilder
+    membership_cache: MembershipCache
 
     def __init__(self):
         super().__init__(
@@ -26,6 +29,7 @@ class CreateBoardCommand(command.Command):
                 "repository_getter",
                 "uow",
                 "filter_builder",
+                "membership_cache",
             ],
             request_type=board_services.CreateBoardCommandRequest,
         )
@@ -37,6 +41,7 @@ class CreateBoardCommand(command.Command):
         )
         self.uow = self._deps["uow"]
         self.filter_builder = self._deps["filter_builder"]
+        self.membership_cache = self._deps["membership_cache"]
 
         self.logger.info("Executing CreateBoardCommand")
 
@@ -76,6 +81,7 @@ class CreateBoardCommand(command.Command):
                 logger=self.logger,
             )
             session.commit()
+        self.membership_cache.invalidate(new_entity_board.id)
 
         return command.CommandResponse(
             trace_id=current_request.trace_id,
@@ -119,7 +125,7 @@ class GetByIDBoardCommand(command.Command):
         if not board_id:
             raise ValueError("Board ID is required")
 
-        with self.uow.session() as session:
+        with self.uow.read_session() as session:
             repository_board = cast(
                 domain_repository.BoardRepository,
                 self.repository_getter(
@@ -128,19 +134,10 @@ class GetByIDBoardCommand(command.Command):
                 ),
             )
 
-            repository_ownership = cast(
-                domain_repository.OwnerShipBoardRepository,
-                self.repository_getter(
-                    repository=domain_repository.OwnerShipBoardRepository,
-                    session=session,
-                ),
-            )
-
             entity_board = board_services.get_myself_board_by_id(
                 board_id=board_id,
                 user_id=user_id,
                 repository_board=repository_board,
-                repository_ownership=repository_ownership,
             )
 
         return command.CommandResponse(
@@ -184,7 +181,7 @@ class ListBoardCommand(command.Command):
         if not self.request:
             raise ValueError("Request not found")
 
-        with self.uow.session() as session:
+        with self.uow.read_session() as session:
             repositor_view_board = cast(
                 domain_repository.DetailedBoardRepository,
                 self.repository_getter(
@@ -262,20 +259,11 @@ class UpdateBoardCommand(command.Command):
                     session=session,
                 ),
             )
-            repository_ownership = cast(
-                domain_repository.OwnerShipBoardRepository,
-                self.repository_getter(
-                    repository=domain_repository.OwnerShipBoardRepository,
-                    session=session,
-                ),
-            )
-
             update_entity_board = board_services.update_board(
                 payload=current_request,
                 user_id=user_id,
                 board_id=board_id,
                 repository_board=repository_board,
-                repository_ownership=repository_ownership,
                 logger=self.logger,
             )
             session.commit()
@@ -291,6 +279,7 @@ class DeleteBoardCommand(command.Command):
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
     filter_builder: FilterBuilder
+    membership_cache: MembershipCache
 
     def __init__(self):
         super().__init__(
@@ -299,6 +288,7 @@ class DeleteBoardCommand(command.Command):
                 "repository_getter",
                 "uow",
                 "filter_builder",
+                "membership_cache",
             ],
             request_type=command.CommandRequest,
         )
@@ -310,6 +300,7 @@ class DeleteBoardCommand(command.Command):
         )
         self.uow = self._deps["uow"]
         self.filter_builder = self._deps["filter_builder"]
+        self.membership_cache = self._deps["membership_cache"]
 
         self.logger.info("Executing UpdateBoardCommand")
 
@@ -335,22 +326,30 @@ class DeleteBoardCommand(command.Command):
                     session=session,
                 ),
             )
-            repository_ownership = cast(
-                domain_repository.OwnerShipBoardRepository,
+            repository_task = cast(
+                domain_repository.TaskRepository,
                 self.repository_getter(
-                    repository=domain_repository.OwnerShipBoardRepository,
+                    repository=domain_repository.TaskRepository,
+                    session=session,
+                ),
+            )
+            repository_history = cast(
+                domain_repository.TaskHistoryRepository,
+                self.repository_getter(
+                    repository=domain_repository.TaskHistoryRepository,
                     session=session,
                 ),
             )
-
             entity_board = board_services.delete_board(
                 user_id=user_id,
                 board_id=board_id,
                 repository_board=repository_board,
-                repository_ownership=repository_ownership,
+                repository_task=repository_task,
+                repository_task_history=repository_history,
                 logger=self.logger,
             )
             session.commit()
+        self.membership_cache.invalidate(board_id)
 
         return command.CommandResponse(
             trace_id=cast(command.CommandRequest, self.request).trace_id,
@@ -367,6 +366,7 @@ class AddMemberBoardCommand(command.Command):
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
     filter_builder: FilterBuilder
+    membership_cache: MembershipCache
 
     def __init__(self):
         super().__init__(
@@ -375,6 +375,7 @@ class AddMemberBoardCommand(command.Command):
                 "repository_getter",
                 "uow",
                 "filter_builder",
+                "membership_cache",
             ],
             request_type=AddMemberCommandRequest,
         )
@@ -386,6 +387,7 @@ class AddMemberBoardCommand(command.Command):
         )
         self.uow = self._deps["uow"]
         self.filter_builder = self._deps["filter_builder"]
+        self.membership_cache = self._deps["membership_cache"]
 
         self.logger.info("Executing AddMemberBoardCommand")
 
@@ -438,6 +440,7 @@ class AddMemberBoardCommand(command.Command):
                 logger=self.logger,
             )
             session.commit()
+        self.membership_cache.invalidate(board_id)
 
         return command.CommandResponse(
             trace_id=cast(command.CommandRequest, self.request).trace_id,
@@ -454,6 +457,7 @@ class RemoveMemberBoardCommand(command.Command):
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
     filter_builder: FilterBuilder
+    membership_cache: MembershipCache
 
     def __init__(self):
         super().__init__(
@@ -462,6 +466,7 @@ class RemoveMemberBoardCommand(command.Command):
                 "repository_getter",
                 "uow",
                 "filter_builder",
+                "membership_cache",
             ],
             request_type=RemoveMemberCommandRequest,
         )
@@ -473,6 +478,7 @@ class RemoveMemberBoardCommand(command.Command):
         )
         self.uow = self._deps["uow"]
         self.filter_builder = self._deps["filter_builder"]
+        self.membership_cache = self._deps["membership_cache"]
 
         self.logger.info("Executing RemoveMemberBoardCommand")
 
@@ -517,6 +523,7 @@ class RemoveMemberBoardCommand(command.Command):
                 logger=self.logger,
             )
             session.commit()
+        self.membership_cache.invalidate(board_id)
 
         return command.CommandResponse(
             trace_id=cast(command.CommandRequest, self.request).trace_id,
@@ -534,6 +541,7 @@ class UpdateRoleMemberBoardCommand(command.Command):
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
     filter_builder: FilterBuilder
+    membership_cache: MembershipCache
 
     def __init__(self):
         super().__init__(
@@ -542,6 +550,7 @@ class UpdateRoleMemberBoardCommand(command.Command):
                 "repository_getter",
                 "uow",
                 "filter_builder",
+                "membership_cache",
             ],
             request_type=UpdateRoleMemberCommandRequest,
         )
@@ -553,6 +562,7 @@ class UpdateRoleMemberBoardCommand(command.Command):
         )
         self.uow = self._deps["uow"]
         self.filter_builder = self._deps["filter_builder"]
+        self.membership_cache = self._deps["membership_cache"]
 
         self.logger.info("Executing UpdateRoleMemberBoardCommand")
 
@@ -598,6 +608,7 @@ class UpdateRoleMemberBoardCommand(command.Command):
                 logger=self.logger,
             )
             session.commit()
+        self.membership_cache.invalidate(board_id)
 
         return command.CommandResponse(
             trace_id=cast(command.CommandRequest, self.request).trace_id,
@@ -609,9 +620,11 @@ class UpdateRoleMemberBoardCommand(command.Command):
 
 
 class ListTaskCommand(command.Command):
+    blocking = False
+
     logger: log_model.LogAdapter
     repository_getter: repository_model.RepositoryGetter
-    uow: UOW
+    uow: AsyncUOW
     filter_builder: FilterBuilder
 
     def __init__(self):
@@ -619,7 +632,7 @@ class ListTaskCommand(command.Command):
             requirements=[
                 "logger",
                 "repository_getter",
-                "uow",
+                "async_uow",
                 "filter_builder",
             ],
             request_type=command.CommandRequest,
@@ -630,7 +643,7 @@ class ListTaskCommand(command.Command):
         self.repository_getter = cast(
             repository_model.RepositoryGetter, self._deps["repository_getter"]
         )
-        self.uow = self._deps["uow"]
+        self.uow = self._deps["async_uow"]
         self.filter_builder = self._deps["filter_builder"]
 
         if self.parameters.get("version") != "v1":
@@ -647,16 +660,16 @@ class ListTaskCommand(command.Command):
         if not self.request:
             raise ValueError("Request not found")
 
-        with self.uow.session() as session:
+        async with self.uow.read_session() as session:
             repository_task = cast(
-                domain_repository.TaskRepository,
+                domain_repository.AsyncTaskRepository,
                 self.repository_getter(
-                    repository=domain_repository.TaskRepository,
+                    repository=domain_repository.AsyncTaskRepository,
                     session=session,
                 ),
             )
 
-            entity_board = task_services.paginate_task_of_board(
+            entity_board = await task_services.paginate_task_of_board_async(
                 board_id=board_id,
                 query=cast(command.CommandQueryRequest, self.request),
                 repository_task=repository_task,
@@ -670,9 +683,11 @@ class ListTaskCommand(command.Command):
 
 
 class ListTasksCommand(command.Command):
+    blocking = False
+
     logger: log_model.LogAdapter
     repository_getter: repository_model.RepositoryGetter
-    uow: UOW
+    uow: AsyncUOW
     filter_builder: FilterBuilder
 
     def __init__(self):
@@ -680,7 +695,7 @@ class ListTasksCommand(command.Command):
             requirements=[
                 "logger",
                 "repository_getter",
-                "uow",
+                "async_uow",
                 "filter_builder",
             ],
             request_type=command.CommandRequest,
@@ -691,7 +706,7 @@ class ListTasksCommand(command.Command):
         self.repository_getter = cast(
             repository_model.RepositoryGetter, self._deps["repository_getter"]
         )
-        self.uow = self._deps["uow"]
+        self.uow = self._deps["async_uow"]
         self.filter_builder = self._deps["filter_builder"]
 
         if self.parameters.get("version") != "v1":
@@ -704,16 +719,16 @@ class ListTasksCommand(command.Command):
         if not self.request:
             raise ValueError("Request not found")
 
-        with self.uow.session() as session:
+        async with self.uow.read_session() as session:
             repository_task = cast(
-                domain_repository.TaskRepository,
+                domain_repository.AsyncTaskRepository,
                 self.repository_getter(
-                    repository=domain_repository.TaskRepository,
+                    repository=domain_repository.AsyncTaskRepository,
                     session=session,
                 ),
             )
 
-            entity_board = task_services.paginate_tasks(
+            entity_board = await task_services.paginate_tasks_async(
                 user_id=user_id,
                 query=cast(command.CommandQueryRequest, self.request),
                 repository_task=repository_task,
@@ -787,14 +802,6 @@ class CreateTaskCommand(command.Command):
                     session=session,
                 ),
             )
-            repository_ownership = cast(
-                domain_repository.OwnerShipBoardRepository,
-                self.repository_getter(
-                    repository=domain_repository.OwnerShipBoardRepository,
-                    session=session,
-                ),
-            )
-
             entity_task = task_services.create_task(
                 payload=cast(task_services.CreateTaskCommandRequest, self.request),
                 user_id=user_id,
@@ -802,7 +809,6 @@ class CreateTaskCommand(command.Command):
                 repository_task=repository_task,
                 repository_task_history=repository_history,
                 repository_board=repository_board,
-                repository_ownership=repository_ownership,
                 logger=self.logger,
             )
 
@@ -814,11 +820,10 @@ class CreateTaskCommand(command.Command):
         )
 
 
-class GetByIDTaskCommand(command.Command):
+class BatchTaskCommand(command.Command):
     logger: log_model.LogAdapter
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
-    filter_builder: FilterBuilder
 
     def __init__(self):
         super().__init__(
@@ -826,9 +831,8 @@ class GetByIDTaskCommand(command.Command):
                 "logger",
                 "repository_getter",
                 "uow",
-                "filter_builder",
             ],
-            request_type=command.CommandRequest,
+            request_type=task_services.BatchTaskCommandRequest,
         )
 
     async def execute(self) -> command.CommandResponse:
@@ -837,7 +841,6 @@ class GetByIDTaskCommand(command.Command):
             repository_model.RepositoryGetter, self._deps["repository_getter"]
         )
         self.uow = self._deps["uow"]
-        self.filter_builder = self._deps["filter_builder"]
 
         if self.parameters.get("version") != "v1":
             raise ValueError("Version not found")
@@ -846,9 +849,9 @@ class GetByIDTaskCommand(command.Command):
         if not user_id:
             raise ValueError("User not found")
 
-        task_id = self.parameters.get("id")
-        if not task_id:
-            raise ValueError("Task not found")
+        board_id = self.parameters.get("id")
+        if not board_id:
+            raise ValueError("Board not found")
 
         if not self.request:
             raise ValueError("Request not found")
@@ -868,12 +871,83 @@ class GetByIDTaskCommand(command.Command):
                     session=session,
                 ),
             )
+            repository_board = cast(
+                domain_repository.BoardRepository,
+                self.repository_getter(
+                    repository=domain_repository.BoardRepository,
+                    session=session,
+                ),
+            )
+            batch = task_services.batch_tasks(
+                payload=cast(task_services.BatchTaskCommandRequest, self.request),
+                user_id=user_id,
+                board_id=board_id,
+                logger=self.logger,
+                repository_task=repository_task,
+                repository_task_history=repository_history,
+                repository_board=repository_board,
+            )
+            session.commit()
+
+        return command.CommandResponse(
+            trace_id=cast(command.CommandRequest, self.request).trace_id,
+            payload=batch.model_dump(),
+        )
+
+
+class GetByIDTaskCommand(command.Command):
+    logger: log_model.LogAdapter
+    repository_getter: repository_model.RepositoryGetter
+    uow: UOW
+    configuration: settings.BaseSettings
+
+    def __init__(self):
+        super().__init__(
+            requirements=[
+                "logger",
+                "repository_getter",
+                "uow",
+                "configuration",
+            ],
+            request_type=command.CommandRequest,
+        )
+
+    async def execute(self) -> command.CommandResponse:
+        self.logger = self._deps["logger"]
+        self.repository_getter = cast(
+            repository_model.RepositoryGetter, self._deps["repository_getter"]
+        )
+        self.uow = self._deps["uow"]
+        self.configuration = self._deps["configuration"]
+
+        if self.parameters.get("version") != "v1":
+            raise ValueError("Version not found")
+
+        user_id = self.parameters.get("user")
+        if not user_id:
+            raise ValueError("User not found")
+
+        task_id = self.parameters.get("id")
+        if not task_id:
+            raise ValueError("Task not found")
+
+        if not self.request:
+            raise ValueError("Request not found")
+
+        with self.uow.read_session() as session:
+            repository_task = cast(
+                domain_repository.TaskRepository,
+                self.repository_getter(
+                    repository=domain_repository.TaskRepository,
+                    session=session,
+                ),
+            )
 
             entity_task = task_services.get_detailed_task_by_id(
                 id=task_id,
                 repository_task=repository_task,
-                repository_task_history=repository_history,
-                filter_builder=self.filter_builder,
+                last_histories=int(self.configuration.task_detail_histories_limit)
+                or None,
             )
 
         return command.CommandResponse(
@@ -887,6 +961,7 @@ class UpdateTaskCommand(command.Command):
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
     filter_builder: FilterBuilder
+    membership_cache: MembershipCache
 
     def __init__(self):
         super().__init__(
@@ -895,6 +970,7 @@ class UpdateTaskCommand(command.Command):
                 "repository_getter",
                 "uow",
                 "filter_builder",
+                "membership_cache",
             ],
             request_type=task_services.UpdateTaskCommandRequest,
         )
@@ -906,6 +982,7 @@ class UpdateTaskCommand(command.Command):
         )
         self.uow = self._deps["uow"]
         self.filter_builder = self._deps["filter_builder"]
+        self.membership_cache = self._deps["membership_cache"]
 
         if self.parameters.get("version") != "v1":
             raise ValueError("Version not found")
@@ -936,13 +1013,6 @@ class UpdateTaskCommand(command.Command):
                     session=session,
                 ),
             )
-            repository_board = cast(
-                domain_repository.BoardRepository,
-                self.repository_getter(
-                    repository=domain_repository.BoardRepository,
-                    session=session,
-                ),
-            )
             repository_ownership = cast(
                 domain_repository.OwnerShipBoardRepository,
                 self.repository_getter(
@@ -950,15 +1020,14 @@ class UpdateTaskCommand(command.Command):
                     session=session,
                 ),
             )
-
             entity_task = task_services.update_task(
                 id=task_id,
                 payload=cast(task_services.UpdateTaskCommandRequest, self.request),
                 user_id=user_id,
                 repository_task=repository_task,
                 repository_task_history=repository_history,
-                repository_board=repository_board,
                 repository_ownership=repository_ownership,
+                membership_cache=self.membership_cache,
                 logger=self.logger,
             )
 
@@ -975,6 +1044,7 @@ class DeleteTaskCommand(command.Command):
     repository_getter: repository_model.RepositoryGetter
     uow: UOW
     filter_builder: FilterBuilder
+    membership_cache: MembershipCache
 
     def __init__(self):
         super().__init__(
@@ -983,6 +1053,7 @@ class DeleteTaskCommand(command.Command):
                 "repository_getter",
                 "uow",
                 "filter_builder",
+                "membership_cache",
             ],
             request_type=command.CommandRequest,
         )
@@ -994,6 +1065,7 @@ class DeleteTaskCommand(command.Command):
         )
         self.uow = self._deps["uow"]
         self.filter_builder = self._deps["filter_builder"]
+        self.membership_cache = self._deps["membership_cache"]
 
         if self.parameters.get("version") != "v1":
             raise ValueError("Version not found")
@@ -1024,13 +1096,6 @@ class DeleteTaskCommand(command.Command):
                     session=session,
                 ),
             )
-            repository_board = cast(
-                domain_repository.BoardRepository,
-                self.repository_getter(
-                    repository=domain_repository.BoardRepository,
-                    session=session,
-                ),
-            )
             repository_ownership = cast(
                 domain_repository.OwnerShipBoardRepository,
                 self.repository_getter(
@@ -1038,14 +1103,13 @@ class DeleteTaskCommand(command.Command):
                     session=session,
                 ),
             )
-
             entity_task = task_services.delete_task(
                 id=task_id,
                 user_id=user_id,
                 repository_task=repository_task,
                 repository_task_history=repository_history,
-                repository_board=repository_board,
                 repository_ownership=repository_ownership,
+                membership_cache=self.membership_cache,
                 logger=self.logger,
             )
 
@@ -1,7 +1,7 @@
 import datetime
 import enum
 import uuid
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict
 
 import pydantic
 
@@ -22,6 +22,10 @@ class RoleMemberType(enum.StrEnum):
     VIEWER = enum.auto()
     ADMIN = enum.auto()
 
+    @property
+    def can_edit(self) -> bool:
+        return self in (RoleMemberType.EDITOR, RoleMemberType.ADMIN)
+
 
 class PriorityType(enum.StrEnum):
     LOW = enum.auto()
@@ -49,6 +53,8 @@ class Task(domain_repository.RepositoryData):
     icon_url: str | None = None
     owner_data: Dict[str, Any] | None = None
 
+    dirty_aliases: ClassVar[Dict[str, str]] = {"owner": "user_id"}
+
     def require_change(self, status: TaskStatus) -> bool:
         return status is not self.status
 
@@ -225,32 +231,58 @@ class Board(domain_repository.RepositoryData):
     tasks: list[Task] = pydantic.Field(default_factory=list)
     members: list[BoardMember] = pydantic.Field(default_factory=list)
 
+    # Lookups by user_id and task_id, built on first use and dropped when the
+    # lists are replaced, lists must change through the aggregate methods
+    _members_by_user_id: Dict[str, BoardMember] | None = pydantic.PrivateAttr(
+        default=None
+    )
+    _tasks_by_id: Dict[str, Task] | None = pydantic.PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "members":
+            self._members_by_user_id = None
+        elif name == "tasks":
+            self._tasks_by_id = None
+
+    def _member_index(self) -> Dict[str, BoardMember]:
+        if self._members_by_user_id is None:
+            self._members_by_user_id = {}
+            for member in self.members:
+                self._members_by_user_id.setdefault(member.user_id, member)
+        return self._members_by_user_id
+
+    def _task_index(self) -> Dict[str, Task]:
+        if self._tasks_by_id is None:
+            self._tasks_by_id = {}
+            for task in self.tasks:
+                self._tasks_by_id.setdefault(task.id, task)
+        return self._tasks_by_id
+
     def is_member(self, member: BoardMember) -> bool:
-        return any(
-            check_member.user_id == member.user_id for check_member in self.members
-        )
+        return member.user_id in self._member_index()
 
     def get_member_by_user_id(self, user_id: str) -> BoardMember:
-        for member in self.members:
-            if member.user_id == user_id:
-                return member
-        raise IsNotMemberofBoardError(f"Member {user_id} not found")
+        member = self._member_index().get(user_id)
+        if member is None:
+            raise IsNotMemberofBoardError(f"Member {user_id} not found")
+        return member
+
+    def has_task(self, task_id: str) -> bool:
+        return task_id in self._task_index()
 
     def get_task_by_id(self, task_id) -> Task:
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        raise ValueError(f"Task {task_id} not found")
+        task = self._task_index().get(task_id)
+        if task is None:
+            raise ValueError(f"Task {task_id} not found")
+        return task
 
     def is_editor(self, user_id: str) -> bool:
-        member = self.get_member_by_user_id(user_id=user_id)
-        allowed_roles = [RoleMemberType.EDITOR, RoleMemberType.ADMIN]
-        return member.role in allowed_roles
+        return self.get_member_by_user_id(user_id=user_id).role.can_edit
 
     def is_admin(self, user_id: str) -> bool:
-        if not self.is_member(BoardMember(user_id=user_id, board_id=self.id)):
-            return False
-        return self.get_member_by_user_id(user_id).role == RoleMemberType.ADMIN
+        member = self._member_index().get(user_id)
+        return member is not None and member.role == RoleMemberType.ADMIN
 
     def can_delete(self, user_id: str) -> bool:
         member = self.get_member_by_user_id(user_id=user_id)
@@ -274,7 +306,10 @@ class Board(domain_repository.RepositoryData):
     def add_task(self, task: Task, member_that_insert: str) -> None:
         if not self.is_editor(member_that_insert):
             raise IsNotEditorOfBoardError("Only Editor can add task")
+        if self.has_task(task.id):
+            raise ValueError(f"Task {task.id} already exists")
         self.tasks.append(task)
+        self._task_index()[task.id] = task
 
     def update_task(self, task: Task, member_that_update: str) -> None:
         if not self.is_editor(member_that_update):
@@ -285,7 +320,12 @@ class Board(domain_repository.RepositoryData):
             raise IsNotEditorOfBoardError("Only Editor can add task")
 
     def inject_member(self, member: BoardMember) -> None:
+        if self.is_member(member):
+            raise HasAlreadyIsMemberError(
+                f"Member {member.user_id} already in board {self.id}"
+            )
         self.members.append(member)
+        self._member_index()[member.user_id] = member
 
     def add_member(
         self,
@@ -300,6 +340,7 @@ class Board(domain_repository.RepositoryData):
                 f"Member {member.user_id} already in board {self.id}"
             )
         self.members.append(member)
+        self._member_index()[member.user_id] = member
 
     def remove_member(self, member: BoardMember, member_that_update: str) -> None:
         if not self.is_admin(member_that_update):
@@ -311,7 +352,10 @@ class Board(domain_repository.RepositoryData):
         if member.user_id == member_that_update:
             raise ValueError("I cannot remove myself")
 
-        self.members.remove(member)
+        self.members[:] = [
+            current for current in self.members if current.user_id != member.user_id
+        ]
+        self._members_by_user_id = None
 
     def update_role_member(
         self, member_that_update: str, member_id: str, role: RoleMemberType
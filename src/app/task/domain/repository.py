@@ -1,5 +1,5 @@
 import abc
-from typing import List
+from typing import Dict, List, Set
 
 from src.domain.models import filter as filter_domain
 from src.domain.models import mixin, repository
@@ -25,6 +25,12 @@ class BoardRepository(
     ) -> filter_domain.Paginator:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def get_aggregate_by_id(
+        self, id: str, with_tasks: bool = False
+    ) -> entity_domain.Board | None:
+        raise NotImplementedError()
+
 
 class TaskRepository(
     repository.Repository,
@@ -38,6 +44,33 @@ class TaskRepository(
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+    @abc.abstractmethod
+    def get_with_histories_by_id(
+        self, id: str, with_owner: bool = False, last_histories: int | None = None
+    ) -> entity_domain.Task | None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete_by_board_id(self, board_id: str) -> List[str]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def get_existing_ids(self, ids: List[str]) -> Set[str]:
+        raise NotImplementedError()
+
+
+class AsyncTaskRepository(
+    repository.Repository,
+    mixin.AsyncGetterMixin,
+    mixin.AsyncGetterListMixin,
+    mixin.AsyncCreatorMixin,
+    mixin.AsyncUpdaterMixin,
+    mixin.AsyncDeleterMixin,
+    abc.ABC,
+):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
 
 class TaskHistoryRepository(
     repository.Repository,
@@ -84,6 +117,12 @@ class OwnerShipBoardRepository(
     def get_by_board_id(self, board_id: str) -> List[OwnerShipRepositoryData]:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def get_roles_by_board_id(
+        self, board_id: str
+    ) -> Dict[str, entity_domain.RoleMemberType]:
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def delete_by_user_id_and_board_id(self, user_id: str, board_id: str) -> None:
         raise NotImplementedError()
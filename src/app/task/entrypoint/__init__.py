@@ -16,6 +16,7 @@ entrypoints: Dict[str, List[entrypoint_model.EntrypointModel]] = {
         http_task.UpdateRoleMemberBoardEntrypointHttp(),
         http_task.ListTaskEntrypointHttp(),
         http_task.CreateTaskEntrypointHttp(),
+        http_task.BatchTaskEntrypointHttp(),
         http_task.GetByIDTaskEntrypointHttp(),
         http_task.UpdateTaskEntrypointHttp(),
         http_task.DeleteTaskEntrypointHttp(),
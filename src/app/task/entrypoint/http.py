@@ -833,6 +833,108 @@ class CreateTaskEntrypointHttp(entrypoint_http.EntrypointHttp):
         )
 
 
+# Batch Task
+
+
+class BatchTaskEntrypointDocumentationHttp(
+    entrypoint_http.ExampleEntrypointDocumentationHttp
+):
+    def __init__(self):
+        super().__init__(
+            status_code=200,
+            description="V1 - Batch Task",
+            example_name="Batch Task",
+            content={
+                "trace_id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+                "payload": {
+                    "board_id": "board_id",
+                    "results": [
+                        {
+                            "index": 0,
+                            "operation": "status",
+                            "id": "1fa85f64-5717-4562-b3fc-2c963f66afa6",
+                            "success": True,
+                            "task": {
+                                "id": "1fa85f64-5717-4562-b3fc-2c963f66afa6",
+                                "deleted_at": None,
+                                "created_at": "2025-07-23T19:08:21.163963",
+                                "updated_at": "2025-07-23T19:08:21.163970",
+                                "is_activated": True,
+                                "name": "Context",
+                                "board_id": "board_id",
+                                "description": "Context",
+                                "owner": "user_id",
+                                "priority": "high",
+                                "histories": [
+                                    {
+                                        "id": "21bba247-6592-413e-972b-c90e6a46c8fa",
+                                        "deleted_at": None,
+                                        "created_at": "2025-07-23T19:08:21.163963",
+                                        "updated_at": "2025-07-23T19:08:21.163970",
+                                        "is_activated": True,
+                                        "task_id": (
+                                            "1fa85f64-5717-4562-b3fc-2c963f66afa6"
+                                        ),
+                                        "changed_at": "2025-07-23T19:08:26.248665",
+                                        "type_of_change": "updated",
+                                        "previous_values": {"status": "todo"},
+                                        "new_values": {"status": "doing"},
+                                    }
+                                ],
+                                "status": "doing",
+                                "icon_url": None,
+                                "owner_data": None,
+                            },
+                            "error": None,
+                        },
+                        {
+                            "index": 1,
+                            "operation": "delete",
+                            "id": "2fa85f64-5717-4562-b3fc-2c963f66afa6",
+                            "success": False,
+                            "task": None,
+                            "error": {
+                                "message": "Only Editor can add task",
+                                "type": "IsNotEditorOfBoardError",
+                            },
+                        },
+                    ],
+                },
+                "errors": [],
+            },
+        )
+
+
+class BatchTaskEntrypointHttpDocumentation(entrypoint_http.EntrypointHttpDocumentation):
+    def __init__(self):
+        super().__init__(
+            summary="Batch Task",
+            description="Create, update, change status and delete tasks of a board",
+            responses=[
+                entrypoint_http.VersionNotFoundEntrypointDocumentationHttp(),
+                BatchTaskEntrypointDocumentationHttp(),
+            ],
+            tags=["task"],
+        )
+
+
+class BatchTaskEntrypointHttp(entrypoint_http.EntrypointHttp):
+    def __init__(self):
+        super().__init__(
+            route="/{version}/boards/{id}/tasks:batch",
+            name="Batch Tasks",
+            status_code=200,
+            method=entrypoint_model.HttpStatusType.POST,
+            documentation=BatchTaskEntrypointHttpDocumentation(),
+            security=entrypoint_model.EntrypointSecurity(
+                require_security=True,
+                audiences=["task:batch"],
+            ),
+            cmd=task_commands.BatchTaskCommand(),
+            path_parameters=["version", "id", "user"],
+        )
+
+
 # Get By ID - Task Detailed
 
 
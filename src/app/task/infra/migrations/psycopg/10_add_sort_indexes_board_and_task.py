@@ -0,0 +1,28 @@
+from src.infra.migrator import model as migrator_model
+
+migrator_script = """
+CREATE INDEX IF NOT EXISTS idx_task_board_id_id
+ON tbl_task(board_id, id);
+CREATE INDEX IF NOT EXISTS idx_task_board_id_created_at
+ON tbl_task(board_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_task_board_id_priority
+ON tbl_task(board_id, priority, id);
+CREATE INDEX IF NOT EXISTS idx_board_created_at
+ON tbl_board(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_history_task_task_id_changed_at
+ON tbl_history_task(task_id, changed_at, id);
+"""
+
+rollback_script = """
+DROP INDEX IF EXISTS idx_history_task_task_id_changed_at;
+DROP INDEX IF EXISTS idx_board_created_at;
+DROP INDEX IF EXISTS idx_task_board_id_priority;
+DROP INDEX IF EXISTS idx_task_board_id_created_at;
+DROP INDEX IF EXISTS idx_task_board_id_id;
+"""
+
+
+migrator = migrator_model.Migrator(
+    up=migrator_script,
+    rollback=rollback_script,
+)
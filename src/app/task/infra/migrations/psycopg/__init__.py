@@ -12,4 +12,6 @@ migrations = [
     if file.name != "__init__.py" and file != "."
 ]
 
-migrations.sort(key=lambda migration: migration.name.split("_")[0] if migration else 0)
+migrations.sort(
+    key=lambda migration: int(migration.name.split("_")[0]) if migration else 0
+)
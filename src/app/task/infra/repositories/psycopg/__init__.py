@@ -7,7 +7,11 @@ from .board import (
     PostgresDetailedBoardRepository,
     PostgresOwnerShipBoardRepository,
 )
-from .task import PostgresHistoryTaskRepository, PostgresTaskRepository
+from .task import (
+    AsyncPostgresTaskRepository,
+    PostgresHistoryTaskRepository,
+    PostgresTaskRepository,
+)
 
 ConcreteRepository = TypeVar("ConcreteRepository", bound=Repository)
 repositories: List[Type[ConcreteRepository]] = [  # type: ignore
@@ -16,4 +20,5 @@ repositories: List[Type[ConcreteRepository]] = [  # type: ignore
     PostgresBoardRepository,
     PostgresOwnerShipBoardRepository,
     PostgresDetailedBoardRepository,
+    AsyncPostgresTaskRepository,
 ]  # type: ignore
@@ -1,13 +1,55 @@
-import datetime
-from typing import Any, List, cast
+from typing import Any, Dict, List, cast
 
 from src.app.task.domain import entity as entity_domain
 from src.app.task.domain import repository as domain_repository
 from src.app.task.domain import views as domain_views
+from src.domain.models import exceptions
 from src.domain.models import filter as filter_domain
 from src.domain.models import repository
 from src.infra.mixin import postgres
 
+from . import task as task_repository
+
+_BOARD_SORTABLE_FIELDS = ["id", "name", "created_at", "updated_at"]
+
+_AGGREGATE_BOARD_QUERY = """
+SELECT
+    b.id,
+    b.name,
+    b.description,
+    b.icon_url,
+    b.created_at,
+    b.updated_at,
+    b.deleted_at,
+    b.is_activated,
+    COALESCE((
+        SELECT jsonb_agg(
+            jsonb_build_array(ob.user_id, ob.board_id, ob.role)
+            ORDER BY ob.created_at, ob.id
+        )
+        FROM tbl_ownership_board ob
+        WHERE ob.board_id = b.id AND ob.is_activated = true
+    ), '[]'::jsonb) AS members,
+    {tasks} AS tasks
+FROM tbl_board b
+WHERE b.id = %s AND b.is_activated = true;
+"""
+
+_AGGREGATE_BOARD_TASKS = """
+COALESCE((
+    SELECT jsonb_agg(
+        jsonb_build_array(
+            t.id, t.user_id, t.name, t.description, t.status, t.icon_url,
+            t.is_activated, t.created_at, t.updated_at, t.deleted_at,
+            t.board_id, t.priority
+        )
+        ORDER BY t.created_at, t.id
+    )
+    FROM tbl_task t
+    WHERE t.board_id = b.id AND t.is_activated = true
+), '[]'::jsonb)
+"""
+
 
 class PostgresBoardRepository(
     postgres.PostgresGetterListMixin,
@@ -33,6 +75,7 @@ class PostgresBoardRepository(
                     "deleted_at",
                     "is_activated",
                 ],
+                sortable_fields=_BOARD_SORTABLE_FIELDS,
             )
         )
         super().__init__(*args, **kwargs)
@@ -61,6 +104,40 @@ class PostgresBoardRepository(
 
         return board
 
+    def get_aggregate_by_id(
+        self, id: str, with_tasks: bool = False
+    ) -> entity_domain.Board | None:
+        script = self._session.cached_query(
+            ("board_aggregate", with_tasks),
+            lambda: _AGGREGATE_BOARD_QUERY.format(
+                tasks=_AGGREGATE_BOARD_TASKS if with_tasks else "'[]'::jsonb"
+            ),
+        )
+        response = self._session.atomic_execute(
+            query=script, params=(id,), prepare=True
+        )
+        data = getattr(response, "fetchone", lambda: None)()
+        if not data:
+            return None
+
+        board = cast(entity_domain.Board, self.serialize(data))
+        board.created_at = data[4]
+        board.updated_at = data[5]
+        board.deleted_at = data[6]
+        board.is_activated = data[7]
+        board.members = [
+            entity_domain.BoardMember(user_id=user_id, board_id=board_id, role=role)
+            for user_id, board_id, role in data[8]
+        ]
+        board.tasks = [
+            cast(entity_domain.Task, task_repository._serialize_task(task))
+            for task in data[9]
+        ]
+        for task in board.tasks:
+            task.mark_clean()
+        board.mark_clean()
+        return board
+
     def serialize(self, data: Any) -> entity_domain.Board | None:
         if not data:
             return None
@@ -72,6 +149,14 @@ class PostgresBoardRepository(
         )
 
 
+_BOARD_ROLES_QUERY = """
+SELECT ob.user_id, ob.role
+FROM tbl_ownership_board ob
+    JOIN tbl_board b ON b.id = ob.board_id AND b.is_activated = true
+WHERE ob.board_id = %s AND ob.is_activated = true;
+"""
+
+
 class PostgresOwnerShipBoardRepository(
     postgres.PostgresGetterListMixin,
     postgres.PostgresGetterMixin,
@@ -95,6 +180,7 @@ class PostgresOwnerShipBoardRepository(
                     "deleted_at",
                     "is_activated",
                 ],
+                sortable_fields=["id", "role", "created_at"],
             )
         )
         super().__init__(*args, **kwargs)
@@ -153,70 +239,45 @@ class PostgresOwnerShipBoardRepository(
             List[domain_repository.OwnerShipRepositoryData], response_filter.elements
         )
 
-    def delete_by_user_id_and_board_id(self, user_id: str, board_id: str) -> None:
-        filter_builder_eq = self._filter_builder.build(
-            type_filter=filter_domain.FilterType.EQUAL
+    def get_roles_by_board_id(
+        self, board_id: str
+    ) -> Dict[str, entity_domain.RoleMemberType]:
+        response = self._session.atomic_execute(
+            query=_BOARD_ROLES_QUERY, params=(board_id,), prepare=True
         )
+        return {
+            user_id: entity_domain.RoleMemberType(role)
+            for user_id, role in getattr(response, "fetchall", lambda: [])()
+        }
 
-        order_filter_builder_asc = self._filter_builder.build_order(
-            type_order=filter_domain.OrderType.ASC
+    def _membership_criteria(
+        self, user_id: str, board_id: str
+    ) -> filter_domain.Criteria:
+        filter_builder_eq = self._filter_builder.build(
+            type_filter=filter_domain.FilterType.EQUAL
         )
-
-        criteria_filter = filter_domain.Criteria(
+        return filter_domain.Criteria(
             filters=[
                 filter_builder_eq("user_id")(user_id),
                 filter_builder_eq("board_id")(board_id),
                 filter_builder_eq("is_activated")(True),
             ],
             page_number=1,
-            page_quantity=200,
-            order_by=[order_filter_builder_asc("id")],
+            page_quantity=1,
+            order_by=[],
         )
 
-        response_filter = self.filter(criteria=criteria_filter)
-        if response_filter.total == 0:
-            return None
-
-        response_filter.elements[0].is_activated = False
-        response_filter.elements[0].deleted_at = datetime.datetime.now()
-
-        self.update(
-            id=response_filter.elements[0].id, to_update=response_filter.elements[0]
-        )
-        return None
+    def delete_by_user_id_and_board_id(self, user_id: str, board_id: str) -> None:
+        self.delete_where(criteria=self._membership_criteria(user_id, board_id))
 
     def update_role_by_user_id_and_board_id(
         self, user_id: str, board_id: str, to_update: entity_domain.RoleMemberType
     ) -> None:
-        filter_builder_eq = self._filter_builder.build(
-            type_filter=filter_domain.FilterType.EQUAL
-        )
-
-        order_filter_builder_asc = self._filter_builder.build_order(
-            type_order=filter_domain.OrderType.ASC
-        )
-
-        criteria_filter = filter_domain.Criteria(
-            filters=[
-                filter_builder_eq("user_id")(user_id),
-                filter_builder_eq("board_id")(board_id),
-                filter_builder_eq("is_activated")(True),
-            ],
-            page_number=1,
-            page_quantity=200,
-            order_by=[order_filter_builder_asc("id")],
+        self.update_where(
+            criteria=self._membership_criteria(user_id, board_id),
+            changes={"role": to_update},
         )
 
-        response_filter = self.filter(criteria=criteria_filter)
-        if response_filter.total == 0:
-            return None
-
-        updater = response_filter.elements[0]
-        updater.role = to_update
-
-        self.update(id=response_filter.elements[0].id, to_update=updater)
-        return None
-
     def serialize(self, data: Any) -> domain_repository.OwnerShipRepositoryData | None:
         if not data:
             return None
@@ -240,7 +301,6 @@ user_accessible_boards AS (
         SELECT DISTINCT board_id
         FROM tbl_ownership_board
         WHERE user_id = %s AND tbl_ownership_board.is_activated = TRUE
-        {limits}
 ),
 task_status_counts AS (
         SELECT t.board_id,
@@ -297,6 +357,8 @@ FROM {table} b
     LEFT JOIN board_member_details bm ON b.id = bm.board_id
     LEFT JOIN board_task_metrics btm ON b.id = btm.board_id
 {filters}
+{orders}
+{limits}
 ;
 """
 
@@ -331,6 +393,7 @@ class PostgresDetailedBoardRepository(
                     "deleted_at",
                     "is_activated",
                 ],
+                sortable_fields=_BOARD_SORTABLE_FIELDS,
             )
         )
         super().__init__(*args, **kwargs)
@@ -340,6 +403,9 @@ class PostgresDetailedBoardRepository(
     def filter_by_user_id(
         self, user_id: str, criteria: filter_domain.Criteria
     ) -> filter_domain.Paginator:
+        if criteria.cursor is not None:
+            raise exceptions.BadRequestError("Cursor pagination not supported")
+
         criteria.update_table("b")
         criteria.append(
             self._filter_builder.build(type_filter=filter_domain.FilterType.EQUAL)(
@@ -354,44 +420,69 @@ class PostgresDetailedBoardRepository(
             current_filters = ""
         current_joins = ""
 
-        script = self.custom_query.query.format(
-            "{}",
-            table=self.repository_persistence.table_name,
-            attributes="b.*" + _ATTRIBUTES_DETAILED,
-            joins=current_joins,
-            filters=current_filters,
-            limits="LIMIT {limit} OFFSET {offset}".format(
-                limit=str(criteria.page_quantity or 30),
-                offset=str((criteria.page_number or 1) - 1),
-            ),
+        attributes = "b.*" + _ATTRIBUTES_DETAILED
+        if self.custom_query.with_window_count:
+            attributes += ", " + self.custom_query.window_count_attributes
+
+        orders = ", ".join(
+            order.to_definition()
+            for order in self._sort_key(criteria.order_by, table_alias="b")
         )
-        count_script = self.custom_query.query.format(
+
+        script = self.custom_query.query.format(
             "{}",
             table=self.repository_persistence.table_name,
-            attributes="count(b.*)",
+            attributes=attributes,
             joins=current_joins,
             filters=current_filters,
-            limits="",
+            orders=f"ORDER BY {orders}",
+            limits="LIMIT %s OFFSET %s",
         )
 
         self.logger.info(f"Query [{script}]")
-        self.logger.info(f"Count Query [{count_script}]")
 
         filter_for_user_id = self._filter_builder.build(
             type_filter=filter_domain.FilterType.EQUAL
         )("tbl_ownership_board.user_id")(user_id)
 
-        inject = self._create_params_filter(
-            filters=criteria.filters, pre_filters=[filter_for_user_id]
+        inject = (
+            self._create_params_filter(
+                filters=criteria.filters, pre_filters=[filter_for_user_id]
+            )
+            or tuple()
         )
+        criteria.page_quantity = criteria.page_quantity or 30
+        page_quantity = criteria.page_quantity
+        page_offset = criteria.offset
 
-        response_count = self._session.atomic_execute(query=count_script, params=inject)
-        count = getattr(response_count, "fetchone", lambda: [None])()
-
-        response = self._session.atomic_execute(query=script, params=inject)
+        response = self._session.atomic_execute(
+            query=script, params=(*inject, page_quantity, page_offset)
+        )
         elements = cast(List[Any], getattr(response, "fetchall", lambda: [])())
 
-        total = int(count[0] or 0)
+        total: int | None = None
+        if self.custom_query.with_window_count:
+            total = int(elements[0][-1]) if elements else None
+            elements = [record[:-1] for record in elements]
+            if total is None and page_offset == 0:
+                total = 0
+
+        if total is None:
+            count_script = self.custom_query.query.format(
+                "{}",
+                table=self.repository_persistence.table_name,
+                attributes="count(b.*)",
+                joins=current_joins,
+                filters=current_filters,
+                orders="",
+                limits="",
+            )
+            self.logger.info(f"Count Query [{count_script}]")
+            response_count = self._session.atomic_execute(
+                query=count_script, params=inject
+            )
+            count = getattr(response_count, "fetchone", lambda: [None])()
+            total = int(count[0] or 0)
 
         return filter_domain.Paginator(
             total=total,
@@ -1,4 +1,4 @@
-from typing import Any, List, cast
+from typing import Any, List, Set, cast
 
 from src.app.task.domain import entity as entity_domain
 from src.app.task.domain import repository as domain_repository
@@ -6,6 +6,105 @@ from src.domain.models import filter as filter_domain
 from src.domain.models import repository
 from src.infra.mixin import postgres
 
+_TASK_FIELDS = [
+    "id",
+    "board_id",
+    "name",
+    "description",
+    "user_id",
+    "status",
+    "icon_url",
+    "priority",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+    "is_activated",
+]
+_TASK_SORTABLE_FIELDS = [
+    "id",
+    "name",
+    "status",
+    "priority",
+    "created_at",
+    "updated_at",
+]
+
+_TASK_WITH_HISTORIES_QUERY = """
+SELECT
+    {attributes},
+    COALESCE((
+        SELECT jsonb_agg(
+            jsonb_build_array(
+                h.id, h.task_id, h.changed_at, h.type_of_change, h.previous_values,
+                h.new_values, h.is_activated, h.created_at, h.updated_at, h.deleted_at
+            )
+            ORDER BY h.changed_at, h.id
+        )
+        FROM (
+            SELECT * FROM tbl_history_task
+            WHERE task_id = tbl_task.id AND is_activated = true
+            ORDER BY changed_at DESC, id DESC
+            LIMIT %s
+        ) h
+    ), '[]'::jsonb) AS histories
+FROM tbl_task {joins}
+WHERE tbl_task.id = %s AND tbl_task.is_activated = true;
+"""
+
+_EXISTING_TASK_IDS_QUERY = "SELECT id FROM tbl_task WHERE id = ANY(%s);"
+
+_TASK_OWNER_JOINS = """
+INNER JOIN tbl_user ON (tbl_task.user_id = tbl_user.id)
+INNER JOIN tbl_profile ON (tbl_user.id = tbl_profile.user_id)
+"""
+
+
+def _serialize_history(data: Any) -> entity_domain.TaskHistory | None:
+    if not data:
+        return None
+    return entity_domain.TaskHistory(
+        id=data[0],
+        task_id=data[1],
+        changed_at=data[2],
+        type_of_change=data[3],
+        previous_values=data[4],
+        new_values=data[5],
+        is_activated=data[6],
+        created_at=data[7],
+        updated_at=data[8],
+        deleted_at=data[9],
+    )
+
+
+def _serialize_task(data: Any) -> entity_domain.Task | None:
+    if not data:
+        return None
+
+    owner_data = {}
+    if len(data) > 12:
+        owner_data = {
+            "user_id": data[12],
+            "username": data[15],
+            "icon_id": data[25],
+            "full_name": data[13] + " " + data[14],
+        }
+
+    return entity_domain.Task(
+        id=data[0],
+        owner=data[1],
+        name=data[2],
+        description=data[3],
+        status=data[4],
+        icon_url=data[5],
+        is_activated=data[6],
+        created_at=data[7],
+        updated_at=data[8],
+        deleted_at=data[9],
+        board_id=data[10],
+        priority=entity_domain.PriorityType(data[11]),
+        owner_data=owner_data,
+    )
+
 
 class PostgresTaskRepository(
     postgres.PostgresGetterListMixin,
@@ -20,52 +119,94 @@ class PostgresTaskRepository(
         kwargs["repository_persistence"] = kwargs["persistency"] = (
             repository.RepositoryPersistence(
                 table_name=self.table_name,
-                fields=[
-                    "id",
-                    "board_id",
-                    "name",
-                    "description",
-                    "user_id",
-                    "status",
-                    "icon_url",
-                    "priority",
-                    "created_at",
-                    "updated_at",
-                    "deleted_at",
-                    "is_activated",
-                ],
+                fields=_TASK_FIELDS,
+                sortable_fields=_TASK_SORTABLE_FIELDS,
             )
         )
         super().__init__(*args, **kwargs)
 
-    def serialize(self, data: Any) -> entity_domain.Task | None:
+    def get_with_histories_by_id(
+        self, id: str, with_owner: bool = False, last_histories: int | None = None
+    ) -> entity_domain.Task | None:
+        script = self._session.cached_query(
+            ("task_with_histories", with_owner),
+            lambda: _TASK_WITH_HISTORIES_QUERY.format(
+                attributes=(
+                    "tbl_task.*, tbl_user.*, tbl_profile.*"
+                    if with_owner
+                    else "tbl_task.*"
+                ),
+                joins=_TASK_OWNER_JOINS if with_owner else "",
+            ),
+        )
+        response = self._session.atomic_execute(
+            query=script, params=(last_histories, id), prepare=True
+        )
+        data = getattr(response, "fetchone", lambda: None)()
         if not data:
             return None
 
-        owner_data = {}
-        if len(data) > 12:
-            owner_data = {
-                "user_id": data[12],
-                "username": data[15],
-                "icon_id": data[25],
-                "full_name": data[13] + " " + data[14],
-            }
-
-        return entity_domain.Task(
-            id=data[0],
-            owner=data[1],
-            name=data[2],
-            description=data[3],
-            status=data[4],
-            icon_url=data[5],
-            is_activated=data[6],
-            created_at=data[7],
-            updated_at=data[8],
-            deleted_at=data[9],
-            board_id=data[10],
-            priority=entity_domain.PriorityType(data[11]),
-            owner_data=owner_data,
+        task = cast(entity_domain.Task, _serialize_task(data[:-1]))
+        for history in data[-1]:
+            task.inject_history(
+                history=cast(entity_domain.TaskHistory, _serialize_history(history))
+            )
+        task.mark_clean()
+        return task
+
+    def delete_by_board_id(self, board_id: str) -> List[str]:
+        filter_builder_eq = self._filter_builder.build(
+            type_filter=filter_domain.FilterType.EQUAL
+        )
+        return self.delete_where(
+            criteria=filter_domain.Criteria(
+                filters=[
+                    filter_builder_eq("board_id")(board_id),
+                    filter_builder_eq("is_activated")(True),
+                ],
+                page_number=1,
+                page_quantity=1,
+                order_by=[],
+            )
+        )
+
+    def get_existing_ids(self, ids: List[str]) -> Set[str]:
+        if not ids:
+            return set()
+        script = self._session.cached_query(
+            ("task_existing_ids",), lambda: _EXISTING_TASK_IDS_QUERY
+        )
+        self.logger.info(f"Query [{script}]")
+        response = self._session.atomic_execute(
+            query=script, params=(ids,), prepare=True
         )
+        return {row[0] for row in getattr(response, "fetchall", lambda: [])()}
+
+    def serialize(self, data: Any) -> entity_domain.Task | None:
+        return _serialize_task(data)
+
+
+class AsyncPostgresTaskRepository(
+    postgres.AsyncPostgresGetterListMixin,
+    postgres.AsyncPostgresGetterMixin,
+    postgres.AsyncPostgresCreatorMixin,
+    postgres.AsyncPostgresUpdaterMixin,
+    postgres.AsyncPostgresDeleterMixin,
+    domain_repository.AsyncTaskRepository,
+):
+    def __init__(self, *args, **kwargs) -> None:
+        self.table_name = "tbl_task"
+        kwargs["repository_persistence"] = kwargs["persistency"] = (
+            repository.RepositoryPersistence(
+                table_name=self.table_name,
+                fields=_TASK_FIELDS,
+                sortable_fields=_TASK_SORTABLE_FIELDS,
+            )
+        )
+        super().__init__(*args, **kwargs)
+
+    def serialize(self, data: Any) -> entity_domain.Task | None:
+        return _serialize_task(data)
 
 
 class PostgresHistoryTaskRepository(
@@ -93,6 +234,7 @@ class PostgresHistoryTaskRepository(
                     "deleted_at",
                     "is_activated",
                 ],
+                sortable_fields=["id", "changed_at", "created_at"],
             )
         )
         super().__init__(*args, **kwargs)
@@ -120,17 +262,4 @@ class PostgresHistoryTaskRepository(
         return cast(List[entity_domain.TaskHistory], response_filter.elements)
 
     def serialize(self, data: Any) -> entity_domain.TaskHistory | None:
-        if not data:
-            return None
-        return entity_domain.TaskHistory(
-            id=data[0],
-            task_id=data[1],
-            changed_at=data[2],
-            type_of_change=data[3],
-            previous_values=data[4],
-            new_values=data[5],
-            is_activated=data[6],
-            created_at=data[7],
-            updated_at=data[8],
-            deleted_at=data[9],
-        )
+        return _serialize_history(data)
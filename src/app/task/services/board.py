@@ -1,15 +1,17 @@
+import datetime
 import uuid
-from typing import cast
+from typing import Dict, cast
 
 from src.app.security import domain as domain_security
 from src.app.shared.services import common as common_service
 from src.app.shared.services import user as user_service
 from src.app.task.domain import entity as entity_domain
 from src.app.task.domain import repository as domain_repository
+from src.domain.models import entity as domain_entity
 from src.domain.models import filter as filter_domain
-from src.domain.models import repository as repository_model
 from src.domain.services import command
 from src.infra.log import model as log_model
+from src.infra.membership_cache import model as membership_cache_model
 
 
 class UpdateBoardCommandRequest(command.CommandRequest):
@@ -25,39 +27,51 @@ class CreateBoardCommandRequest(UpdateBoardCommandRequest):
 def get_board_by_id(
     id: str,
     repository_board: domain_repository.BoardRepository,
-    repository_ownership: domain_repository.OwnerShipBoardRepository,
+    with_tasks: bool = False,
 ) -> entity_domain.Board | None:
-    try:
-        board = cast(entity_domain.Board, repository_board.get_by_id(id=id))
-        owners = repository_ownership.get_by_board_id(
-            board_id=id,
-        )
-        if not board:
-            raise repository_model.RepositoryNotFoundError()
-        for ownership in owners:
-            board.inject_member(
-                member=entity_domain.BoardMember(
-                    user_id=ownership.user_id,
-                    board_id=ownership.board_id,
-                    role=ownership.role,
-                )
-            )
-        return cast(entity_domain.Board | None, board)
-    except repository_model.RepositoryNotFoundError:
-        return None
+    return repository_board.get_aggregate_by_id(id=id, with_tasks=with_tasks)
+
+
+def get_board_roles(
+    board_id: str,
+    repository_ownership: domain_repository.OwnerShipBoardRepository,
+    membership_cache: membership_cache_model.MembershipCache,
+) -> Dict[str, str]:
+    roles = membership_cache.get(board_id)
+    if roles is None:
+        version = membership_cache.version(board_id)
+        roles = repository_ownership.get_roles_by_board_id(board_id=board_id)
+        membership_cache.set(board_id, roles, version=version)
+    return roles
+
+
+def ensure_editor_of_board(
+    board_id: str,
+    user_id: str,
+    repository_ownership: domain_repository.OwnerShipBoardRepository,
+    membership_cache: membership_cache_model.MembershipCache,
+) -> None:
+    roles = get_board_roles(
+        board_id=board_id,
+        repository_ownership=repository_ownership,
+        membership_cache=membership_cache,
+    )
+    if not roles:
+        raise ValueError("Board not found")
+
+    role = roles.get(user_id)
+    if role is None:
+        raise entity_domain.IsNotMemberofBoardError(f"Member {user_id} not found")
+    if not entity_domain.RoleMemberType(role).can_edit:
+        raise entity_domain.IsNotEditorOfBoardError("Only Editor can add task")
 
 
 def get_myself_board_by_id(
     user_id: str,
     board_id: str,
     repository_board: domain_repository.BoardRepository,
-    repository_ownership: domain_repository.OwnerShipBoardRepository,
 ) -> entity_domain.Board | None:
-    board = get_board_by_id(
-        id=board_id,
-        repository_board=repository_board,
-        repository_ownership=repository_ownership,
-    )
+    board = get_board_by_id(id=board_id, repository_board=repository_board)
     if not board or not board.is_member(
         member=entity_domain.BoardMember(
             user_id=user_id, board_id=board_id, role=entity_domain.RoleMemberType.VIEWER
@@ -89,7 +103,6 @@ def create_board(
 ) -> entity_domain.Board:
     entity_board_domain = get_board_by_id(
         repository_board=repository_board,
-        repository_ownership=repository_ownership,
         id=cast(str, payload.id),
     )
     if entity_board_domain:
@@ -105,15 +118,17 @@ def create_board(
     )
 
     repository_board.create(new=new_entity_board)
-    for member in new_entity_board.members:
-        repository_ownership.create(
-            new=domain_repository.OwnerShipRepositoryData(
+    repository_ownership.create_many(
+        entities=[
+            domain_repository.OwnerShipRepositoryData(
                 id=str(uuid.uuid4()),
                 board_id=new_entity_board.id,
                 user_id=member.user_id,
                 role=member.role,
             )
-        )
+            for member in new_entity_board.members
+        ]
+    )
 
     return new_entity_board
 
@@ -123,12 +138,10 @@ def update_board(
     user_id: str,
     board_id: str,
     repository_board: domain_repository.BoardRepository,
-    repository_ownership: domain_repository.OwnerShipBoardRepository,
     logger: log_model.LogAdapter,
 ) -> entity_domain.Board:
     entity_board_domain = get_board_by_id(
         repository_board=repository_board,
-        repository_ownership=repository_ownership,
         id=board_id,
     )
     if not entity_board_domain:
@@ -153,12 +166,12 @@ def delete_board(
     board_id: str,
     user_id: str,
     repository_board: domain_repository.BoardRepository,
-    repository_ownership: domain_repository.OwnerShipBoardRepository,
+    repository_task: domain_repository.TaskRepository,
+    repository_task_history: domain_repository.TaskHistoryRepository,
     logger: log_model.LogAdapter,
 ) -> entity_domain.Board:
     entity_board_domain = get_board_by_id(
         repository_board=repository_board,
-        repository_ownership=repository_ownership,
         id=board_id,
     )
 
@@ -170,6 +183,20 @@ def delete_board(
 
     repository_board.delete(id=board_id)
 
+    deleted_at = datetime.datetime.now()
+    repository_task_history.create_many(
+        entities=[
+            entity_domain.TaskHistory(
+                id=str(uuid.uuid4()),
+                task_id=task_id,
+                type_of_change=domain_entity.HistoryChangeType.DELETED,
+                new_values={},
+                changed_at=deleted_at,
+            )
+            for task_id in repository_task.delete_by_board_id(board_id=board_id)
+        ]
+    )
+
     return entity_board_domain
 
 
@@ -184,7 +211,6 @@ def add_member_to_board(
 ) -> entity_domain.Board:
     entity_board_domain = get_board_by_id(
         repository_board=repository_board,
-        repository_ownership=repository_ownership,
         id=board_id,
     )
 
@@ -226,7 +252,6 @@ def remove_member_to_board(
 ) -> entity_domain.Board:
     entity_board_domain = get_board_by_id(
         repository_board=repository_board,
-        repository_ownership=repository_ownership,
         id=board_id,
     )
 
@@ -258,7 +283,6 @@ def update_role_in_member(
 ) -> entity_domain.Board:
     entity_board_domain = get_board_by_id(
         repository_board=repository_board,
-        repository_ownership=repository_ownership,
         id=board_id,
     )
 
@@ -1,12 +1,17 @@
-from typing import List, cast
+import enum
+import uuid
+from typing import Dict, List, Set, cast
+
+import pydantic
 
 from src.app.shared.services import common as common_service
 from src.app.task.domain import entity as entity_domain
 from src.app.task.domain import repository as domain_repository
+from src.domain.models import exceptions as domain_exceptions
 from src.domain.models import filter as filter_domain
-from src.domain.models import repository as repository_model
 from src.domain.services import command
 from src.infra.log import model as log_model
+from src.infra.membership_cache import model as membership_cache_model
 
 from . import board as services_board
 
@@ -21,30 +26,32 @@ def get_histories_by_task_id(
 def get_task_by_id(
     id: str,
     repository_task: domain_repository.TaskRepository,
-    repository_task_history: domain_repository.TaskHistoryRepository,
+    last_histories: int | None = None,
 ) -> entity_domain.Task | None:
-    try:
-        task = cast(entity_domain.Task, repository_task.get_by_id(id=id))
-        histories = get_histories_by_task_id(
-            task_id=id, repository_task_history=repository_task_history
-        )
-        if not task:
-            raise repository_model.RepositoryNotFoundError(
-                f"Not Found Task With ID {id}"
-            )
-        for history in histories:
-            task.inject_history(history=history)
-        return cast(entity_domain.Task | None, task)
-    except repository_model.RepositoryNotFoundError:
-        return None
+    return repository_task.get_with_histories_by_id(
+        id=id, last_histories=last_histories
+    )
 
 
-def paginate_task_of_board(
+def _task_with_owner_joins() -> List[filter_domain.Join]:
+    join_with_user = filter_domain.Join(
+        table="tbl_user",
+        on="tbl_task.user_id = tbl_user.id",
+        join_type=filter_domain.JoinType.INNER,
+    )
+    join_user_with_profile = filter_domain.Join(
+        table="tbl_profile",
+        on="tbl_user.id = tbl_profile.user_id",
+        join_type=filter_domain.JoinType.INNER,
+    )
+    return [join_with_user, join_user_with_profile]
+
+
+def _criteria_task_of_board(
     board_id: str,
     query: command.CommandQueryRequest,
-    repository_task: domain_repository.TaskRepository,
     filter_builder: filter_domain.FilterBuilder,
-) -> filter_domain.Paginator:
+) -> filter_domain.Criteria:
     eq_filter = filter_builder.build(type_filter=filter_domain.FilterType.EQUAL)
     no_eq_filter = filter_builder.build(type_filter=filter_domain.FilterType.NOT_EQUAL)
 
@@ -61,28 +68,14 @@ def paginate_task_of_board(
     for filter in cast(List[filter_domain.Filter], criteria_task.filters):
         filter.update_table("tbl_task")
 
-    join_with_user = filter_domain.Join(
-        table="tbl_user",
-        on="tbl_task.user_id = tbl_user.id",
-        join_type=filter_domain.JoinType.INNER,
-    )
-    join_user_with_profile = filter_domain.Join(
-        table="tbl_profile",
-        on="tbl_user.id = tbl_profile.user_id",
-        join_type=filter_domain.JoinType.INNER,
-    )
-
-    return repository_task.filter(
-        criteria=criteria_task, joins=[join_with_user, join_user_with_profile]
-    )
+    return criteria_task
 
 
-def paginate_tasks(
+def _criteria_tasks(
     user_id: str,
     query: command.CommandQueryRequest,
-    repository_task: domain_repository.TaskRepository,
     filter_builder: filter_domain.FilterBuilder,
-) -> filter_domain.Paginator:
+) -> filter_domain.Criteria:
     eq_filter = filter_builder.build(type_filter=filter_domain.FilterType.EQUAL)
     no_eq_filter = filter_builder.build(type_filter=filter_domain.FilterType.NOT_EQUAL)
 
@@ -100,71 +93,68 @@ def paginate_tasks(
     is_user_eq_filter = eq_filter("tbl_user.id")(user_id)
     criteria_task.append(is_user_eq_filter)
 
-    join_with_user = filter_domain.Join(
-        table="tbl_user",
-        on="tbl_task.user_id = tbl_user.id",
-        join_type=filter_domain.JoinType.INNER,
-    )
-    join_user_with_profile = filter_domain.Join(
-        table="tbl_profile",
-        on="tbl_user.id = tbl_profile.user_id",
-        join_type=filter_domain.JoinType.INNER,
-    )
+    return criteria_task
 
-    return repository_task.filter(
-        criteria=criteria_task, joins=[join_with_user, join_user_with_profile]
-    )
 
-
-def get_detailed_task_by_id(
-    id: str,
+def paginate_task_of_board(
+    board_id: str,
+    query: command.CommandQueryRequest,
     repository_task: domain_repository.TaskRepository,
-    repository_task_history: domain_repository.TaskHistoryRepository,
     filter_builder: filter_domain.FilterBuilder,
-) -> entity_domain.Task | None:
-    eq_filter = filter_builder.build(type_filter=filter_domain.FilterType.EQUAL)
-    order_by_id = filter_builder.build_order(type_order=filter_domain.OrderType.ASC)(
-        "id"
+) -> filter_domain.Paginator:
+    return repository_task.filter(
+        criteria=_criteria_task_of_board(board_id, query, filter_builder),
+        joins=_task_with_owner_joins(),
     )
 
-    user_id_eq_filter = eq_filter("id")(id)
-    is_activated_eq_filter = eq_filter("is_activated")(True)
 
-    criteria_task = filter_domain.Criteria(
-        filters=[user_id_eq_filter, is_activated_eq_filter],
-        order_by=[order_by_id],
-        page_quantity=30,
-        page_number=1,
+async def paginate_task_of_board_async(
+    board_id: str,
+    query: command.CommandQueryRequest,
+    repository_task: domain_repository.AsyncTaskRepository,
+    filter_builder: filter_domain.FilterBuilder,
+) -> filter_domain.Paginator:
+    return await repository_task.filter(
+        criteria=_criteria_task_of_board(board_id, query, filter_builder),
+        joins=_task_with_owner_joins(),
     )
 
-    for filter in cast(List[filter_domain.Filter], criteria_task.filters):
-        filter.update_table("tbl_task")
 
-    join_with_user = filter_domain.Join(
-        table="tbl_user",
-        on="tbl_task.user_id = tbl_user.id",
-        join_type=filter_domain.JoinType.INNER,
-    )
-    join_user_with_profile = filter_domain.Join(
-        table="tbl_profile",
-        on="tbl_user.id = tbl_profile.user_id",
-        join_type=filter_domain.JoinType.INNER,
+def paginate_tasks(
+    user_id: str,
+    query: command.CommandQueryRequest,
+    repository_task: domain_repository.TaskRepository,
+    filter_builder: filter_domain.FilterBuilder,
+) -> filter_domain.Paginator:
+    return repository_task.filter(
+        criteria=_criteria_tasks(user_id, query, filter_builder),
+        joins=_task_with_owner_joins(),
     )
 
-    task_paginator = repository_task.filter(
-        criteria=criteria_task, joins=[join_with_user, join_user_with_profile]
+
+async def paginate_tasks_async(
+    user_id: str,
+    query: command.CommandQueryRequest,
+    repository_task: domain_repository.AsyncTaskRepository,
+    filter_builder: filter_domain.FilterBuilder,
+) -> filter_domain.Paginator:
+    return await repository_task.filter(
+        criteria=_criteria_tasks(user_id, query, filter_builder),
+        joins=_task_with_owner_joins(),
     )
 
-    if task_paginator.total == 0:
-        raise ValueError("Task not found")
 
-    task = task_paginator.elements[0]
-    histories = get_histories_by_task_id(
-        task_id=id, repository_task_history=repository_task_history
+def get_detailed_task_by_id(
+    id: str,
+    repository_task: domain_repository.TaskRepository,
+    last_histories: int | None = None,
+) -> entity_domain.Task | None:
+    task = repository_task.get_with_histories_by_id(
+        id=id, with_owner=True, last_histories=last_histories
     )
-    for history in histories:
-        task.inject_history(history=history)
-    return cast(entity_domain.Task | None, task)
+    if not task:
+        raise ValueError("Task not found")
+    return task
 
 
 class UpdateTaskCommandRequest(command.CommandRequest):
@@ -186,12 +176,11 @@ def create_task(
     repository_task: domain_repository.TaskRepository,
     repository_task_history: domain_repository.TaskHistoryRepository,
     repository_board: domain_repository.BoardRepository,
-    repository_ownership: domain_repository.OwnerShipBoardRepository,
 ) -> entity_domain.Task:
     entity_task_domain = get_task_by_id(
         repository_task=repository_task,
-        repository_task_history=repository_task_history,
         id=cast(str, payload.id),
+        last_histories=0,
     )
     if entity_task_domain:
         raise ValueError("Task already exists")
@@ -199,7 +188,6 @@ def create_task(
     entity_board_domain = services_board.get_board_by_id(
         id=board_id,
         repository_board=repository_board,
-        repository_ownership=repository_ownership,
     )
     if not entity_board_domain:
         raise ValueError("Board not found")
@@ -229,25 +217,24 @@ def update_task(
     logger: log_model.LogAdapter,
     repository_task: domain_repository.TaskRepository,
     repository_task_history: domain_repository.TaskHistoryRepository,
-    repository_board: domain_repository.BoardRepository,
     repository_ownership: domain_repository.OwnerShipBoardRepository,
+    membership_cache: membership_cache_model.MembershipCache,
 ) -> entity_domain.Task:
     entity_task_domain = get_task_by_id(
         repository_task=repository_task,
-        repository_task_history=repository_task_history,
         id=id,
+        last_histories=0,
     )
 
     if not entity_task_domain:
         raise ValueError("Task not found")
 
-    entity_board_domain = services_board.get_board_by_id(
-        id=entity_task_domain.board_id,
-        repository_board=repository_board,
+    services_board.ensure_editor_of_board(
+        board_id=entity_task_domain.board_id,
+        user_id=user_id,
         repository_ownership=repository_ownership,
+        membership_cache=membership_cache,
     )
-    if not entity_board_domain:
-        raise ValueError("Board not found")
 
     logger.info("Updating Task")
 
@@ -257,7 +244,6 @@ def update_task(
         priority=payload.priority,
         icon_url=payload.icon_url,
     )
-    entity_board_domain.update_task(task=entity_task_domain, member_that_update=user_id)
 
     repository_task.update(id=id, to_update=entity_task_domain)
     repository_task_history.create(new=entity_task_domain.histories[-1])
@@ -270,31 +256,196 @@ def delete_task(
     logger: log_model.LogAdapter,
     repository_task: domain_repository.TaskRepository,
     repository_task_history: domain_repository.TaskHistoryRepository,
-    repository_board: domain_repository.BoardRepository,
     repository_ownership: domain_repository.OwnerShipBoardRepository,
+    membership_cache: membership_cache_model.MembershipCache,
 ) -> entity_domain.Task:
     entity_task_domain = get_task_by_id(
         repository_task=repository_task,
-        repository_task_history=repository_task_history,
         id=id,
+        last_histories=0,
     )
 
     if not entity_task_domain:
         raise ValueError("Task not found")
 
-    entity_board_domain = services_board.get_board_by_id(
-        id=entity_task_domain.board_id,
-        repository_board=repository_board,
+    services_board.ensure_editor_of_board(
+        board_id=entity_task_domain.board_id,
+        user_id=user_id,
         repository_ownership=repository_ownership,
+        membership_cache=membership_cache,
     )
-    if not entity_board_domain:
-        raise ValueError("Board not found")
 
     logger.info("Deleting Task")
 
     entity_task_domain.delete()
-    entity_board_domain.delete_task(task=entity_task_domain, member_that_delete=user_id)
 
     repository_task.delete(id=id)
     repository_task_history.create(new=entity_task_domain.histories[-1])
     return entity_task_domain
+
+
+class BatchTaskOperationType(enum.StrEnum):
+    CREATE = enum.auto()
+    UPDATE = enum.auto()
+    STATUS = enum.auto()
+    DELETE = enum.auto()
+
+
+class BatchTaskOperation(pydantic.BaseModel):
+    operation: BatchTaskOperationType
+    id: str | None = None
+    name: str | None = None
+    description: str | None = None
+    priority: entity_domain.PriorityType | None = None
+    icon_url: str | None = None
+    status: entity_domain.TaskStatus | None = None
+
+
+class BatchTaskCommandRequest(command.CommandRequest):
+    operations: List[BatchTaskOperation] = pydantic.Field(min_length=1, max_length=500)
+
+
+class BatchTaskResult(pydantic.BaseModel):
+    index: int
+    operation: BatchTaskOperationType
+    id: str | None = None
+    success: bool = True
+    task: entity_domain.Task | None = None
+    error: Dict[str, str] | None = None
+
+
+class BatchTaskCommandResponse(pydantic.BaseModel):
+    board_id: str
+    results: List[BatchTaskResult] = pydantic.Field(default_factory=list)
+
+
+def _apply_batch_operation(
+    operation: BatchTaskOperation,
+    user_id: str,
+    board: entity_domain.Board,
+    created: Dict[str, entity_domain.Task],
+    deleted: Dict[str, entity_domain.Task],
+    existing_ids: Set[str],
+) -> entity_domain.Task:
+    if operation.operation == BatchTaskOperationType.CREATE:
+        if not operation.name or operation.description is None:
+            raise ValueError("Name and description are required")
+        task_id = operation.id or str(uuid.uuid4())
+        if board.has_task(task_id) or task_id in existing_ids:
+            raise ValueError(f"Task {task_id} already exists")
+        task = entity_domain.Task.create(
+            id=task_id,
+            name=operation.name,
+            description=operation.description,
+            owner=user_id,
+            board_id=board.id,
+            priority=operation.priority or entity_domain.PriorityType.LOW,
+            icon_url=operation.icon_url,
+        )
+        board.add_task(task=task, member_that_insert=user_id)
+        created[task.id] = task
+        return task
+
+    if not operation.id or operation.id in deleted:
+        raise ValueError("Task not found")
+    task = board.get_task_by_id(operation.id)
+
+    if operation.operation == BatchTaskOperationType.UPDATE:
+        board.update_task(task=task, member_that_update=user_id)
+        task.update(
+            name=operation.name,
+            description=operation.description,
+            priority=operation.priority,
+            icon_url=operation.icon_url,
+        )
+    elif operation.operation == BatchTaskOperationType.STATUS:
+        if operation.status is None:
+            raise ValueError("Status is required")
+        board.update_task(task=task, member_that_update=user_id)
+        task.change_status(status=operation.status)
+    else:
+        board.delete_task(task=task, member_that_delete=user_id)
+        task.delete()
+        deleted[task.id] = task
+    return task
+
+
+def batch_tasks(
+    payload: BatchTaskCommandRequest,
+    user_id: str,
+    board_id: str,
+    logger: log_model.LogAdapter,
+    repository_task: domain_repository.TaskRepository,
+    repository_task_history: domain_repository.TaskHistoryRepository,
+    repository_board: domain_repository.BoardRepository,
+) -> BatchTaskCommandResponse:
+    board = services_board.get_board_by_id(
+        id=board_id, repository_board=repository_board, with_tasks=True
+    )
+    if not board:
+        raise ValueError("Board not found")
+
+    logger.info(f"Batch of {len(payload.operations)} Tasks in Board {board_id}")
+
+    # Ids outside the board, in other boards or deleted, still collide on insert
+    existing_ids = repository_task.get_existing_ids(
+        ids=[
+            operation.id
+            for operation in payload.operations
+            if operation.operation == BatchTaskOperationType.CREATE
+            and operation.id
+            and not board.has_task(operation.id)
+        ]
+    )
+
+    response = BatchTaskCommandResponse(board_id=board_id)
+    created: Dict[str, entity_domain.Task] = {}
+    deleted: Dict[str, entity_domain.Task] = {}
+    touched: Dict[str, entity_domain.Task] = {}
+
+    for index, operation in enumerate(payload.operations):
+        try:
+            task = _apply_batch_operation(
+                operation, user_id, board, created, deleted, existing_ids
+            )
+        except (ValueError, domain_exceptions.CustomException) as error:
+            response.results.append(
+                BatchTaskResult(
+                    index=index,
+                    operation=operation.operation,
+                    id=operation.id,
+                    success=False,
+                    error={
+                        "message": getattr(error, "message", str(error)),
+                        "type": error.__class__.__name__,
+                    },
+                )
+            )
+            continue
+
+        touched[task.id] = task
+        response.results.append(
+            BatchTaskResult(
+                index=index,
+                operation=operation.operation,
+                id=task.id,
+                task=task.model_copy(deep=True),
+            )
+        )
+
+    # Tasks created and deleted in the same batch never reach the database
+    for task_id in created.keys() & deleted.keys():
+        del created[task_id], deleted[task_id], touched[task_id]
+
+    repository_task.create_many(entities=list(created.values()))
+    for task in touched.values():
+        if task.id not in created and task.id not in deleted:
+            repository_task.update(id=task.id, to_update=task)
+    for task_id in deleted:
+        repository_task.delete(id=task_id)
+    # Board tasks load without history, everything in it was added by this batch
+    repository_task_history.create_many(
+        entities=[history for task in touched.values() for history in task.histories]
+    )
+
+    return response
@@ -3,7 +3,7 @@ from typing import Generic, TypeVar
 
 import pydantic
 
-from src.domain.services import command
+from src.domain.services import command, user
 
 T = TypeVar("T", bound=command.Command)
 
@@ -33,6 +33,18 @@ class EntrypointSecurity(pydantic.BaseModel):
     require_security: bool = False
     audiences: list[str] = pydantic.Field(default_factory=list)
 
+    _audiences_mask: int | None = pydantic.PrivateAttr(default=None)
+
+    def compile(self) -> int:
+        self._audiences_mask = user.audiences_mask(self.audiences)
+        return self._audiences_mask
+
+    @property
+    def audiences_mask(self) -> int:
+        if self._audiences_mask is None:
+            return self.compile()
+        return self._audiences_mask
+
 
 class EntrypointModel(Generic[T]):
     security: EntrypointSecurity
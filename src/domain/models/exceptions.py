@@ -9,3 +9,6 @@ class CustomException(Exception):
 
     def to_dict(self) -> Dict[str, str]:
         return {"message": self.message, "type": self.__class__.__name__}
+
+
+class BadRequestError(CustomException): ...  # noqa: E701
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import abc
+import base64
+import binascii
 import enum
+import json
 from typing import Any, Dict, List, Type, TypeVar
 
 import pydantic
 
-from . import repository
+from . import exceptions, repository
 
 T = TypeVar("T")
 Y = TypeVar("Y", bound=repository.RepositoryData)
@@ -29,23 +32,52 @@ class JoinType(enum.StrEnum):
     LEFT_OUTER = enum.auto()
 
 
+class CursorDirection(enum.StrEnum):
+    NEXT = enum.auto()
+    PREVIOUS = enum.auto()
+
+
+class Cursor(pydantic.BaseModel):
+    values: List[Any]
+    direction: CursorDirection = CursorDirection.NEXT
+
+    def encode(self) -> str:
+        raw = json.dumps(
+            {"v": self.values, "d": self.direction}, default=str, separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "Cursor":
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(cursor + padding))
+            return cls(values=raw["v"], direction=raw["d"])
+        except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+            raise exceptions.BadRequestError("Cursor not valid") from exc
+
+
 class Paginator(pydantic.BaseModel):
-    total: int = 0
+    total: int | None = 0
     page: int = 0
     count: int = 0
     elements: List[Any] = pydantic.Field(default_factory=list)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
     @property
     def total_pages(self) -> int:
-        return self.total // self.count
+        if not self.count or self.total is None:
+            return 0
+        return -(-self.total // self.count)
 
     @property
     def has_previous(self) -> bool:
-        return self.page in (0, 1)
+        return self.page > 1 or self.prev_cursor is not None
 
     @property
     def has_next(self) -> bool:
-        return self.total_pages < self.page
+        return self.page < self.total_pages or self.next_cursor is not None
 
 
 class FilterDefinition(abc.ABC):
@@ -110,6 +142,20 @@ class Ordered(abc.ABC):
         raise NotImplementedError()
 
 
+class Keyset(abc.ABC):
+    @abc.abstractmethod
+    def to_definition(self, order_by: List[Ordered], direction: CursorDirection) -> str:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def get_values(self, order_by: List[Ordered], values: List[Any]) -> List[Any]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def to_order(self, order_by: List[Ordered], direction: CursorDirection) -> str:
+        raise NotImplementedError()
+
+
 class FilterType(enum.StrEnum):
     EQUAL = enum.auto()
     NOT_EQUAL = enum.auto()
@@ -181,12 +227,14 @@ class FilterBuilder:
     group_filters: Dict[GroupFilterType, Type[AndFilters | OrFilters]]
     orders: Dict[OrderType, Type[Ordered]]
     join: Joined | None = None
+    keyset: Keyset | None = None
 
     def __init__(self) -> None:
         self.filters = {}
         self.orders = {}
         self.group_filters = {}
         self.join = None
+        self.keyset = None
 
     def inject(
         self, type_filter: FilterType, filter_base: Type[FilterDefinition]
@@ -196,6 +244,9 @@ class FilterBuilder:
     def inject_join(self, join: Joined) -> None:
         self.join = join
 
+    def inject_keyset(self, keyset: Keyset) -> None:
+        self.keyset = keyset
+
     def inject_order(self, type_order: OrderType, order_base: Type[Ordered]) -> None:
         self.orders[type_order] = order_base
 
@@ -232,6 +283,7 @@ class Criteria:
     order_by: List[Ordered]
     page_quantity: int
     page_number: int
+    cursor: Cursor | None
 
     def __init__(
         self,
@@ -239,11 +291,17 @@ class Criteria:
         order_by: List[Ordered],
         page_quantity: int,
         page_number: int,
+        cursor: Cursor | None = None,
     ) -> None:
         self.filters = filters
         self.order_by = order_by
         self.page_quantity = page_quantity
         self.page_number = page_number
+        self.cursor = cursor
+
+    @property
+    def offset(self) -> int:
+        return (max(self.page_number, 1) - 1) * self.page_quantity
 
     def update_table(self, prefix: str) -> None:
         for filter in self.filters:
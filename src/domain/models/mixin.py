@@ -1,5 +1,5 @@
 import abc
-from typing import Any, List, cast
+from typing import Any, Dict, List, cast
 
 from src.domain.models import filter, repository
 from src.infra.log import model as model_log
@@ -101,6 +101,10 @@ class CreatorMixin(abc.ABC):
     def create(self, new: repository.RepositoryData) -> repository.RepositoryData:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def create_many(self, entities: List[repository.RepositoryData]) -> List[str]:
+        raise NotImplementedError()
+
 
 class UpdaterMixin(abc.ABC):
     repository_persistence: repository.RepositoryPersistence
@@ -129,6 +133,12 @@ class UpdaterMixin(abc.ABC):
     ) -> repository.RepositoryData:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def update_where(
+        self, criteria: filter.Criteria, changes: Dict[str, Any]
+    ) -> List[str]:
+        raise NotImplementedError()
+
 
 class DeleterMixin(abc.ABC):
     repository_persistence: repository.RepositoryPersistence
@@ -161,3 +171,180 @@ class DeleterMixin(abc.ABC):
     @abc.abstractmethod
     def delete(self, id: str) -> None:
         raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete_where(self, criteria: filter.Criteria) -> List[str]:
+        raise NotImplementedError()
+
+
+# Async
+
+
+class AsyncGetterMixin(abc.ABC):
+    repository_persistence: repository.RepositoryPersistence
+    logger: model_log.LogAdapter
+    _filter_builder: filter.FilterBuilder
+
+    _session: model_uow.AsyncSession
+    _equal_id_filter: filter.FilterDefinition
+
+    def __init__(
+        self,
+        *args,
+        **kwargs,
+    ) -> None:
+        self.repository_persistence = cast(
+            repository.RepositoryPersistence, kwargs.get("repository_persistence")
+        )
+        self.logger = cast(model_log.LogAdapter | None, kwargs.get("logger")) or cast(
+            model_log.LogAdapter, kwargs.get("log")
+        )
+        self._filter_builder = cast(filter.FilterBuilder, kwargs.get("filter_builder"))
+        self._session = cast(model_uow.AsyncSession, kwargs.get("session"))
+
+        self._equal_id_filter = self._filter_builder.build(
+            type_filter=filter.FilterType.EQUAL
+        )("id")
+
+    @abc.abstractmethod
+    def serialize(self, data: Any) -> repository.RepositoryData | None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def get_by_id(self, id: str) -> repository.RepositoryData | None:
+        raise NotImplementedError()
+
+
+class AsyncGetterListMixin(abc.ABC):
+    repository_persistence: repository.RepositoryPersistence
+    logger: model_log.LogAdapter
+
+    _filter_builder: filter.FilterBuilder
+    _session: model_uow.AsyncSession
+
+    def __init__(
+        self,
+        *args,
+        **kwargs,
+    ) -> None:
+        self.repository_persistence = cast(
+            repository.RepositoryPersistence, kwargs.get("repository_persistence")
+        )
+        self.logger = cast(model_log.LogAdapter | None, kwargs.get("logger")) or cast(
+            model_log.LogAdapter, kwargs.get("log")
+        )
+        self._filter_builder = cast(filter.FilterBuilder, kwargs.get("filter_builder"))
+        self._session = cast(model_uow.AsyncSession, kwargs.get("session"))
+
+    @abc.abstractmethod
+    async def filter(
+        self,
+        criteria: filter.Criteria,
+        custom_filter: repository.CustomQuery | None = None,
+        joins: List[filter.Join] | None = None,
+    ) -> filter.Paginator:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def serialize(self, data: Any) -> repository.RepositoryData | None:
+        raise NotImplementedError()
+
+
+class AsyncCreatorMixin(abc.ABC):
+    repository_persistence: repository.RepositoryPersistence
+
+    _session: model_uow.AsyncSession
+    _filter_builder: filter.FilterBuilder
+    logger: model_log.LogAdapter
+
+    def __init__(
+        self,
+        *args,
+        **kwargs,
+    ) -> None:
+        self.repository_persistence = cast(
+            repository.RepositoryPersistence, kwargs.get("repository_persistence")
+        )
+        self.logger = cast(model_log.LogAdapter | None, kwargs.get("logger")) or cast(
+            model_log.LogAdapter, kwargs.get("log")
+        )
+        self._filter_builder = cast(filter.FilterBuilder, kwargs.get("filter_builder"))
+        self._session = cast(model_uow.AsyncSession, kwargs.get("session"))
+
+    @abc.abstractmethod
+    async def create(self, new: repository.RepositoryData) -> repository.RepositoryData:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def create_many(self, entities: List[repository.RepositoryData]) -> List[str]:
+        raise NotImplementedError()
+
+
+class AsyncUpdaterMixin(abc.ABC):
+    repository_persistence: repository.RepositoryPersistence
+
+    _session: model_uow.AsyncSession
+    logger: model_log.LogAdapter
+    _filter_builder: filter.FilterBuilder
+
+    def __init__(
+        self,
+        *args,
+        **kwargs,
+    ) -> None:
+        self.repository_persistence = cast(
+            repository.RepositoryPersistence, kwargs.get("repository_persistence")
+        )
+        self.logger = cast(model_log.LogAdapter | None, kwargs.get("logger")) or cast(
+            model_log.LogAdapter, kwargs.get("log")
+        )
+        self._filter_builder = cast(filter.FilterBuilder, kwargs.get("filter_builder"))
+        self._session = cast(model_uow.AsyncSession, kwargs.get("session"))
+
+    @abc.abstractmethod
+    async def update(
+        self, id: str, to_update: repository.RepositoryData
+    ) -> repository.RepositoryData:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def update_where(
+        self, criteria: filter.Criteria, changes: Dict[str, Any]
+    ) -> List[str]:
+        raise NotImplementedError()
+
+
+class AsyncDeleterMixin(abc.ABC):
+    repository_persistence: repository.RepositoryPersistence
+
+    _session: model_uow.AsyncSession
+    logger: model_log.LogAdapter
+    _filter_builder: filter.FilterBuilder
+
+    _equal_id_filter: filter.FilterDefinition
+
+    def __init__(
+        self,
+        *args,
+        **kwargs,
+    ) -> None:
+        self.repository_persistence = cast(
+            repository.RepositoryPersistence, kwargs.get("repository_persistence")
+        )
+        self.logger = cast(model_log.LogAdapter | None, kwargs.get("logger")) or cast(
+            model_log.LogAdapter, kwargs.get("log")
+        )
+        self._filter_builder = cast(filter.FilterBuilder, kwargs.get("filter_builder"))
+        self._session = cast(model_uow.AsyncSession, kwargs.get("session"))
+
+        self._equal_id_filter = self._filter_builder.build(
+            type_filter=filter.FilterType.EQUAL
+        )("id")
+
+    @abc.abstractmethod
+    async def delete(self, id: str) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def delete_where(self, criteria: filter.Criteria) -> List[str]:
+        raise NotImplementedError()
@@ -1,13 +1,15 @@
 import abc
 import datetime
-from typing import Any, Dict, List, Type, TypeVar, Union, cast
+import enum
+from typing import Any, ClassVar, Dict, List, Set, Type, TypeVar, Union, cast
 
 import pydantic
 
 from src import settings
 from src.domain import libtools
+from src.domain.models import exceptions
 from src.infra.log import model as log_model
-from src.infra.uow.model import Session
+from src.infra.uow.model import AsyncSession, Session
 
 T = TypeVar("T", bound="Repository")
 
@@ -24,20 +26,39 @@ class PersistenceTypeNotFoundError(Exception):
     message: str = "Persistence Not Found"
 
 
+class RepositorySortNotAllowedError(exceptions.BadRequestError):
+    message: str = "Repository Sort Not Allowed"
+
+
+class CountMode(enum.StrEnum):
+    QUERY = enum.auto()
+    WINDOW = enum.auto()
+
+
 class CustomQuery:
     query: str
     count_attributes: str
     limit_offset: str
+    count_mode: CountMode
+    window_count_attributes: str
 
     def __init__(
         self,
         query: str,
         count_attributes: str,
         limit_offset: str,
+        count_mode: CountMode = CountMode.QUERY,
+        window_count_attributes: str = "",
     ) -> None:
         self.count_attributes = count_attributes
         self.query = query
         self.limit_offset = limit_offset
+        self.count_mode = count_mode
+        self.window_count_attributes = window_count_attributes
+
+    @property
+    def with_window_count(self) -> bool:
+        return self.count_mode == CountMode.WINDOW
 
     def to_declaration(
         self,
@@ -48,24 +69,36 @@ class CustomQuery:
         limit: str | None = None,
         offset: str | None = None,
         with_count: bool = False,
+        order_by: str = "",
+        window_count: bool = True,
     ) -> str:
         if with_count:
             return self.query.format(
                 table=table_name,
                 attributes=self.count_attributes,
                 joins=joins,
+                orders="",
                 limits="",
                 filters=filters,
             )
 
+        if self.with_window_count and window_count:
+            attributes = f"{attributes}, {self.window_count_attributes}"
+
+        limits = self.limit_offset.format(
+            limit=str(limit or 1), offset=str(offset or 1)
+        )
+        orders = f"ORDER BY {order_by}" if order_by else ""
+        if orders and "{orders}" not in self.query:
+            limits = f"{orders} {limits}"
+
         return self.query.format(
             table=table_name,
             attributes=attributes,
             joins=joins,
             filters=filters,
-            limits=self.limit_offset.format(
-                limit=str(limit or 1), offset=str(offset or 1)
-            ),
+            orders=orders,
+            limits=limits,
         )
 
 
@@ -76,10 +109,34 @@ class RepositoryData(pydantic.BaseModel):
     updated_at: datetime.datetime = datetime.datetime.now()
     is_activated: bool = True
 
+    # Attributes persisted under another column name
+    dirty_aliases: ClassVar[Dict[str, str]] = {}
+
+    # None until loaded from persistence, then the attributes changed since
+    _dirty: Set[str] | None = pydantic.PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        dirty = getattr(self, "_dirty", None)
+        if (
+            dirty is not None
+            and name in type(self).model_fields
+            and getattr(self, name) != value
+        ):
+            dirty.add(self.dirty_aliases.get(name, name))
+        super().__setattr__(name, value)
+
+    @property
+    def dirty_fields(self) -> Set[str] | None:
+        return None if self._dirty is None else set(self._dirty)
+
+    def mark_clean(self) -> None:
+        self._dirty = set()
+
 
 class RepositoryPersistence(pydantic.BaseModel):
     table_name: str
     fields: List[str]
+    sortable_fields: List[str] = pydantic.Field(default_factory=lambda: ["id"])
 
 
 class Repository(abc.ABC):
@@ -135,7 +192,9 @@ class RepositoryGetter:
         self.filter_builder = dependencies["filter_builder"]
 
     def __call__(
-        self, repository: Union[Type[Repository], Type[T]], session: Session
+        self,
+        repository: Union[Type[Repository], Type[T]],
+        session: Session | AsyncSession,
     ) -> T:
         if repository not in self.repositories:
             raise PersistenceTypeNotFoundError(
@@ -1,4 +1,5 @@
 import abc
+import copy
 import uuid
 from typing import Any, Dict, List, Type, cast
 
@@ -27,6 +28,7 @@ class CommandQueryRequest(CommandRequest):
     offset: int | None = None
     order_by: str | None = None
     filters: str | None = None
+    cursor: str | None = None
 
     def get_filters(self) -> List[CommandFilter]:
         separator_filters = "|"
@@ -99,6 +101,9 @@ class Command(abc.ABC):
     requirements: List[str]
     parameters: Dict[str, Any]
 
+    # Commands doing blocking io can be moved out of the event loop
+    blocking: bool = True
+
     _deps: Dict[str, Any]
 
     def __init__(
@@ -117,6 +122,12 @@ class Command(abc.ABC):
         for requirement in self.requirements:
             self._deps[requirement] = infra_dependencies[requirement]
 
+    def clone(self) -> "Command":
+        cloned = copy.copy(self)
+        cloned.request = None
+        cloned.parameters = {}
+        return cloned
+
     def inject_parameters(self, parameters: Dict[str, Any]) -> None:
         self.parameters = parameters
 
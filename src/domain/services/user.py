@@ -1,5 +1,5 @@
 import enum
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 import pydantic
 
@@ -20,6 +20,7 @@ class Audience(enum.StrEnum):
     GET_TASKS_ALL = "task:gets_all"
     UPDATE_TASK = "task:update"
     DELETE_TASK = "task:delete"
+    BATCH_TASK = "task:batch"
     CREATE_BOARD = "board:create"
     GET_BOARDS = "board:gets"
     GET_BOARD = "board:get"
@@ -57,6 +58,7 @@ ROLE_PERMISSIONS: Dict[Role, List[Audience]] = {
         Audience.GET_TASK,
         Audience.UPDATE_TASK,
         Audience.DELETE_TASK,
+        Audience.BATCH_TASK,
         Audience.GET_TASKS_ALL,
     ],
     Role.CLIENT: [
@@ -77,10 +79,27 @@ ROLE_PERMISSIONS: Dict[Role, List[Audience]] = {
         Audience.GET_TASK,
         Audience.UPDATE_TASK,
         Audience.DELETE_TASK,
+        Audience.BATCH_TASK,
         Audience.GET_TASKS_ALL,
     ],
 }
 
+# Bit per audience, a role or a route is the OR of its audiences
+AUDIENCE_MASKS: Dict[Audience, int] = {
+    audience: 1 << position for position, audience in enumerate(Audience)
+}
+ROLE_MASKS: Dict[Role, int] = {
+    role: sum(AUDIENCE_MASKS[audience] for audience in set(audiences))
+    for role, audiences in ROLE_PERMISSIONS.items()
+}
+
+
+def audiences_mask(audiences: Iterable[str]) -> int:
+    mask = 0
+    for audience in audiences:
+        mask |= AUDIENCE_MASKS[Audience(audience)]
+    return mask
+
 
 class AuthUser(pydantic.BaseModel):
     id: str
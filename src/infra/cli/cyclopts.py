@@ -50,11 +50,12 @@ class CycloptsCLIModel(model.CLIModel):
         async def executor_script() -> None:
             print(f"Executing Script {script.name}")
             print("_" * 30)
-            request = self._print_object_getter(object=script.cmd.request_type)
+            cmd = script.cmd.clone()
+            request = self._print_object_getter(object=cmd.request_type)
             print("_" * 30)
 
-            script.cmd.inject_using_dict(request)
-            response = await script.cmd.execute()
+            cmd.inject_using_dict(request)
+            response = await cmd.execute()
 
             print("_" * 30)
             print(f"Response: {response.model_dump()}")
@@ -286,6 +286,58 @@ class PostgresJoined(filter.Joined):
         )
 
 
+class PostgresKeyset(filter.Keyset):
+    def _forwards(
+        self, order_by: List[filter.Ordered], direction: filter.CursorDirection
+    ) -> List[bool]:
+        is_next = direction == filter.CursorDirection.NEXT
+        return [(order.type == filter.OrderType.ASC) == is_next for order in order_by]
+
+    def to_definition(
+        self, order_by: List[filter.Ordered], direction: filter.CursorDirection
+    ) -> str:
+        forwards = self._forwards(order_by, direction)
+        if len(set(forwards)) == 1:
+            return "({attrs}) {op} ({values})".format(
+                attrs=", ".join(order.attribute for order in order_by),
+                op=">" if forwards[0] else "<",
+                values=", ".join("%s" for _ in order_by),
+            )
+
+        branches = []
+        for index, order in enumerate(order_by):
+            conditions = [f"{previous.attribute} = %s" for previous in order_by[:index]]
+            conditions.append(
+                "{attr} {op} %s".format(
+                    attr=order.attribute, op=">" if forwards[index] else "<"
+                )
+            )
+            branches.append("({})".format(" AND ".join(conditions)))
+        return "({})".format(" OR ".join(branches))
+
+    def get_values(
+        self, order_by: List[filter.Ordered], values: List[Any]
+    ) -> List[Any]:
+        if len({order.type for order in order_by}) == 1:
+            return list(values)
+
+        params: List[Any] = []
+        for index in range(len(order_by)):
+            params += values[: index + 1]
+        return params
+
+    def to_order(
+        self, order_by: List[filter.Ordered], direction: filter.CursorDirection
+    ) -> str:
+        forwards = self._forwards(order_by, direction)
+        return ", ".join(
+            "{attr} {type}".format(
+                attr=order.attribute, type="ASC" if forward else "DESC"
+            )
+            for order, forward in zip(order_by, forwards)
+        )
+
+
 filters_definition = List[Type[filter.FilterDefinition]]
 postgres_filter_builder = filter.FilterBuilder()
 
@@ -330,3 +382,6 @@ postgres_filter_builder.inject_group_filter(
 
 # JOIN
 postgres_filter_builder.inject_join(PostgresJoined())
+
+# Keyset
+postgres_filter_builder.inject_keyset(PostgresKeyset())
@@ -0,0 +1,142 @@
+import abc
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Dict, Type
+
+import pydantic
+
+from src import settings
+from src.domain.services import command
+
+
+class RouteDispatchStats(pydantic.BaseModel):
+    route: str
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+
+    @property
+    def average_wait_ms(self) -> float:
+        if not self.completed:
+            return 0.0
+        return self.wait_ms_total / self.completed
+
+
+class CommandDispatcher(abc.ABC):
+    _stats: Dict[str, RouteDispatchStats]
+    _lock: threading.Lock
+
+    def __init__(self, configuration: settings.BaseSettings) -> None:
+        self.configuration = configuration
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _route_stats(self, route: str) -> RouteDispatchStats:
+        if route not in self._stats:
+            self._stats[route] = RouteDispatchStats(route=route)
+        return self._stats[route]
+
+    def _enqueued(self, route: str) -> float:
+        with self._lock:
+            self._route_stats(route).queued += 1
+        return time.perf_counter()
+
+    def _started(self, route: str, enqueued_at: float) -> None:
+        wait_ms = (time.perf_counter() - enqueued_at) * 1000
+        with self._lock:
+            current = self._route_stats(route)
+            current.queued -= 1
+            current.running += 1
+            current.wait_ms_total += wait_ms
+            current.wait_ms_max = max(current.wait_ms_max, wait_ms)
+
+    def _finished(self, route: str) -> None:
+        with self._lock:
+            current = self._route_stats(route)
+            current.running -= 1
+            current.completed += 1
+
+    def stats(self) -> Dict[str, RouteDispatchStats]:
+        with self._lock:
+            return {
+                route: current.model_copy() for route, current in self._stats.items()
+            }
+
+    @abc.abstractmethod
+    async def dispatch(
+        self, route: str, cmd: command.Command
+    ) -> command.CommandResponse:
+        raise NotImplementedError()
+
+    def shutdown(self) -> None:
+        return None
+
+
+class EventLoopDispatcher(CommandDispatcher):
+    async def dispatch(
+        self, route: str, cmd: command.Command
+    ) -> command.CommandResponse:
+        self._started(route, self._enqueued(route))
+        try:
+            return await cmd.execute()
+        finally:
+            self._finished(route)
+
+
+class ThreadPoolDispatcher(EventLoopDispatcher):
+    executor: concurrent.futures.ThreadPoolExecutor
+    _local: threading.local
+
+    def __init__(self, configuration: settings.BaseSettings) -> None:
+        super().__init__(configuration)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(configuration.http_dispatch_pool_size),
+            thread_name_prefix="http-dispatch",
+        )
+        self._local = threading.local()
+
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        loop = getattr(self._local, "loop", None)
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self._local.loop = loop
+        return loop
+
+    def _run(
+        self, route: str, cmd: command.Command, enqueued_at: float
+    ) -> command.CommandResponse:
+        self._started(route, enqueued_at)
+        try:
+            return self._loop().run_until_complete(cmd.execute())
+        finally:
+            self._finished(route)
+
+    async def dispatch(
+        self, route: str, cmd: command.Command
+    ) -> command.CommandResponse:
+        if not cmd.blocking:
+            return await super().dispatch(route, cmd)
+        enqueued_at = self._enqueued(route)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, self._run, route, cmd, enqueued_at
+        )
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
+dispatchers: Dict[str, Type[CommandDispatcher]] = {
+    "event-loop": EventLoopDispatcher,
+    "thread-pool": ThreadPoolDispatcher,
+}
+
+
+def build_dispatcher(configuration: settings.BaseSettings) -> CommandDispatcher:
+    mode = configuration.http_dispatch_mode
+    if mode not in dispatchers:
+        raise ValueError(f"Dispatch mode {mode} not valid")
+    return dispatchers[mode](configuration)
@@ -1,6 +1,7 @@
+import contextlib
 import itertools
 import traceback
-from typing import Annotated, Any, Callable, Dict, TypeVar, cast
+from typing import Annotated, Any, AsyncIterator, Callable, Dict, TypeVar, cast
 
 import fastapi
 
@@ -10,7 +11,7 @@ from src.domain.models import exceptions as model_exceptions
 from src.domain.services import command
 from src.infra.jwt import model as jwt_model
 
-from . import model
+from . import executor, model
 
 T = TypeVar("T", bound=command.Command)
 V = TypeVar("V", bound=command.CommandRequest)
@@ -27,10 +28,13 @@ async def endpoint_function_handler({str_parameters}):
 class FastApiAdapter(model.HttpModel):
     app: fastapi.FastAPI
     responses_type: Dict[model_http.ResponseType, str]
+    dispatcher: executor.CommandDispatcher
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        self.dispatcher = executor.build_dispatcher(self.configuration)
+
         self.app = fastapi.FastAPI(
             debug=self.configuration.has_debug,
             title=self.configuration.title,
@@ -38,13 +42,20 @@ class FastApiAdapter(model.HttpModel):
             contact=self.configuration.contact_info,
             docs_url=self.configuration.docs_url,
             root_path=self.configuration.prefix_api_url,
+            lifespan=self._lifespan,
         )
+        self.app.state.dispatcher = self.dispatcher
 
         self.responses_type = {
             model_http.ResponseType.JSON: "application/json",
             model_http.ResponseType.WS: "application/ws",
         }
 
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, app: fastapi.FastAPI) -> AsyncIterator[None]:
+        yield
+        self.dispatcher.shutdown()
+
     def _get_decorator(self, route: domain_http.EntrypointHttp) -> Callable:
         status_callable: Dict[model_http.HttpStatusType, Callable] = {
             model_http.HttpStatusType.GET: self.app.get,
@@ -89,7 +100,7 @@ class FastApiAdapter(model.HttpModel):
                 if status_authentication.status is not model_http.StatusType.OK:
                     self._status_error_response(status_authentication)
 
-            cmd = cast(command.Command, route.cmd)
+            cmd = cast(command.Command, route.cmd).clone()
 
             parameters = {
                 parameter: kwargs.get(parameter, "")
@@ -108,7 +119,16 @@ class FastApiAdapter(model.HttpModel):
             cmd.inject_request(request_data)
 
             try:
-                return await cmd.execute()
+                return await self.dispatcher.dispatch(route.name, cmd)
+            except model_exceptions.BadRequestError as exc:
+                return fastapi.responses.JSONResponse(
+                    content=command.CommandResponse(
+                        trace_id=request_data.trace_id,
+                        errors=[exc.to_dict()],
+                        payload={},
+                    ).model_dump(mode="json"),
+                    status_code=400,
+                )
             except ValueError as exc:
                 return command.CommandResponse(
                     trace_id=request_data.trace_id,
@@ -191,6 +211,7 @@ class FastApiAdapter(model.HttpModel):
         return namespace["endpoint_function_handler"]
 
     def _inject_route(self, route: domain_http.EntrypointHttp) -> None:
+        route.security.compile()
         endpoint = self._create_dynamic_endpoint(route)
 
         decorator = self._get_decorator(route)(
@@ -245,7 +266,9 @@ class FastApiAdapter(model.HttpModel):
                 type=model_http.StatusType.NOT_AUTHORIZED,
             )
         response = self.jwt.check_and_decode(
-            token=token.split(" ")[1], allowed_aud=route.security.audiences
+            token=token.split(" ")[1],
+            allowed_aud=route.security.audiences,
+            allowed_mask=route.security.audiences_mask,
         )
         if not response.status:
             return jwt_model.StatusCheckJWT(
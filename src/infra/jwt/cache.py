@@ -0,0 +1,95 @@
+import collections
+import hashlib
+import threading
+import time
+from typing import NamedTuple
+
+import pydantic
+
+from . import model
+
+
+class VerifiedTokenCacheStats(pydantic.BaseModel):
+    size: int = 0
+    entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
+
+class VerifiedToken(NamedTuple):
+    expires_at: float
+    data: model.JWTData
+    permissions_mask: int
+
+
+class VerifiedTokenCache:
+    size: int
+
+    _tokens: collections.OrderedDict[bytes, VerifiedToken]
+    _lock: threading.Lock
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._tokens = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _digest(self, token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> VerifiedToken | None:
+        key = self._digest(token)
+        with self._lock:
+            verified = self._tokens.get(key)
+            if verified is not None and verified.expires_at <= time.time():
+                del self._tokens[key]
+                self._expirations += 1
+                verified = None
+            if verified is None:
+                self._misses += 1
+                return None
+            self._tokens.move_to_end(key)
+            self._hits += 1
+            return verified
+
+    def set(self, token: str, data: model.JWTData) -> VerifiedToken:
+        verified = VerifiedToken(
+            expires_at=data.exp.timestamp(),
+            data=data,
+            permissions_mask=data.permissions_mask,
+        )
+        key = self._digest(token)
+        with self._lock:
+            self._tokens[key] = verified
+            self._tokens.move_to_end(key)
+            while len(self._tokens) > self.size:
+                self._tokens.popitem(last=False)
+                self._evictions += 1
+        return verified
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self) -> VerifiedTokenCacheStats:
+        with self._lock:
+            return VerifiedTokenCacheStats(
+                size=self.size,
+                entries=len(self._tokens),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
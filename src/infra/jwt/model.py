@@ -1,6 +1,6 @@
 import abc
 import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 
 import pydantic
 
@@ -16,13 +16,20 @@ class JWTData(pydantic.BaseModel):
     gen: datetime.datetime
     exp: datetime.datetime
 
-    def has_permission(self, audiences: List[str]) -> bool:
+    @property
+    def permissions_mask(self) -> int:
         role = list(filter(lambda aud: aud.startswith("role:"), self.aud))[0]
-        all_audiences_with_role = user.ROLE_PERMISSIONS[user.Role(role)]
-        current_user_audiences = [
-            user.Audience(aud) for aud in self.aud if user.Audience.exists(aud)
-        ] + all_audiences_with_role
-        return any(user.Audience(aud) in current_user_audiences for aud in audiences)
+        mask = user.ROLE_MASKS[user.Role(role)]
+        for aud in self.aud:
+            mask |= user.AUDIENCE_MASKS.get(cast(user.Audience, aud), 0)
+        return mask
+
+    def has_permission(
+        self, audiences_mask: int, permissions_mask: int | None = None
+    ) -> bool:
+        if permissions_mask is None:
+            permissions_mask = self.permissions_mask
+        return bool(permissions_mask & audiences_mask)
 
     def dict(self, *args, **kwargs) -> Dict[str, Any]:
         return {
@@ -81,7 +88,9 @@ class AuthJWT(abc.ABC):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def check_and_decode(self, token: str, allowed_aud: List[str]) -> StatusCheckJWT:
+    def check_and_decode(
+        self, token: str, allowed_aud: List[str], allowed_mask: int | None = None
+    ) -> StatusCheckJWT:
         raise NotImplementedError()
 
     @abc.abstractmethod
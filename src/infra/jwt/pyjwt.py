@@ -3,13 +3,52 @@ from typing import List, Optional
 
 import jwt
 
+from src import settings
 from src.domain.entrypoint import model as entrypoint_model
 from src.domain.services import user
+from src.infra.log import model as log_model
 
-from . import model
+from . import cache, model
+
+
+def _token_cache(
+    configuration: settings.BaseSettings,
+) -> cache.VerifiedTokenCache | None:
+    size = int(configuration.auth_token_cache_size)
+    if size <= 0:
+        return None
+    return cache.VerifiedTokenCache(size=size)
 
 
 class AuthPyJWT(model.AuthJWT):
+    tokens: cache.VerifiedTokenCache | None
+
+    def __init__(
+        self, configuration: settings.BaseSettings, logger: log_model.LogAdapter
+    ) -> None:
+        super().__init__(configuration=configuration, logger=logger)
+        self.tokens = _token_cache(configuration)
+
+    def _verify(self, token: str) -> cache.VerifiedToken:
+        verified = self.tokens.get(token) if self.tokens is not None else None
+        if verified is not None:
+            return verified
+
+        decoded = jwt.decode(
+            token,
+            self.configuration.auth_access_token_secret,
+            algorithms=["HS256"],
+            options={"verify_aud": False},
+        )
+        data = model.JWTData(**decoded)
+        if self.tokens is None:
+            return cache.VerifiedToken(
+                expires_at=data.exp.timestamp(),
+                data=data,
+                permissions_mask=data.permissions_mask,
+            )
+        return self.tokens.set(token, data)
+
     def encode(
         self,
         current_user: user.AuthUser,
@@ -61,7 +100,7 @@ class AuthPyJWT(model.AuthJWT):
         )
 
     def check_and_decode(
-        self, token: str, allowed_aud: List[str]
+        self, token: str, allowed_aud: List[str], allowed_mask: int | None = None
     ) -> model.StatusCheckJWT:
         status = True
         message = "Active Token"
@@ -69,14 +108,14 @@ class AuthPyJWT(model.AuthJWT):
         type = entrypoint_model.StatusType.OK
 
         try:
-            decoded = jwt.decode(
-                token,
-                self.configuration.auth_access_token_secret,
-                algorithms=["HS256"],
-                options={"verify_aud": False},
-            )
-            data = model.JWTData(**decoded)
-            if not data.has_permission(audiences=allowed_aud):
+            if allowed_mask is None:
+                allowed_mask = user.audiences_mask(allowed_aud)
+            verified = self._verify(token)
+            data = verified.data
+            if not data.has_permission(
+                audiences_mask=allowed_mask,
+                permissions_mask=verified.permissions_mask,
+            ):
                 raise jwt.exceptions.InvalidAudienceError()
         except jwt.exceptions.InvalidAudienceError:
             status = False
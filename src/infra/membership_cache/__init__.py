@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import List, Type
+
+from src.fastapi_ddd_abs_libs import base
+
+from . import memory, model
+
+port = Type[model.MembershipCache]
+
+options: List[base.InfraOption[port]] = [
+    base.InfraOption[port](
+        title="memory",
+        priority=1,
+        type_adapter=memory.MemoryMembershipCache,
+    ),
+    base.InfraOption[port](
+        title="fake",
+        priority=2,
+        type_adapter=memory.MemoryMembershipCache,
+    ),
+]
+
+
+request: base.InfraRequest[port] = base.InfraRequest[port](
+    title="membership_cache",
+    requirements=["configuration", "logger"],
+    options=options,
+)
@@ -0,0 +1,67 @@
+import collections
+import threading
+import time
+from typing import Tuple
+
+from src import settings
+from src.infra.log import model as log_model
+
+from . import model
+
+
+class MemoryMembershipCache(model.MembershipCache):
+    _boards: collections.OrderedDict[str, Tuple[float, model.Roles]]
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        configuration: settings.BaseSettings,
+        logger: log_model.LogAdapter,
+    ) -> None:
+        super().__init__(configuration=configuration, logger=logger)
+        self._boards = collections.OrderedDict()
+        self._lock = threading.Lock()
+        if super().enabled and configuration.server_processes > 1:
+            logger.warning(
+                "Membership cache disabled, it is kept per worker and "
+                f"{configuration.server_processes} workers are running"
+            )
+
+    @property
+    def enabled(self) -> bool:
+        # Invalidations only reach this process, other workers would keep old roles
+        return super().enabled and self.configuration.server_processes == 1
+
+    def _read(self, board_id: str) -> model.Roles | None:
+        with self._lock:
+            entry = self._boards.get(board_id)
+            if entry is None:
+                return None
+            expires_at, roles = entry
+            if expires_at <= time.monotonic():
+                del self._boards[board_id]
+                return None
+            self._boards.move_to_end(board_id)
+            return roles
+
+    def _write(self, board_id: str, roles: model.Roles) -> int:
+        evicted = 0
+        with self._lock:
+            self._boards[board_id] = (time.monotonic() + self.ttl, roles)
+            self._boards.move_to_end(board_id)
+            while len(self._boards) > self.size:
+                self._boards.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def _delete(self, board_id: str) -> None:
+        with self._lock:
+            self._boards.pop(board_id, None)
+
+    def _entries(self) -> int:
+        with self._lock:
+            return len(self._boards)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._boards.clear()
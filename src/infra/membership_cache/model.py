@@ -0,0 +1,128 @@
+import abc
+import collections
+import threading
+from typing import Dict
+
+import pydantic
+
+from src import settings
+from src.infra.log import model as log_model
+
+Roles = Dict[str, str]
+
+
+class MembershipCacheStats(pydantic.BaseModel):
+    size: int = 0
+    entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
+
+class MembershipCache(abc.ABC):
+    logger: log_model.LogAdapter
+    configuration: settings.BaseSettings
+    size: int
+    ttl: float
+
+    _counters_lock: threading.Lock
+    _versions: collections.OrderedDict[str, int]
+    _versions_floor: int
+    _generation: int
+    _versions_lock: threading.Lock
+
+    def __init__(
+        self,
+        configuration: settings.BaseSettings,
+        logger: log_model.LogAdapter,
+    ) -> None:
+        self.configuration = configuration
+        self.logger = logger
+        self.size = int(configuration.membership_cache_size)
+        self.ttl = float(configuration.membership_cache_ttl)
+        self._counters_lock = threading.Lock()
+        self._versions = collections.OrderedDict()
+        self._versions_floor = 0
+        self._generation = 0
+        self._versions_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and self.ttl > 0
+
+    def get(self, board_id: str) -> Roles | None:
+        roles = self._read(board_id) if self.enabled else None
+        with self._counters_lock:
+            if roles is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return roles
+
+    def version(self, board_id: str) -> int:
+        with self._versions_lock:
+            return self._versions.get(board_id, self._versions_floor)
+
+    def set(self, board_id: str, roles: Roles, version: int | None = None) -> None:
+        if not self.enabled:
+            return
+        with self._versions_lock:
+            # Roles read before an invalidation of the board are already stale
+            current = self._versions.get(board_id, self._versions_floor)
+            if version is not None and version != current:
+                return
+            evicted = self._write(board_id, dict(roles))
+        if evicted:
+            with self._counters_lock:
+                self._evictions += evicted
+
+    def invalidate(self, board_id: str) -> None:
+        with self._versions_lock:
+            self._generation += 1
+            self._versions[board_id] = self._generation
+            self._versions.move_to_end(board_id)
+            while len(self._versions) > max(self.size, 1):
+                _, evicted = self._versions.popitem(last=False)
+                self._versions_floor = max(self._versions_floor, evicted)
+            self._delete(board_id)
+        with self._counters_lock:
+            self._invalidations += 1
+
+    def stats(self) -> MembershipCacheStats:
+        with self._counters_lock:
+            return MembershipCacheStats(
+                size=self.size,
+                entries=self._entries(),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+    @abc.abstractmethod
+    def _read(self, board_id: str) -> Roles | None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _write(self, board_id: str, roles: Roles) -> int:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _delete(self, board_id: str) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _entries(self) -> int:
+        raise NotImplementedError()
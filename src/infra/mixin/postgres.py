@@ -1,22 +1,29 @@
 import abc
 import datetime
-import functools
 import json
-from typing import Any, Dict, Generator, Iterable, List, Tuple, cast
+from collections.abc import Generator, Iterable
+from typing import Any, Dict, List, NamedTuple, Tuple, cast
 
 import pydantic
 
-from src.domain.models import filter, mixin, repository
+from src.domain.models import exceptions, filter, mixin, repository
 from src.domain.models.repository import RepositoryData
+from src.infra.uow import model as model_uow
 
 _SELECT_DEFAULT = "SELECT * FROM {} WHERE {};"
 _SELECT_WITH_OFFSET_LIMIT_DEFAULT = (
-    "SELECT {attributes} FROM {table} {joins} WHERE {filters} {limits};"
+    "SELECT {attributes} FROM {table} {joins} WHERE {filters} {orders} {limits};"
 )
 
 _INSERT_DEFAULT = "INSERT INTO {} ({}) VALUES ({}) RETURNING id;"
+_INSERT_MANY_DEFAULT = "INSERT INTO {} ({}) VALUES {} RETURNING id;"
+_COPY_DEFAULT = "COPY {} ({}) FROM STDIN;"
 _UPDATE_DEFAULT = "UPDATE {} SET {} WHERE {};"
 _DELETE_DEFAULT = "UPDATE {} SET {} WHERE {};"
+_UPDATE_WHERE_DEFAULT = "UPDATE {} SET {} WHERE {} RETURNING id;"
+
+# Postgres binds at most 65535 parameters per statement
+_MAX_PARAMS = 65535
 
 
 def flatten(items: Iterable | str | bytes) -> Generator[str | bytes, str | bytes, None]:
@@ -31,50 +38,136 @@ def flatten(items: Iterable | str | bytes) -> Generator[str | bytes, str | bytes
 
 
 class PostgresCustomQuery(repository.CustomQuery):
-    def __init__(self, query: str) -> None:
+    def __init__(
+        self,
+        query: str,
+        count_mode: repository.CountMode = repository.CountMode.WINDOW,
+    ) -> None:
         super().__init__(
             query=query,
             count_attributes="COUNT(*)",
             limit_offset="LIMIT {limit} OFFSET {offset}",
+            count_mode=count_mode,
+            window_count_attributes="COUNT(*) OVER () AS __total",
         )
 
 
 DEFAULT_CUSTOM_QUERY = PostgresCustomQuery(query=_SELECT_WITH_OFFSET_LIMIT_DEFAULT)
 
 
-class PostgresGetterMixin(mixin.GetterMixin, abc.ABC):
+# Query Builders, shared by the sync and async mixins
 
-    def get_by_id(self, id: str) -> repository.RepositoryData:
+
+class _FilterStatements(NamedTuple):
+    script: str
+    count_script: str
+    params: Tuple[Any, ...]
+    count_params: Tuple[Any, ...]
+    with_window_count: bool
+    cursor: filter.Cursor | None = None
+    cursor_size: int = 0
+
+
+def _split_window_count(elements: List[Any]) -> Tuple[List[Any], int | None]:
+    if not elements:
+        return elements, None
+    return [record[:-1] for record in elements], int(elements[0][-1])
+
+
+def _split_cursor_values(
+    elements: List[Any], size: int
+) -> Tuple[List[Any], List[List[Any]]]:
+    if not size:
+        return elements, []
+    return [record[:-size] for record in elements], [
+        list(record[-size:]) for record in elements
+    ]
+
+
+class _GetterQuery:
+    repository_persistence: repository.RepositoryPersistence
+    _session: model_uow.Session | model_uow.AsyncSession
+    _filter_builder: filter.FilterBuilder
+    _equal_id_filter: filter.FilterDefinition
+
+    def _get_by_id_query(self, id: str) -> Tuple[str, Tuple[str, ...]]:
         id_filter_declaration = self._equal_id_filter(id)
         just_activated_filter = self._filter_builder.build(
             type_filter=filter.FilterType.EQUAL
         )("is_activated")(True)
-        response = self._session.atomic_execute(
-            query=_SELECT_DEFAULT.format(
+        query = self._session.cached_query(
+            ("get_by_id", self.repository_persistence.table_name),
+            lambda: _SELECT_DEFAULT.format(
                 self.repository_persistence.table_name,
                 id_filter_declaration.to_definition()
                 + " AND "
                 + just_activated_filter.to_definition(),
             ),
-            params=(
-                (
-                    cast(str, id_filter_declaration.get_values()),
-                    cast(str, just_activated_filter.get_values()),
-                )
-                if isinstance(id_filter_declaration.get_values(), str)
-                else cast(Tuple[str, ...], id_filter_declaration.get_values())
-            ),
         )
-        found = getattr(response, "fetchone", lambda: None)()
+        params = (
+            (
+                cast(str, id_filter_declaration.get_values()),
+                cast(str, just_activated_filter.get_values()),
+            )
+            if isinstance(id_filter_declaration.get_values(), str)
+            else cast(Tuple[str, ...], id_filter_declaration.get_values())
+        )
+        return query, params
+
+    def _get_by_id_result(self, id: str, found: Any) -> repository.RepositoryData:
         if not found:
             raise repository.RepositoryNotFoundError(
                 f"Get_by_id - {self.repository_persistence.table_name} "
                 f"not found record with id {id}"
             )
-        return cast(RepositoryData, self.serialize(found))
+        return cast(RepositoryData, _loaded(getattr(self, "serialize")(found)))
+
+
+def _loaded(element: Any) -> Any:
+    if isinstance(element, RepositoryData):
+        element.mark_clean()
+    return element
+
+
+def _criteria_shape(
+    filters: List[filter.Filter | filter.AndFilters | filter.OrFilters],
+) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+    params: List[Any] = []
+
+    def walk(
+        current_filter: filter.Filter | filter.AndFilters | filter.OrFilters,
+    ) -> Tuple[Any, ...]:
+        if isinstance(current_filter, filter.Filter):
+            definition = current_filter.filter_definition
+            values = definition.get_values(current_filter.value)
+            if isinstance(values, list):
+                params.extend(flatten(values))
+            else:
+                params.append(values)
+            return (type(definition), definition.attribute)
+        return (
+            type(current_filter),
+            tuple(walk(sub_filter) for sub_filter in current_filter.filters),
+        )
+
+    shape = tuple(walk(current_filter) for current_filter in filters)
+    return shape, tuple(params)
+
+
+def _where_definition(
+    filters: List[filter.Filter | filter.AndFilters | filter.OrFilters],
+) -> str:
+    return " AND ".join(
+        f"({current_filter.to_definition()})" for current_filter in filters
+    )
 
 
-class PostgresGetterListMixin(mixin.GetterListMixin, abc.ABC):
+class _GetterListQuery:
+    repository_persistence: repository.RepositoryPersistence
+    _session: model_uow.Session | model_uow.AsyncSession
+    _filter_builder: filter.FilterBuilder
+    logger: Any
+
     def _create_filters(
         self,
         filters: (
@@ -127,142 +220,487 @@ class PostgresGetterListMixin(mixin.GetterListMixin, abc.ABC):
             inject += cast(str, flatten(curr_filter))
         return tuple(inject)
 
-    def filter(
+    def _sort_key(
+        self, order_by: List[filter.Ordered], table_alias: str | None = None
+    ) -> List[filter.Ordered]:
+        table_name = table_alias or self.repository_persistence.table_name
+        sortable_fields = self.repository_persistence.sortable_fields
+        id_attribute = f"{table_name}.id"
+
+        sort_key: List[filter.Ordered] = []
+        for order in order_by:
+            prefix, _, column = order.attribute.rpartition(".")
+            if prefix not in ("", table_name) or column not in sortable_fields:
+                raise repository.RepositorySortNotAllowedError(
+                    f"Sort by {order.attribute} not allowed in "
+                    f"{self.repository_persistence.table_name}"
+                )
+            sort_key.append(type(order)(f"{table_name}.{column}"))
+
+        if all(order.attribute != id_attribute for order in sort_key):
+            sort_key.append(
+                self._filter_builder.build_order(filter.OrderType.ASC)(id_attribute)
+            )
+        return sort_key
+
+    def _filter_query(
         self,
         criteria: filter.Criteria,
         custom_query: repository.CustomQuery | None = None,
         joins: List[filter.Join] | None = None,
-    ) -> filter.Paginator:
+    ) -> _FilterStatements:
         if not custom_query:
             custom_query = DEFAULT_CUSTOM_QUERY
 
-        current_filters = self._create_filters(filters=criteria.filters)
-        current_joins = self._create_joins(joins)
+        keyset = self._filter_builder.keyset
+        cursor = criteria.cursor
+        if cursor and not keyset:
+            raise exceptions.BadRequestError("Cursor pagination not supported")
 
-        script = custom_query.to_declaration(
-            table_name=self.repository_persistence.table_name,
-            attributes="*",
-            joins=current_joins,
-            filters=current_filters,
-            limit=str(criteria.page_quantity),
-            offset=str(criteria.page_number - 1),
-        )
-        count_script = custom_query.to_declaration(
-            with_count=True,
-            table_name=self.repository_persistence.table_name,
-            attributes=custom_query.count_attributes,
-            joins=current_joins,
-            filters=current_filters,
-            limit=str(criteria.page_quantity),
-            offset=str(criteria.page_number - 1),
+        sort_key = self._sort_key(criteria.order_by)
+        cursor_key = sort_key if keyset else []
+        if cursor and len(cursor.values) != len(sort_key):
+            raise exceptions.BadRequestError("Cursor not valid")
+
+        shape, params = _criteria_shape(criteria.filters)
+        key = (
+            "filter",
+            self.repository_persistence.table_name,
+            custom_query.query,
+            custom_query.count_attributes,
+            custom_query.limit_offset,
+            custom_query.count_mode,
+            shape,
+            tuple((join.table, join.on, join.join_type) for join in joins or []),
+            tuple((type(order), order.attribute) for order in sort_key),
+            cursor.direction if cursor else None,
         )
 
+        def build_script() -> str:
+            attributes = ", ".join(
+                [
+                    "*",
+                    *(
+                        f"{order.attribute} AS __cursor_{index}"
+                        for index, order in enumerate(cursor_key)
+                    ),
+                ]
+            )
+            current_filters = self._create_filters(filters=criteria.filters)
+            order_by = ", ".join(order.to_definition() for order in sort_key)
+            if keyset:
+                direction = cursor.direction if cursor else filter.CursorDirection.NEXT
+                order_by = keyset.to_order(sort_key, direction)
+            if cursor and keyset:
+                current_filters = " AND ".join(
+                    current
+                    for current in (
+                        current_filters,
+                        keyset.to_definition(sort_key, cursor.direction),
+                    )
+                    if current
+                )
+
+            return custom_query.to_declaration(
+                table_name=self.repository_persistence.table_name,
+                attributes=attributes,
+                joins=self._create_joins(joins),
+                filters=current_filters,
+                limit="%s",
+                offset="0" if cursor else "%s",
+                order_by=order_by,
+                window_count=cursor is None,
+            )
+
+        def build_count_script() -> str:
+            return custom_query.to_declaration(
+                with_count=True,
+                table_name=self.repository_persistence.table_name,
+                attributes=custom_query.count_attributes,
+                joins=self._create_joins(joins),
+                filters=self._create_filters(filters=criteria.filters),
+            )
+
+        script = self._session.cached_query((*key, "data"), build_script)
+        count_script = self._session.cached_query((*key, "count"), build_count_script)
+
         self.logger.info(f"Query [{script}]")
         self.logger.info(f"Count Query [{count_script}]")
 
-        inject = self._create_params_filter(filters=criteria.filters)
-
-        response_count = self._session.atomic_execute(query=count_script, params=inject)
-        count = getattr(response_count, "fetchone", lambda: [None])()
+        if cursor and keyset:
+            return _FilterStatements(
+                script=script,
+                count_script=count_script,
+                params=(
+                    *params,
+                    *keyset.get_values(sort_key, cursor.values),
+                    criteria.page_quantity + 1,
+                ),
+                count_params=params,
+                with_window_count=False,
+                cursor=cursor,
+                cursor_size=len(sort_key),
+            )
 
-        response = self._session.atomic_execute(query=script, params=inject)
-        elements = cast(List[Any], getattr(response, "fetchall", lambda: [])())
+        return _FilterStatements(
+            script=script,
+            count_script=count_script,
+            params=(*params, criteria.page_quantity, criteria.offset),
+            count_params=params,
+            with_window_count=custom_query.with_window_count,
+            cursor_size=len(cursor_key),
+        )
 
-        total = int(count[0] or 0)
+    def _filter_result(
+        self,
+        criteria: filter.Criteria,
+        total: int | None,
+        elements: List[Any],
+        statements: _FilterStatements,
+    ) -> filter.Paginator:
+        serialize = getattr(self, "serialize")
+        elements, cursor_values = _split_cursor_values(elements, statements.cursor_size)
+
+        next_values: List[Any] | None = None
+        prev_values: List[Any] | None = None
+        cursor = statements.cursor
+        if cursor:
+            has_more = len(elements) > criteria.page_quantity
+            elements = elements[: criteria.page_quantity]
+            cursor_values = cursor_values[: criteria.page_quantity]
+            if cursor.direction == filter.CursorDirection.PREVIOUS:
+                elements.reverse()
+                cursor_values.reverse()
+            if cursor_values:
+                is_next = cursor.direction == filter.CursorDirection.NEXT
+                next_values = cursor_values[-1] if has_more or not is_next else None
+                prev_values = cursor_values[0] if has_more or is_next else None
+            total, count = None, len(elements)
+        else:
+            total = total or 0
+            count = min(total, criteria.page_quantity)
+            if cursor_values and criteria.offset + len(elements) < total:
+                next_values = cursor_values[-1]
+            if cursor_values and criteria.offset > 0:
+                prev_values = cursor_values[0]
 
         return filter.Paginator(
             total=total,
             page=criteria.page_number,
-            count=criteria.page_quantity if total > criteria.page_quantity else total,
-            elements=[self.serialize(record) for record in elements],
+            count=count,
+            elements=[_loaded(serialize(record)) for record in elements],
+            next_cursor=(
+                filter.Cursor(values=next_values).encode() if next_values else None
+            ),
+            prev_cursor=(
+                filter.Cursor(
+                    values=prev_values, direction=filter.CursorDirection.PREVIOUS
+                ).encode()
+                if prev_values
+                else None
+            ),
         )
 
 
-class PostgresCreatorMixin(mixin.CreatorMixin):
-    def create(self, new: repository.RepositoryData) -> repository.RepositoryData:
-        script = _INSERT_DEFAULT.format(
-            self.repository_persistence.table_name,
-            ",".join(self.repository_persistence.fields),
-            ",".join(["%s" for _ in self.repository_persistence.fields]),
-        )
+def _convert_field(field: Any) -> Any:
+    if isinstance(field, pydantic.SecretStr):
+        return field.get_secret_value()
+    if isinstance(field, list):
+        return ",".join(field)
+    if isinstance(field, Dict):
+        return json.dumps(field)
+    return field
 
-        def convertion_fields(field: Any) -> str:
-            if isinstance(field, pydantic.SecretStr):
-                return field.get_secret_value()
-            if isinstance(field, list):
-                return ",".join(field)
-            if isinstance(field, Dict):
-                return json.dumps(field)
-            return field
-
-        get_fields = (
-            getattr(new, field) for field in self.repository_persistence.fields
+
+class _CreatorQuery:
+    repository_persistence: repository.RepositoryPersistence
+    _session: model_uow.Session | model_uow.AsyncSession
+    logger: Any
+
+    def _create_values(self, new: repository.RepositoryData) -> Tuple[Any, ...]:
+        return tuple(
+            _convert_field(getattr(new, field))
+            for field in self.repository_persistence.fields
         )
-        fields_to_attr = functools.partial(
-            map,
-            convertion_fields,
+
+    def _create_query(
+        self, new: repository.RepositoryData
+    ) -> Tuple[str, Tuple[str, ...]]:
+        fields_persistence = self.repository_persistence.fields
+        script = self._session.cached_query(
+            (
+                "create",
+                self.repository_persistence.table_name,
+                tuple(fields_persistence),
+            ),
+            lambda: _INSERT_DEFAULT.format(
+                self.repository_persistence.table_name,
+                ",".join(fields_persistence),
+                ",".join(["%s" for _ in fields_persistence]),
+            ),
         )
 
-        fields = tuple(fields_to_attr(get_fields))
+        fields = self._create_values(new)
         self.logger.info(f"Query [{script}]")
-        result = self._session.atomic_execute(query=script, params=fields)
-        new_id = getattr(result, "fetchone", lambda: "")()
-        new.id = new_id[0] if new_id else ""
-        return new
-
+        return script, fields
 
-class PostgresUpdaterMixin(mixin.UpdaterMixin):
-    def update(
-        self, id: str, to_update: repository.RepositoryData
-    ) -> repository.RepositoryData:
-        to_update.updated_at = datetime.datetime.now()
+    def _use_copy(self, entities: List[repository.RepositoryData]) -> bool:
+        return len(entities) >= int(self._session.configuration.postgres_copy_threshold)
 
-        script = _UPDATE_DEFAULT.format(
-            self.repository_persistence.table_name,
-            ",".join(
-                [
-                    f"{field} = %s"
-                    for field in self.repository_persistence.fields
-                    if field != "id"
-                ]
+    def _copy_query(self) -> str:
+        fields_persistence = self.repository_persistence.fields
+        return self._session.cached_query(
+            (
+                "copy",
+                self.repository_persistence.table_name,
+                tuple(fields_persistence),
+            ),
+            lambda: _COPY_DEFAULT.format(
+                self.repository_persistence.table_name,
+                ",".join(fields_persistence),
             ),
-            "id = %s",
         )
 
-        def get_attr_value(field) -> Any:
-            return getattr(to_update, field)
+    def _create_many_queries(
+        self, entities: List[repository.RepositoryData]
+    ) -> Generator[Tuple[str, Tuple[Any, ...]], None, None]:
+        fields_persistence = self.repository_persistence.fields
+        row = "({})".format(",".join(["%s" for _ in fields_persistence]))
+        chunk_size = _MAX_PARAMS // len(fields_persistence)
+
+        for start in range(0, len(entities), chunk_size):
+            end = start + chunk_size
+            chunk = entities[start:end]
+            script = _INSERT_MANY_DEFAULT.format(
+                self.repository_persistence.table_name,
+                ",".join(fields_persistence),
+                ",".join([row for _ in chunk]),
+            )
+            yield script, tuple(
+                value for new in chunk for value in self._create_values(new)
+            )
+
+
+class _UpdaterQuery:
+    repository_persistence: repository.RepositoryPersistence
+    _session: model_uow.Session | model_uow.AsyncSession
 
-        params = tuple(
-            get_attr_value(field)
+    def _update_query(
+        self, id: str, to_update: repository.RepositoryData
+    ) -> Tuple[str, Tuple[Any, ...]] | None:
+        dirty = to_update.dirty_fields
+        fields = [
+            field
             for field in self.repository_persistence.fields
-            if field != "id"
+            if field != "id" and (dirty is None or field in dirty)
+        ]
+        if not fields:
+            return None
+        if (
+            "updated_at" in self.repository_persistence.fields
+            and "updated_at" not in fields
+        ):
+            fields.append("updated_at")
+
+        to_update.updated_at = datetime.datetime.now()
+
+        script = self._session.cached_query(
+            (
+                "update",
+                self.repository_persistence.table_name,
+                tuple(fields),
+            ),
+            lambda: _UPDATE_DEFAULT.format(
+                self.repository_persistence.table_name,
+                ",".join([f"{field} = %s" for field in fields]),
+                "id = %s",
+            ),
         )
 
-        self._session.atomic_execute(
-            query=script,
-            params=(
-                *params,
-                id,
+        params = tuple(_convert_field(getattr(to_update, field)) for field in fields)
+        return script, (*params, id)
+
+    def _update_where_query(
+        self, criteria: filter.Criteria, changes: Dict[str, Any]
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        if not criteria.filters:
+            raise ValueError("Update without filters not allowed")
+
+        fields_persistence = self.repository_persistence.fields
+        for field in changes:
+            if field == "id" or field not in fields_persistence:
+                raise ValueError(
+                    f"Field {field} not allowed in "
+                    f"{self.repository_persistence.table_name}"
+                )
+        if "updated_at" in fields_persistence and "updated_at" not in changes:
+            changes = {**changes, "updated_at": datetime.datetime.now()}
+
+        shape, params = _criteria_shape(criteria.filters)
+        script = self._session.cached_query(
+            (
+                "update_where",
+                self.repository_persistence.table_name,
+                tuple(changes),
+                shape,
+            ),
+            lambda: _UPDATE_WHERE_DEFAULT.format(
+                self.repository_persistence.table_name,
+                ",".join(f"{field} = %s" for field in changes),
+                _where_definition(criteria.filters),
             ),
         )
-        return to_update
+        values = tuple(_convert_field(value) for value in changes.values())
+        return script, (*values, *params)
 
 
-class PostgresDeleterMixin(mixin.DeleterMixin):
-    def delete(self, id: str) -> None:
+class _DeleterQuery:
+    repository_persistence: repository.RepositoryPersistence
+    _session: model_uow.Session | model_uow.AsyncSession
+    _equal_id_filter: filter.FilterDefinition
+
+    def _delete_query(self, id: str) -> Tuple[str, Tuple[str, ...]]:
         id_filter_declaration = self._equal_id_filter(id)
-        self._session.atomic_execute(
-            query=_DELETE_DEFAULT.format(
+        query = self._session.cached_query(
+            ("delete", self.repository_persistence.table_name),
+            lambda: _DELETE_DEFAULT.format(
                 self.repository_persistence.table_name,
                 "deleted_at = %s, is_activated = %s",
                 id_filter_declaration.to_definition(),
             ),
-            params=(
-                datetime.datetime.now().isoformat(),
-                "false",
-                cast(str, id_filter_declaration.get_values()),
+        )
+        params = (
+            datetime.datetime.now().isoformat(),
+            "false",
+            cast(str, id_filter_declaration.get_values()),
+        )
+        return query, params
+
+    def _delete_where_query(
+        self, criteria: filter.Criteria
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        if not criteria.filters:
+            raise ValueError("Delete without filters not allowed")
+
+        shape, params = _criteria_shape(criteria.filters)
+        query = self._session.cached_query(
+            ("delete_where", self.repository_persistence.table_name, shape),
+            lambda: _UPDATE_WHERE_DEFAULT.format(
+                self.repository_persistence.table_name,
+                "deleted_at = %s, is_activated = %s",
+                _where_definition(criteria.filters),
             ),
         )
+        return query, (datetime.datetime.now().isoformat(), "false", *params)
+
+
+class PostgresGetterMixin(_GetterQuery, mixin.GetterMixin, abc.ABC):
+
+    def get_by_id(self, id: str) -> repository.RepositoryData:
+        query, params = self._get_by_id_query(id)
+        response = self._session.atomic_execute(
+            query=query, params=params, prepare=True
+        )
+        found = getattr(response, "fetchone", lambda: None)()
+        return self._get_by_id_result(id, found)
+
+
+class PostgresGetterListMixin(_GetterListQuery, mixin.GetterListMixin, abc.ABC):
+    def filter(
+        self,
+        criteria: filter.Criteria,
+        custom_query: repository.CustomQuery | None = None,
+        joins: List[filter.Join] | None = None,
+    ) -> filter.Paginator:
+        statements = self._filter_query(
+            criteria=criteria, custom_query=custom_query, joins=joins
+        )
+
+        response = self._session.atomic_execute(
+            query=statements.script, params=statements.params, prepare=True
+        )
+        elements = cast(List[Any], getattr(response, "fetchall", lambda: [])())
+
+        total: int | None = None
+        if statements.with_window_count:
+            elements, total = _split_window_count(elements)
+            if total is None and criteria.page_number <= 1:
+                total = 0
+
+        if total is None and statements.cursor is None:
+            response_count = self._session.atomic_execute(
+                query=statements.count_script,
+                params=statements.count_params,
+                prepare=True,
+            )
+            count = getattr(response_count, "fetchone", lambda: [None])()
+            total = int(count[0] or 0)
+
+        return self._filter_result(criteria, total, elements, statements)
+
+
+class PostgresCreatorMixin(_CreatorQuery, mixin.CreatorMixin):
+    def create(self, new: repository.RepositoryData) -> repository.RepositoryData:
+        script, fields = self._create_query(new)
+        result = self._session.atomic_execute(query=script, params=fields, prepare=True)
+        new_id = getattr(result, "fetchone", lambda: "")()
+        new.id = new_id[0] if new_id else ""
+        return new
+
+    def create_many(self, entities: List[repository.RepositoryData]) -> List[str]:
+        if not entities:
+            return []
+
+        if self._use_copy(entities):
+            script = self._copy_query()
+            self.logger.info(f"Copy [{script}] rows [{len(entities)}]")
+            self._session.copy_rows(
+                query=script, rows=(self._create_values(new) for new in entities)
+            )
+            # COPY reports no rows back, so the ids are the ones already assigned
+            return [new.id for new in entities]
+
+        ids: List[str] = []
+        for script, params in self._create_many_queries(entities):
+            result = self._session.atomic_execute(query=script, params=params)
+            ids += [row[0] for row in getattr(result, "fetchall", lambda: [])()]
+        return ids
+
+
+class PostgresUpdaterMixin(_UpdaterQuery, mixin.UpdaterMixin):
+    def update(
+        self, id: str, to_update: repository.RepositoryData
+    ) -> repository.RepositoryData:
+        statement = self._update_query(id, to_update)
+        if statement is None:
+            return to_update
+        script, params = statement
+        self._session.atomic_execute(query=script, params=params, prepare=True)
+        if to_update.dirty_fields is not None:
+            to_update.mark_clean()
+        return to_update
+
+    def update_where(
+        self, criteria: filter.Criteria, changes: Dict[str, Any]
+    ) -> List[str]:
+        script, params = self._update_where_query(criteria, changes)
+        response = self._session.atomic_execute(
+            query=script, params=params, prepare=True
+        )
+        return [row[0] for row in getattr(response, "fetchall", lambda: [])()]
+
+
+class PostgresDeleterMixin(_DeleterQuery, mixin.DeleterMixin):
+    def delete(self, id: str) -> None:
+        query, params = self._delete_query(id)
+        self._session.atomic_execute(query=query, params=params, prepare=True)
+
+    def delete_where(self, criteria: filter.Criteria) -> List[str]:
+        query, params = self._delete_where_query(criteria)
+        response = self._session.atomic_execute(
+            query=query, params=params, prepare=True
+        )
+        return [row[0] for row in getattr(response, "fetchall", lambda: [])()]
 
 
 class PostgresCRUDMixin(
@@ -281,3 +719,118 @@ class PostgresCRUDMixin(
             *args,
             **kwargs,
         )
+
+
+# Async
+
+
+class AsyncPostgresGetterMixin(_GetterQuery, mixin.AsyncGetterMixin, abc.ABC):
+    async def get_by_id(self, id: str) -> repository.RepositoryData:
+        query, params = self._get_by_id_query(id)
+        response = await self._session.atomic_execute(
+            query=query, params=params, prepare=True
+        )
+        found = await getattr(response, "fetchone")()
+        return self._get_by_id_result(id, found)
+
+
+class AsyncPostgresGetterListMixin(
+    _GetterListQuery, mixin.AsyncGetterListMixin, abc.ABC
+):
+    async def filter(
+        self,
+        criteria: filter.Criteria,
+        custom_query: repository.CustomQuery | None = None,
+        joins: List[filter.Join] | None = None,
+    ) -> filter.Paginator:
+        statements = self._filter_query(
+            criteria=criteria, custom_query=custom_query, joins=joins
+        )
+
+        response = await self._session.atomic_execute(
+            query=statements.script, params=statements.params, prepare=True
+        )
+        elements = cast(List[Any], await getattr(response, "fetchall")())
+
+        total: int | None = None
+        if statements.with_window_count:
+            elements, total = _split_window_count(elements)
+            if total is None and criteria.page_number <= 1:
+                total = 0
+
+        if total is None and statements.cursor is None:
+            response_count = await self._session.atomic_execute(
+                query=statements.count_script,
+                params=statements.count_params,
+                prepare=True,
+            )
+            count = await getattr(response_count, "fetchone")()
+            total = int(count[0] or 0)
+
+        return self._filter_result(criteria, total, elements, statements)
+
+
+class AsyncPostgresCreatorMixin(_CreatorQuery, mixin.AsyncCreatorMixin):
+    async def create(self, new: repository.RepositoryData) -> repository.RepositoryData:
+        script, fields = self._create_query(new)
+        result = await self._session.atomic_execute(
+            query=script, params=fields, prepare=True
+        )
+        new_id = await getattr(result, "fetchone")()
+        new.id = new_id[0] if new_id else ""
+        return new
+
+    async def create_many(self, entities: List[repository.RepositoryData]) -> List[str]:
+        if not entities:
+            return []
+
+        if self._use_copy(entities):
+            script = self._copy_query()
+            self.logger.info(f"Copy [{script}] rows [{len(entities)}]")
+            await self._session.copy_rows(
+                query=script, rows=(self._create_values(new) for new in entities)
+            )
+            # COPY reports no rows back, so the ids are the ones already assigned
+            return [new.id for new in entities]
+
+        ids: List[str] = []
+        for script, params in self._create_many_queries(entities):
+            result = await self._session.atomic_execute(query=script, params=params)
+            ids += [row[0] for row in await getattr(result, "fetchall")()]
+        return ids
+
+
+class AsyncPostgresUpdaterMixin(_UpdaterQuery, mixin.AsyncUpdaterMixin):
+    async def update(
+        self, id: str, to_update: repository.RepositoryData
+    ) -> repository.RepositoryData:
+        statement = self._update_query(id, to_update)
+        if statement is None:
+            return to_update
+        script, params = statement
+        await self._session.atomic_execute(query=script, params=params, prepare=True)
+        if to_update.dirty_fields is not None:
+            to_update.mark_clean()
+        return to_update
+
+    async def update_where(
+        self, criteria: filter.Criteria, changes: Dict[str, Any]
+    ) -> List[str]:
+        script, params = self._update_where_query(criteria, changes)
+        response = await self._session.atomic_execute(
+            query=script, params=params, prepare=True
+        )
+        return [row[0] for row in await getattr(response, "fetchall")()]
+
+
+class AsyncPostgresDeleterMixin(_DeleterQuery, mixin.AsyncDeleterMixin):
+    async def delete(self, id: str) -> None:
+        query, params = self._delete_query(id)
+        await self._session.atomic_execute(query=query, params=params, prepare=True)
+
+    async def delete_where(self, criteria: filter.Criteria) -> List[str]:
+        query, params = self._delete_where_query(criteria)
+        response = await self._session.atomic_execute(
+            query=query, params=params, prepare=True
+        )
+        return [row[0] for row in await getattr(response, "fetchall")()]
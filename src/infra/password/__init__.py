@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import List, Type
+
+from src.fastapi_ddd_abs_libs import base
+
+from . import bcrypt, model
+
+port = Type[model.PasswordHasher]
+
+options: List[base.InfraOption[port]] = [
+    base.InfraOption[port](
+        title="bcrypt-process-pool",
+        priority=1,
+        type_adapter=bcrypt.ProcessPoolBcryptHasher,
+    ),
+    base.InfraOption[port](
+        title="bcrypt-thread-pool",
+        priority=1,
+        type_adapter=bcrypt.ThreadPoolBcryptHasher,
+    ),
+    base.InfraOption[port](
+        title="fake",
+        priority=2,
+        type_adapter=bcrypt.ThreadPoolBcryptHasher,
+    ),
+]
+
+
+request: base.InfraRequest[port] = base.InfraRequest[port](
+    title="password_hasher",
+    requirements=["configuration", "logger"],
+    options=options,
+)
@@ -0,0 +1,61 @@
+import concurrent.futures
+import multiprocessing
+import os
+
+import bcrypt
+import pydantic
+
+from . import model
+
+
+def _hash(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _verify(password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed_password)
+
+
+class BcryptHasher(model.PasswordHasher):
+    async def hash(self, password: pydantic.SecretStr) -> str:
+        hashed = await self._run(
+            _hash, password.get_secret_value().encode(), self.rounds
+        )
+        return hashed.decode("utf-8")
+
+    async def verify(
+        self, password: pydantic.SecretStr, hashed_password: pydantic.SecretStr
+    ) -> bool:
+        return await self._run(
+            _verify,
+            password.get_secret_value().encode(),
+            hashed_password.get_secret_value().encode(),
+        )
+
+    def needs_rehash(self, hashed_password: pydantic.SecretStr) -> bool:
+        # $2b$<rounds>$<salt and hash>
+        parts = hashed_password.get_secret_value().split("$")
+        return len(parts) < 4 or not parts[2].isdigit() or int(parts[2]) != self.rounds
+
+
+class ProcessPoolBcryptHasher(BcryptHasher):
+    def _default_workers(self) -> int:
+        # Every server worker starts its own pool
+        return (os.cpu_count() or 1) // self.configuration.server_processes
+
+    def _build_executor(self) -> concurrent.futures.Executor:
+        self.logger.info(f"Starting {self.workers} password hasher processes")
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+
+class ThreadPoolBcryptHasher(BcryptHasher):
+    def _default_workers(self) -> int:
+        return min((os.cpu_count() or 1) // self.configuration.server_processes, 4)
+
+    def _build_executor(self) -> concurrent.futures.Executor:
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="password-hasher"
+        )
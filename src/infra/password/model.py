@@ -0,0 +1,166 @@
+import abc
+import asyncio
+import collections
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Deque, TypeVar
+
+import pydantic
+
+from src import settings
+from src.infra.log import model as log_model
+
+R = TypeVar("R")
+
+
+class PasswordHasherBusyError(Exception):
+    message: str = "Password Hasher Busy"
+
+
+class PasswordHasherStats(pydantic.BaseModel):
+    workers: int = 0
+    max_concurrency: int = 0
+    max_waiting: int = 0
+    running: int = 0
+    waiting: int = 0
+    completed: int = 0
+    rejected: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+
+    @property
+    def average_wait_ms(self) -> float:
+        if not self.completed:
+            return 0.0
+        return self.wait_ms_total / self.completed
+
+
+class PasswordHasher(abc.ABC):
+    logger: log_model.LogAdapter
+    configuration: settings.BaseSettings
+    rounds: int
+    workers: int
+    max_concurrency: int
+    max_waiting: int
+
+    _executor: concurrent.futures.Executor | None
+    _waiters: Deque[concurrent.futures.Future]
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        configuration: settings.BaseSettings,
+        logger: log_model.LogAdapter,
+    ) -> None:
+        self.configuration = configuration
+        self.logger = logger
+        self.rounds = int(configuration.password_hash_rounds)
+        self.workers = int(configuration.password_hasher_workers) or max(
+            self._default_workers(), 1
+        )
+        self.max_concurrency = (
+            int(configuration.password_hasher_max_concurrency) or self.workers
+        )
+        self.max_waiting = int(configuration.password_hasher_max_waiting)
+        self._executor = None
+        self._waiters = collections.deque()
+        self._lock = threading.Lock()
+        self._stats = PasswordHasherStats(
+            workers=self.workers,
+            max_concurrency=self.max_concurrency,
+            max_waiting=self.max_waiting,
+        )
+
+    @abc.abstractmethod
+    def _default_workers(self) -> int:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _build_executor(self) -> concurrent.futures.Executor:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def hash(self, password: pydantic.SecretStr) -> str:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def verify(
+        self, password: pydantic.SecretStr, hashed_password: pydantic.SecretStr
+    ) -> bool:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def needs_rehash(self, hashed_password: pydantic.SecretStr) -> bool:
+        raise NotImplementedError()
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._build_executor()
+            return self._executor
+
+    async def _acquire(self) -> None:
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            if self._stats.running < self.max_concurrency and not self._waiters:
+                self._stats.running += 1
+                return
+            if len(self._waiters) >= self.max_waiting:
+                self._stats.rejected += 1
+                raise PasswordHasherBusyError()
+            waiter: concurrent.futures.Future = concurrent.futures.Future()
+            self._waiters.append(waiter)
+            self._stats.waiting = len(self._waiters)
+
+        try:
+            await asyncio.wrap_future(waiter)
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    self._stats.waiting = len(self._waiters)
+                    raise
+                handed_over = not waiter.cancelled()
+            if handed_over:
+                self._hand_over()
+            raise
+
+        wait_ms = (time.perf_counter() - enqueued_at) * 1000
+        with self._lock:
+            self._stats.wait_ms_total += wait_ms
+            self._stats.wait_ms_max = max(self._stats.wait_ms_max, wait_ms)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._stats.completed += 1
+        self._hand_over()
+
+    def _hand_over(self) -> None:
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                self._stats.waiting = len(self._waiters)
+                if waiter.set_running_or_notify_cancel():
+                    waiter.set_result(None)
+                    return
+            self._stats.running -= 1
+
+    async def _run(self, function: Callable[..., R], *args: Any) -> R:
+        await self._acquire()
+        try:
+            return await asyncio.wrap_future(
+                self._get_executor().submit(function, *args)
+            )
+        finally:
+            self._release()
+
+    def stats(self) -> PasswordHasherStats:
+        with self._lock:
+            return self._stats.model_copy()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -4,7 +4,7 @@ from typing import List, Type
 
 from src.fastapi_ddd_abs_libs import base
 
-from . import model, uvicorn
+from . import model, prefork, uvicorn
 
 port = Type[model.ServerAdapter]
 
@@ -14,6 +14,11 @@ options: List[base.InfraOption[port]] = [
         priority=1,
         type_adapter=uvicorn.UvicornAdapter,
     ),
+    base.InfraOption[port](
+        title="uvicorn-prefork",
+        priority=1,
+        type_adapter=prefork.UvicornPreforkAdapter,
+    ),
     base.InfraOption[port](
         title="fake",
         priority=2,
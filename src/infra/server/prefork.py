@@ -0,0 +1,183 @@
+import gc
+import os
+import select
+import signal
+import socket
+import time
+from typing import Any, Dict, List, cast
+
+import uvicorn
+
+from . import model
+from . import uvicorn as uvicorn_server
+
+_SUPERVISED_SIGNALS = (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
+
+
+class _WorkerServer(uvicorn.Server):
+    def __init__(self, config: uvicorn.Config, ready: int) -> None:
+        super().__init__(config=config)
+        self._ready = ready
+
+    async def startup(self, sockets: List[socket.socket] | None = None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started:
+            os.write(self._ready, b"1")
+
+
+class UvicornPreforkAdapter(model.ServerAdapter):
+    workers: int
+    preload: bool
+    graceful_timeout: float
+
+    _app: Any
+    _options: Dict[str, Any]
+    _workers: Dict[int, float]
+    _restart: bool
+    _stopping: bool
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.workers = self.configuration.server_processes
+        self.preload = bool(self.configuration.server_preload)
+        self.graceful_timeout = float(self.configuration.server_graceful_timeout)
+        self._app = None
+        self._options = {}
+        self._workers = {}
+        self._restart = False
+        self._stopping = False
+
+    def _config(self) -> uvicorn.Config:
+        if self._app is None:
+            return uvicorn.Config(
+                app=self.configuration.server_app_factory,
+                factory=True,
+                timeout_graceful_shutdown=int(self.graceful_timeout),
+                **self._options,
+            )
+        return uvicorn.Config(
+            app=cast(Any, self._app),
+            timeout_graceful_shutdown=int(self.graceful_timeout),
+            **self._options,
+        )
+
+    def _spawn(self, sock: socket.socket) -> int:
+        ready_read, ready_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_read)
+            for signum in _SUPERVISED_SIGNALS:
+                signal.signal(signum, signal.SIG_DFL)
+            code = 0
+            try:
+                _WorkerServer(config=self._config(), ready=ready_write).run(
+                    sockets=[sock]
+                )
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+
+        os.close(ready_write)
+        self._workers[pid] = time.monotonic()
+        self.logger.info(f"Started server worker {pid}")
+        try:
+            readable, _, _ = select.select([ready_read], [], [], self.graceful_timeout)
+            if not readable or not os.read(ready_read, 1):
+                self.logger.warning(f"Server worker {pid} did not report ready")
+        except InterruptedError:
+            pass
+        finally:
+            os.close(ready_read)
+        return pid
+
+    def _wait(self, pid: int, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                finished, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                return True
+            if finished:
+                return True
+            time.sleep(0.1)
+        return False
+
+    def _stop(self, pids: List[int]) -> None:
+        for pid in pids:
+            self._workers.pop(pid, None)
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                continue
+        deadline = time.monotonic() + self.graceful_timeout
+        for pid in pids:
+            if not self._wait(pid, max(deadline - time.monotonic(), 0.0)):
+                self.logger.warning(
+                    f"Killing server worker {pid} after graceful timeout"
+                )
+                os.kill(pid, signal.SIGKILL)
+                self._wait(pid, self.graceful_timeout)
+            self.logger.info(f"Stopped server worker {pid}")
+
+    def _rolling_restart(self, sock: socket.socket) -> None:
+        self.logger.info(f"Rolling restart of {len(self._workers)} server workers")
+        for pid in list(self._workers):
+            if self._stopping:
+                return
+            self._spawn(sock)
+            self._stop([pid])
+
+    def _reap(self) -> None:
+        while self._workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if not pid:
+                return
+            if self._workers.pop(pid, None) is not None:
+                self.logger.warning(
+                    f"Server worker {pid} exited with code "
+                    f"{os.waitstatus_to_exitcode(status)}"
+                )
+
+    def _on_signal(self, signum: int, _: Any) -> None:
+        if signum == signal.SIGHUP:
+            self._restart = True
+        else:
+            self._stopping = True
+
+    def execute(self) -> None:
+        self._options = uvicorn_server.server_options(
+            self.configuration, self.logger, supervised=True
+        )
+        sock = self._config().bind_socket()
+        if self.preload:
+            self._app = self.http.execute().instance
+            self.logger.info(f"port.app - {self._app}")
+            gc.collect()
+            gc.freeze()
+
+        self.logger.info(
+            f"Serving with {self.workers} workers on "
+            f"{self.configuration.host}:{self.configuration.port}"
+        )
+        previous = {
+            signum: signal.signal(signum, self._on_signal)
+            for signum in _SUPERVISED_SIGNALS
+        }
+        try:
+            while not self._stopping:
+                self._reap()
+                while len(self._workers) < self.workers and not self._stopping:
+                    self._spawn(sock)
+                if self._restart:
+                    self._restart = False
+                    self._rolling_restart(sock)
+                time.sleep(0.5)
+        finally:
+            self._stop(list(self._workers))
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            sock.close()
@@ -1,9 +1,64 @@
-from typing import Any, cast
+import importlib.util
+from typing import Any, Dict, cast
 
 import uvicorn
 
+from src import settings
+from src.infra.log import model as log_model
+
 from . import model
 
+_ACCELERATED = {"loop": ("uvloop", "asyncio"), "http": ("httptools", "h11")}
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _component(
+    name: str, selected: str, logger: log_model.LogAdapter
+) -> Dict[str, str]:
+    accelerated, fallback = _ACCELERATED[name]
+    if selected == "auto":
+        selected = accelerated if _available(accelerated) else fallback
+    elif selected == accelerated and not _available(accelerated):
+        logger.warning(
+            f"Server {name} {accelerated} is not installed, using {fallback}"
+        )
+        selected = fallback
+    return {name: selected}
+
+
+def server_options(
+    configuration: settings.BaseSettings,
+    logger: log_model.LogAdapter,
+    supervised: bool = False,
+) -> Dict[str, Any]:
+    limit_max_requests = int(configuration.server_limit_max_requests) or None
+    if limit_max_requests and not supervised:
+        # Nothing replaces a single process server once it stops
+        logger.warning(
+            "Server limit max requests is ignored without the prefork server"
+        )
+        limit_max_requests = None
+
+    options: Dict[str, Any] = {
+        "host": configuration.host,
+        "port": configuration.port,
+        "backlog": int(configuration.server_backlog),
+        "timeout_keep_alive": int(configuration.server_timeout_keep_alive),
+        "limit_concurrency": int(configuration.server_limit_concurrency) or None,
+        "limit_max_requests": limit_max_requests,
+        **_component("loop", configuration.server_loop, logger),
+        **_component("http", configuration.server_http, logger),
+    }
+    logger.info(
+        "Server loop {loop}, http {http}, backlog {backlog}, keep-alive "
+        "{timeout_keep_alive}s, limit concurrency {limit_concurrency}, "
+        "limit max requests {limit_max_requests}".format(**options)
+    )
+    return options
+
 
 class UvicornAdapter(model.ServerAdapter):
     def __init__(self, *args, **kwargs) -> None:
@@ -14,6 +69,5 @@ class UvicornAdapter(model.ServerAdapter):
         self.logger.info(f"port.app - {port.instance}")
         uvicorn.run(
             app=cast(Any, port.instance),
-            host=self.configuration.host,
-            port=self.configuration.port,
+            **server_options(self.configuration, self.logger),
         )
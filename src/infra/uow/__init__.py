@@ -7,6 +7,7 @@ from src.fastapi_ddd_abs_libs import base
 from . import model, psycopg
 
 port = Type[model.UOW]
+async_port = Type[model.AsyncUOW]
 
 options: List[base.InfraOption[port]] = [
     base.InfraOption[port](
@@ -14,6 +15,11 @@ options: List[base.InfraOption[port]] = [
         priority=1,
         type_adapter=psycopg.PsycopgUOW,
     ),
+    base.InfraOption[port](
+        title="psycopg-pool",
+        priority=1,
+        type_adapter=psycopg.PsycopgPoolUOW,
+    ),
     base.InfraOption[port](
         title="fake",
         priority=2,
@@ -27,3 +33,29 @@ request: base.InfraRequest[port] = base.InfraRequest[port](
     requirements=["configuration", "logger", "session_factory"],
     options=options,
 )
+
+
+async_options: List[base.InfraOption[async_port]] = [
+    base.InfraOption[async_port](
+        title="psycopg",
+        priority=1,
+        type_adapter=psycopg.AsyncPsycopgUOW,
+    ),
+    base.InfraOption[async_port](
+        title="psycopg-pool",
+        priority=1,
+        type_adapter=psycopg.AsyncPsycopgPoolUOW,
+    ),
+    base.InfraOption[async_port](
+        title="fake",
+        priority=2,
+        type_adapter=psycopg.AsyncPsycopgUOW,
+    ),
+]
+
+
+async_request: base.InfraRequest[async_port] = base.InfraRequest[async_port](
+    title="async_uow",
+    requirements=["configuration", "logger"],
+    options=async_options,
+)
@@ -1,29 +1,61 @@
 import abc
 import contextlib
-from typing import Generator, Tuple, Type
+import functools
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any, AsyncGenerator, Generator, Set, Tuple, Type, cast
+
+import pydantic
 
 from src import settings
 from src.infra.log import model as log_model
 
+from . import replica, statement
+
 
 class Session(abc.ABC):
     logger: log_model.LogAdapter
     configuration: settings.BaseSettings
+    statements: statement.StatementCache | None
+    prepare_statements: bool
+    read_only: bool
 
     _session: object
     _connection: object
+    _acquire: Callable[[], Tuple[object, object]] | None
 
     def __init__(
         self,
         configuration: settings.BaseSettings,
         logger: log_model.LogAdapter,
-        _session: object,
-        _connection: object,
+        _session: object = None,
+        _connection: object = None,
+        statements: statement.StatementCache | None = None,
+        prepare_statements: bool = False,
+        read_only: bool = False,
+        acquire: Callable[[], Tuple[object, object]] | None = None,
     ) -> None:
         self.configuration = configuration
         self.logger = logger
         self._session = _session
         self._connection = _connection
+        self.statements = statements
+        self.prepare_statements = prepare_statements and statements is not None
+        self.read_only = read_only
+        self._acquire = acquire
+
+    @property
+    def acquired(self) -> bool:
+        return self._session is not None
+
+    def _acquired_session(self) -> object:
+        if self._session is None and self._acquire is not None:
+            self._connection, self._session = self._acquire()
+        return self._session
+
+    def cached_query(self, key: Hashable, build: Callable[[], str]) -> str:
+        if self.statements is None:
+            return build()
+        return self.statements.get(key, build)
 
     @abc.abstractmethod
     def commit(self) -> None:
@@ -39,15 +71,64 @@ class Session(abc.ABC):
 
     @abc.abstractmethod
     def atomic_execute(
-        self, query: str, params: Tuple[str, ...] | None = None
+        self,
+        query: str,
+        params: Tuple[str, ...] | None = None,
+        prepare: bool | None = None,
     ) -> object:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def copy_rows(self, query: str, rows: Iterable[Tuple[Any, ...]]) -> int:
+        raise NotImplementedError()
+
+
+def _statement_cache(
+    configuration: settings.BaseSettings,
+) -> statement.StatementCache | None:
+    size = int(configuration.postgres_statement_cache_size)
+    if size <= 0:
+        return None
+    return statement.StatementCache(size=size)
+
+
+class PoolStats(pydantic.BaseModel):
+    min_size: int = 0
+    max_size: int = 0
+    size: int = 0
+    available: int = 0
+    waiting: int = 0
+    requests: int = 0
+    requests_queued: int = 0
+    requests_wait_ms: int = 0
+    requests_errors: int = 0
+
+    @property
+    def in_use(self) -> int:
+        return self.size - self.available
+
+    @property
+    def saturation(self) -> float:
+        if not self.max_size:
+            return 0.0
+        return self.in_use / self.max_size
+
+    @property
+    def average_wait_ms(self) -> float:
+        if not self.requests_queued:
+            return 0.0
+        return self.requests_wait_ms / self.requests_queued
+
 
 class UOW(abc.ABC):
     logger: log_model.LogAdapter
     configuration: settings.BaseSettings
     session_factory: Type[Session]
+    statements: statement.StatementCache | None
+    replicas: replica.ReplicaRouter | None
+
+    # Preparing only pays off on connections that outlive the session
+    persistent_connections: bool = False
 
     def __init__(
         self,
@@ -58,25 +139,256 @@ class UOW(abc.ABC):
         self.configuration = configuration
         self.logger = logger
         self.session_factory = session_factory
+        self.statements = _statement_cache(configuration)
+        self.replicas = replica.build_router(configuration)
 
     @contextlib.contextmanager
-    def session(self) -> Generator[Session, Session, None]:
-        _conn, _session = self._open()
+    def session(self, read_only: bool = False) -> Generator[Session, Session, None]:
+        session = self.session_factory(
+            configuration=self.configuration,
+            logger=self.logger,
+            statements=self.statements,
+            prepare_statements=self.persistent_connections,
+            read_only=read_only,
+            acquire=functools.partial(self._open, read_only),
+        )
+        try:
+            yield session
+        finally:
+            self._close(session=session._session)
+
+    @contextlib.contextmanager
+    def read_session(self) -> Generator[Session, Session, None]:
+        chosen = self._acquire_replica()
+        if chosen is None:
+            with self.session(read_only=True) as session:
+                yield session
+            return
+
+        session = self.session_factory(
+            configuration=self.configuration,
+            logger=self.logger,
+            statements=self.statements,
+            prepare_statements=self.persistent_connections,
+            read_only=True,
+            acquire=functools.partial(self._open_replica, chosen),
+        )
         try:
-            session = self.session_factory(
-                configuration=self.configuration,
-                logger=self.logger,
-                _session=_session,
-                _connection=_conn,
-            )
             yield session
         finally:
-            self._close(session=_session)
+            try:
+                self._close_replica(chosen, session=session._session)
+            finally:
+                cast(replica.ReplicaRouter, self.replicas).release(chosen)
+
+    def _acquire_replica(self) -> replica.Replica | None:
+        if self.replicas is None:
+            return None
+        tried: Set[str] = set()
+        while True:
+            chosen, check = self.replicas.pick(excluding=tried)
+            if chosen is None or not check:
+                return chosen
+            if self.replicas.checked(chosen, self._replica_lag(chosen)):
+                return chosen
+            self.logger.warning(
+                f"Skipping {chosen.name}, replication lag {chosen.lag_seconds}"
+            )
+            tried.add(chosen.name)
+
+    def stats(self) -> PoolStats:
+        return PoolStats()
+
+    def close(self) -> None:
+        return None
 
     @abc.abstractmethod
-    def _open(self) -> Tuple[object, object]:
+    def _open(self, read_only: bool = False) -> Tuple[object, object]:
         raise NotImplementedError()
 
     @abc.abstractmethod
     def _close(self, session: object | None) -> None:
         raise NotImplementedError()
+
+    def _open_replica(self, chosen: replica.Replica) -> Tuple[object, object]:
+        raise NotImplementedError()
+
+    def _close_replica(self, chosen: replica.Replica, session: object | None) -> None:
+        self._close(session=session)
+
+    def _replica_lag(self, chosen: replica.Replica) -> float | None:
+        raise NotImplementedError()
+
+
+class AsyncSession(abc.ABC):
+    logger: log_model.LogAdapter
+    configuration: settings.BaseSettings
+    statements: statement.StatementCache | None
+    prepare_statements: bool
+    read_only: bool
+
+    _session: object
+    _connection: object
+    _acquire: Callable[[], Awaitable[Tuple[object, object]]] | None
+
+    def __init__(
+        self,
+        configuration: settings.BaseSettings,
+        logger: log_model.LogAdapter,
+        _session: object = None,
+        _connection: object = None,
+        statements: statement.StatementCache | None = None,
+        prepare_statements: bool = False,
+        read_only: bool = False,
+        acquire: Callable[[], Awaitable[Tuple[object, object]]] | None = None,
+    ) -> None:
+        self.configuration = configuration
+        self.logger = logger
+        self._session = _session
+        self._connection = _connection
+        self.statements = statements
+        self.prepare_statements = prepare_statements and statements is not None
+        self.read_only = read_only
+        self._acquire = acquire
+
+    @property
+    def acquired(self) -> bool:
+        return self._session is not None
+
+    async def _acquired_session(self) -> object:
+        if self._session is None and self._acquire is not None:
+            self._connection, self._session = await self._acquire()
+        return self._session
+
+    def cached_query(self, key: Hashable, build: Callable[[], str]) -> str:
+        if self.statements is None:
+            return build()
+        return self.statements.get(key, build)
+
+    @abc.abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def rollback(self) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def flush(self) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def atomic_execute(
+        self,
+        query: str,
+        params: Tuple[str, ...] | None = None,
+        prepare: bool | None = None,
+    ) -> object:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def copy_rows(self, query: str, rows: Iterable[Tuple[Any, ...]]) -> int:
+        raise NotImplementedError()
+
+
+class AsyncUOW(abc.ABC):
+    logger: log_model.LogAdapter
+    configuration: settings.BaseSettings
+    session_factory: Type[AsyncSession]
+    statements: statement.StatementCache | None
+    replicas: replica.ReplicaRouter | None
+
+    persistent_connections: bool = False
+
+    def __init__(
+        self,
+        logger: log_model.LogAdapter,
+        configuration: settings.BaseSettings,
+        session_factory: Type[AsyncSession],
+    ):
+        self.configuration = configuration
+        self.logger = logger
+        self.session_factory = session_factory
+        self.statements = _statement_cache(configuration)
+        self.replicas = replica.build_router(configuration)
+
+    @contextlib.asynccontextmanager
+    async def session(
+        self, read_only: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        session = self.session_factory(
+            configuration=self.configuration,
+            logger=self.logger,
+            statements=self.statements,
+            prepare_statements=self.persistent_connections,
+            read_only=read_only,
+            acquire=functools.partial(self._open, read_only),
+        )
+        try:
+            yield session
+        finally:
+            await self._close(session=session._session)
+
+    @contextlib.asynccontextmanager
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        chosen = await self._acquire_replica()
+        if chosen is None:
+            async with self.session(read_only=True) as session:
+                yield session
+            return
+
+        session = self.session_factory(
+            configuration=self.configuration,
+            logger=self.logger,
+            statements=self.statements,
+            prepare_statements=self.persistent_connections,
+            read_only=True,
+            acquire=functools.partial(self._open_replica, chosen),
+        )
+        try:
+            yield session
+        finally:
+            try:
+                await self._close_replica(chosen, session=session._session)
+            finally:
+                cast(replica.ReplicaRouter, self.replicas).release(chosen)
+
+    async def _acquire_replica(self) -> replica.Replica | None:
+        if self.replicas is None:
+            return None
+        tried: Set[str] = set()
+        while True:
+            chosen, check = self.replicas.pick(excluding=tried)
+            if chosen is None or not check:
+                return chosen
+            if self.replicas.checked(chosen, await self._replica_lag(chosen)):
+                return chosen
+            self.logger.warning(
+                f"Skipping {chosen.name}, replication lag {chosen.lag_seconds}"
+            )
+            tried.add(chosen.name)
+
+    def stats(self) -> PoolStats:
+        return PoolStats()
+
+    async def close(self) -> None:
+        return None
+
+    @abc.abstractmethod
+    async def _open(self, read_only: bool = False) -> Tuple[object, object]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def _close(self, session: object | None) -> None:
+        raise NotImplementedError()
+
+    async def _open_replica(self, chosen: replica.Replica) -> Tuple[object, object]:
+        raise NotImplementedError()
+
+    async def _close_replica(
+        self, chosen: replica.Replica, session: object | None
+    ) -> None:
+        await self._close(session=session)
+
+    async def _replica_lag(self, chosen: replica.Replica) -> float | None:
+        raise NotImplementedError()
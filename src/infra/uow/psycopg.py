@@ -1,8 +1,70 @@
-from typing import LiteralString, Tuple, cast
+import threading
+from typing import Any, Callable, Dict, Iterable, LiteralString, Tuple, cast
 
 import psycopg
+import psycopg_pool
 
-from . import model
+from src import settings
+
+from . import model, replica
+
+_REPLICA_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END;
+"""
+
+
+def _conninfo(configuration: settings.BaseSettings) -> str:
+    if configuration.postgres_dsn:
+        return configuration.postgres_dsn
+    return "postgresql://{user}:{password}@{host}:{port}/{dbname}".format(
+        dbname=configuration.postgres_dbname,
+        user=configuration.postgres_username,
+        password=configuration.postgres_password,
+        host=configuration.postgres_host,
+        port=configuration.postgres_port,
+    )
+
+
+def _pool_kwargs(configuration: settings.BaseSettings) -> Dict[str, Any]:
+    return {
+        "min_size": int(configuration.postgres_pool_min_size),
+        "max_size": int(configuration.postgres_pool_max_size),
+        "max_idle": float(configuration.postgres_pool_max_idle),
+        "max_lifetime": float(configuration.postgres_pool_max_lifetime),
+        "timeout": float(configuration.postgres_pool_timeout),
+    }
+
+
+def _configure_connection(
+    configuration: settings.BaseSettings,
+) -> Callable[[psycopg.Connection | psycopg.AsyncConnection], None]:
+    size = int(configuration.postgres_statement_cache_size)
+    threshold = int(configuration.postgres_prepare_threshold)
+
+    def configure(con: psycopg.Connection | psycopg.AsyncConnection) -> None:
+        con.prepare_threshold = threshold if threshold >= 0 else None
+        if size > 0:
+            con.prepared_max = size
+
+    return configure
+
+
+def _pool_stats(current: Dict[str, int]) -> model.PoolStats:
+    return model.PoolStats(
+        min_size=current.get("pool_min", 0),
+        max_size=current.get("pool_max", 0),
+        size=current.get("pool_size", 0),
+        available=current.get("pool_available", 0),
+        waiting=current.get("requests_waiting", 0),
+        requests=current.get("requests_num", 0),
+        requests_queued=current.get("requests_queued", 0),
+        requests_wait_ms=current.get("requests_wait_ms", 0),
+        requests_errors=current.get("requests_errors", 0),
+    )
 
 
 class PsycopgSession(model.Session):
@@ -10,45 +72,355 @@ class PsycopgSession(model.Session):
     _connection: psycopg.Connection
 
     def commit(self) -> None:
-        self._connection.commit()
+        if self.acquired:
+            self._connection.commit()
 
     def atomic_execute(
-        self, query: str, params: Tuple[str, ...] | None = None
+        self,
+        query: str,
+        params: Tuple[str, ...] | None = None,
+        prepare: bool | None = None,
     ) -> object:
-        return self._session.execute(query=cast(LiteralString, query), params=params)
+        cursor = cast(psycopg.Cursor, self._acquired_session())
+        return cursor.execute(
+            query=cast(LiteralString, query),
+            params=params,
+            prepare=prepare if self.prepare_statements else None,
+        )
+
+    def copy_rows(self, query: str, rows: Iterable[Tuple[Any, ...]]) -> int:
+        written = 0
+        cursor = cast(psycopg.Cursor, self._acquired_session())
+        with cursor.copy(cast(LiteralString, query)) as copy:
+            for row in rows:
+                copy.write_row(row)
+                written += 1
+        return written
 
     def rollback(self) -> None:
-        self._connection.rollback()
+        if self.acquired:
+            self._connection.rollback()
 
     def flush(self) -> None:
-        getattr(self._connection, "flush", lambda: None)()
+        if self.acquired:
+            getattr(self._connection, "flush", lambda: None)()
 
 
 class PsycopgUOW(model.UOW):
     _con_data: str
-
-    con: psycopg.Connection
+    _configure: Callable[[psycopg.Connection | psycopg.AsyncConnection], None]
 
     def __init__(self, *args, **kwargs) -> None:
         kwargs["session_factory"] = PsycopgSession
         super().__init__(*args, **kwargs)
-        self._con_data = "postgresql://{user}:{password}@{host}:{port}/{dbname}".format(
-            dbname=self.configuration.postgres_dbname,
-            user=self.configuration.postgres_username,
-            password=self.configuration.postgres_password,
-            host=self.configuration.postgres_host,
-            port=self.configuration.postgres_port,
-        )
+        self._con_data = _conninfo(self.configuration)
+        self._configure = _configure_connection(self.configuration)
 
-    def _open(self) -> Tuple[object, object]:
-        self.con = psycopg.connect(conninfo=self._con_data)
-        cur = self.con.cursor()
+    def _open(self, read_only: bool = False) -> Tuple[object, object]:
+        con = psycopg.connect(conninfo=self._con_data, autocommit=read_only)
+        self._configure(con)
         self.logger.info("Opened connection to PostgreSQL")
-        return self.con, cur
+        return con, con.cursor()
 
     def _close(self, session: object | None) -> None:
         if not session:
             return
-        getattr(session, "close")()
-        self.con.close()
+        cursor = cast(psycopg.Cursor, session)
+        con = cursor.connection
+        cursor.close()
+        con.close()
         self.logger.info("Closed connection to PostgreSQL")
+
+    def _open_replica(self, chosen: replica.Replica) -> Tuple[object, object]:
+        con = psycopg.connect(conninfo=chosen.conninfo, autocommit=True)
+        self._configure(con)
+        self.logger.info(f"Opened connection to PostgreSQL {chosen.name}")
+        return con, con.cursor()
+
+    def _replica_lag(self, chosen: replica.Replica) -> float | None:
+        try:
+            with psycopg.connect(conninfo=chosen.conninfo, autocommit=True) as con:
+                found = con.execute(_REPLICA_LAG_QUERY).fetchone()
+        except psycopg.Error as error:
+            self.logger.warning(f"Lag check of {chosen.name} failed - {error}")
+            return None
+        return float(found[0]) if found else None
+
+
+class PsycopgPoolUOW(PsycopgUOW):
+    pool: psycopg_pool.ConnectionPool
+    replica_pools: Dict[str, psycopg_pool.ConnectionPool]
+
+    persistent_connections = True
+
+    _replica_lock: threading.Lock
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.pool = psycopg_pool.ConnectionPool(
+            conninfo=self._con_data,
+            check=psycopg_pool.ConnectionPool.check_connection,
+            configure=self._configure,
+            name="uow",
+            open=False,
+            **_pool_kwargs(self.configuration),
+        )
+        self.replica_pools = {}
+        self._replica_lock = threading.Lock()
+
+    def _replica_pool(self, chosen: replica.Replica) -> psycopg_pool.ConnectionPool:
+        with self._replica_lock:
+            pool = self.replica_pools.get(chosen.name)
+            if pool is None:
+                pool = psycopg_pool.ConnectionPool(
+                    conninfo=chosen.conninfo,
+                    check=psycopg_pool.ConnectionPool.check_connection,
+                    configure=self._configure,
+                    name=f"uow-{chosen.name}",
+                    open=False,
+                    **_pool_kwargs(self.configuration),
+                )
+                self.replica_pools[chosen.name] = pool
+            if pool.closed:
+                pool.open()
+                self.logger.info(f"Opened PostgreSQL connection pool {chosen.name}")
+        return pool
+
+    def _open_replica(self, chosen: replica.Replica) -> Tuple[object, object]:
+        con = self._replica_pool(chosen).getconn()
+        con.autocommit = True
+        return con, con.cursor()
+
+    def _close_replica(self, chosen: replica.Replica, session: object | None) -> None:
+        if not session:
+            return
+        cursor = cast(psycopg.Cursor, session)
+        con = cursor.connection
+        cursor.close()
+        self._replica_pool(chosen).putconn(con)
+
+    def _replica_lag(self, chosen: replica.Replica) -> float | None:
+        try:
+            with self._replica_pool(chosen).connection() as con:
+                found = con.execute(_REPLICA_LAG_QUERY).fetchone()
+        except psycopg.Error as error:
+            self.logger.warning(f"Lag check of {chosen.name} failed - {error}")
+            return None
+        return float(found[0]) if found else None
+
+    def _open(self, read_only: bool = False) -> Tuple[object, object]:
+        if self.pool.closed:
+            self.pool.open()
+            self.logger.info("Opened PostgreSQL connection pool")
+        con = self.pool.getconn()
+        con.autocommit = read_only
+        return con, con.cursor()
+
+    def _close(self, session: object | None) -> None:
+        if not session:
+            return
+        cursor = cast(psycopg.Cursor, session)
+        con = cursor.connection
+        cursor.close()
+        if con.info.transaction_status != psycopg.pq.TransactionStatus.IDLE:
+            con.rollback()
+        self.pool.putconn(con)
+
+    def stats(self) -> model.PoolStats:
+        return _pool_stats(self.pool.get_stats())
+
+    def close(self) -> None:
+        for name, pool in self.replica_pools.items():
+            if not pool.closed:
+                pool.close()
+                self.logger.info(f"Closed PostgreSQL connection pool {name}")
+        if self.pool.closed:
+            return
+        self.pool.close()
+        self.logger.info("Closed PostgreSQL connection pool")
+
+
+# Async
+
+
+class AsyncPsycopgSession(model.AsyncSession):
+    _session: psycopg.AsyncCursor
+    _connection: psycopg.AsyncConnection
+
+    async def commit(self) -> None:
+        if self.acquired:
+            await self._connection.commit()
+
+    async def atomic_execute(
+        self,
+        query: str,
+        params: Tuple[str, ...] | None = None,
+        prepare: bool | None = None,
+    ) -> object:
+        cursor = cast(psycopg.AsyncCursor, await self._acquired_session())
+        return await cursor.execute(
+            query=cast(LiteralString, query),
+            params=params,
+            prepare=prepare if self.prepare_statements else None,
+        )
+
+    async def copy_rows(self, query: str, rows: Iterable[Tuple[Any, ...]]) -> int:
+        written = 0
+        cursor = cast(psycopg.AsyncCursor, await self._acquired_session())
+        async with cursor.copy(cast(LiteralString, query)) as copy:
+            for row in rows:
+                await copy.write_row(row)
+                written += 1
+        return written
+
+    async def rollback(self) -> None:
+        if self.acquired:
+            await self._connection.rollback()
+
+    async def flush(self) -> None:
+        return None
+
+
+class AsyncPsycopgUOW(model.AsyncUOW):
+    _con_data: str
+    _configure: Callable[[psycopg.Connection | psycopg.AsyncConnection], None]
+
+    def __init__(self, *args, **kwargs) -> None:
+        kwargs["session_factory"] = AsyncPsycopgSession
+        super().__init__(*args, **kwargs)
+        self._con_data = _conninfo(self.configuration)
+        self._configure = _configure_connection(self.configuration)
+
+    async def _open(self, read_only: bool = False) -> Tuple[object, object]:
+        con = await psycopg.AsyncConnection.connect(
+            conninfo=self._con_data, autocommit=read_only
+        )
+        self._configure(con)
+        self.logger.info("Opened async connection to PostgreSQL")
+        return con, con.cursor()
+
+    async def _close(self, session: object | None) -> None:
+        if not session:
+            return
+        cursor = cast(psycopg.AsyncCursor, session)
+        con = cursor.connection
+        await cursor.close()
+        await con.close()
+        self.logger.info("Closed async connection to PostgreSQL")
+
+    async def _open_replica(self, chosen: replica.Replica) -> Tuple[object, object]:
+        con = await psycopg.AsyncConnection.connect(
+            conninfo=chosen.conninfo, autocommit=True
+        )
+        self._configure(con)
+        self.logger.info(f"Opened async connection to PostgreSQL {chosen.name}")
+        return con, con.cursor()
+
+    async def _replica_lag(self, chosen: replica.Replica) -> float | None:
+        try:
+            async with await psycopg.AsyncConnection.connect(
+                conninfo=chosen.conninfo, autocommit=True
+            ) as con:
+                found = await (await con.execute(_REPLICA_LAG_QUERY)).fetchone()
+        except psycopg.Error as error:
+            self.logger.warning(f"Lag check of {chosen.name} failed - {error}")
+            return None
+        return float(found[0]) if found else None
+
+
+class AsyncPsycopgPoolUOW(AsyncPsycopgUOW):
+    pool: psycopg_pool.AsyncConnectionPool
+    replica_pools: Dict[str, psycopg_pool.AsyncConnectionPool]
+
+    persistent_connections = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.pool = psycopg_pool.AsyncConnectionPool(
+            conninfo=self._con_data,
+            check=psycopg_pool.AsyncConnectionPool.check_connection,
+            configure=self._configure_async,
+            name="async_uow",
+            open=False,
+            **_pool_kwargs(self.configuration),
+        )
+        self.replica_pools = {}
+
+    async def _replica_pool(
+        self, chosen: replica.Replica
+    ) -> psycopg_pool.AsyncConnectionPool:
+        pool = self.replica_pools.get(chosen.name)
+        if pool is None:
+            pool = self.replica_pools.setdefault(
+                chosen.name,
+                psycopg_pool.AsyncConnectionPool(
+                    conninfo=chosen.conninfo,
+                    check=psycopg_pool.AsyncConnectionPool.check_connection,
+                    configure=self._configure_async,
+                    name=f"async_uow-{chosen.name}",
+                    open=False,
+                    **_pool_kwargs(self.configuration),
+                ),
+            )
+        if pool.closed:
+            await pool.open()
+            self.logger.info(f"Opened async PostgreSQL connection pool {chosen.name}")
+        return pool
+
+    async def _open_replica(self, chosen: replica.Replica) -> Tuple[object, object]:
+        con = await (await self._replica_pool(chosen)).getconn()
+        await con.set_autocommit(True)
+        return con, con.cursor()
+
+    async def _close_replica(
+        self, chosen: replica.Replica, session: object | None
+    ) -> None:
+        if not session:
+            return
+        cursor = cast(psycopg.AsyncCursor, session)
+        con = cursor.connection
+        await cursor.close()
+        await (await self._replica_pool(chosen)).putconn(con)
+
+    async def _replica_lag(self, chosen: replica.Replica) -> float | None:
+        try:
+            async with (await self._replica_pool(chosen)).connection() as con:
+                found = await (await con.execute(_REPLICA_LAG_QUERY)).fetchone()
+        except psycopg.Error as error:
+            self.logger.warning(f"Lag check of {chosen.name} failed - {error}")
+            return None
+        return float(found[0]) if found else None
+
+    async def _configure_async(self, con: psycopg.AsyncConnection) -> None:
+        self._configure(con)
+
+    async def _open(self, read_only: bool = False) -> Tuple[object, object]:
+        if self.pool.closed:
+            await self.pool.open()
+            self.logger.info("Opened async PostgreSQL connection pool")
+        con = await self.pool.getconn()
+        await con.set_autocommit(read_only)
+        return con, con.cursor()
+
+    async def _close(self, session: object | None) -> None:
+        if not session:
+            return
+        cursor = cast(psycopg.AsyncCursor, session)
+        con = cursor.connection
+        await cursor.close()
+        if con.info.transaction_status != psycopg.pq.TransactionStatus.IDLE:
+            await con.rollback()
+        await self.pool.putconn(con)
+
+    def stats(self) -> model.PoolStats:
+        return _pool_stats(self.pool.get_stats())
+
+    async def close(self) -> None:
+        for name, pool in self.replica_pools.items():
+            if not pool.closed:
+                await pool.close()
+                self.logger.info(f"Closed async PostgreSQL connection pool {name}")
+        if self.pool.closed:
+            return
+        await self.pool.close()
+        self.logger.info("Closed async PostgreSQL connection pool")
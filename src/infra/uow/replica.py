@@ -0,0 +1,145 @@
+import threading
+import time
+from typing import Callable, Dict, List, Set, Tuple
+
+import pydantic
+
+from src import settings
+
+
+class ReplicaStats(pydantic.BaseModel):
+    name: str
+    active: int = 0
+    acquired: int = 0
+    healthy: bool = True
+    lag_seconds: float | None = None
+
+
+class Replica:
+    name: str
+    conninfo: str
+    active: int
+    acquired: int
+    healthy: bool
+    lag_seconds: float | None
+    checked_at: float
+
+    def __init__(self, name: str, conninfo: str) -> None:
+        self.name = name
+        self.conninfo = conninfo
+        self.active = 0
+        self.acquired = 0
+        self.healthy = True
+        self.lag_seconds = None
+        self.checked_at = float("-inf")
+
+
+class ReplicaRouter:
+    replicas: List[Replica]
+    max_lag: float
+    lag_interval: float
+
+    _choose: Callable[["ReplicaRouter", List[Replica]], Replica]
+    _next: int
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        replicas: List[Replica],
+        balancing: str = "round-robin",
+        max_lag: float = 0.0,
+        lag_interval: float = 5.0,
+    ) -> None:
+        if balancing not in _balancers:
+            raise ValueError(f"Replica balancing {balancing} not valid")
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.lag_interval = lag_interval
+        self._choose = _balancers[balancing]
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _stale(self, replica: Replica, now: float) -> bool:
+        return self.max_lag > 0 and now - replica.checked_at >= self.lag_interval
+
+    def _lease(self, replica: Replica) -> Replica:
+        replica.active += 1
+        replica.acquired += 1
+        return replica
+
+    def pick(self, excluding: Set[str]) -> Tuple[Replica | None, bool]:
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                replica
+                for replica in self.replicas
+                if replica.name not in excluding
+                and (replica.healthy or self._stale(replica, now))
+            ]
+            if not candidates:
+                return None, False
+            replica = self._choose(self, candidates)
+            if self._stale(replica, now):
+                replica.checked_at = now
+                return replica, True
+            return self._lease(replica), False
+
+    def checked(self, replica: Replica, lag_seconds: float | None) -> bool:
+        with self._lock:
+            replica.lag_seconds = lag_seconds
+            replica.healthy = lag_seconds is not None and lag_seconds <= self.max_lag
+            if replica.healthy:
+                self._lease(replica)
+            return replica.healthy
+
+    def release(self, replica: Replica) -> None:
+        with self._lock:
+            replica.active -= 1
+
+    def stats(self) -> List[ReplicaStats]:
+        with self._lock:
+            return [
+                ReplicaStats(
+                    name=replica.name,
+                    active=replica.active,
+                    acquired=replica.acquired,
+                    healthy=replica.healthy,
+                    lag_seconds=replica.lag_seconds,
+                )
+                for replica in self.replicas
+            ]
+
+
+def _round_robin(router: ReplicaRouter, candidates: List[Replica]) -> Replica:
+    replica = candidates[router._next % len(candidates)]
+    router._next += 1
+    return replica
+
+
+def _least_connections(router: ReplicaRouter, candidates: List[Replica]) -> Replica:
+    return min(candidates, key=lambda replica: replica.active)
+
+
+_balancers: Dict[str, Callable[[ReplicaRouter, List[Replica]], Replica]] = {
+    "round-robin": _round_robin,
+    "least-connections": _least_connections,
+}
+
+
+def build_router(configuration: settings.BaseSettings) -> ReplicaRouter | None:
+    conninfos = [
+        conninfo.strip()
+        for conninfo in str(configuration.postgres_replicas).split(",")
+        if conninfo.strip()
+    ]
+    if not conninfos:
+        return None
+    return ReplicaRouter(
+        replicas=[
+            Replica(name=f"replica-{position}", conninfo=conninfo)
+            for position, conninfo in enumerate(conninfos)
+        ],
+        balancing=configuration.postgres_replica_balancing,
+        max_lag=float(configuration.postgres_replica_max_lag),
+        lag_interval=float(configuration.postgres_replica_lag_interval),
+    )
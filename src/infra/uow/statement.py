@@ -0,0 +1,68 @@
+import collections
+import threading
+from typing import Callable, Hashable
+
+import pydantic
+
+
+class StatementCacheStats(pydantic.BaseModel):
+    size: int = 0
+    entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
+
+class StatementCache:
+    size: int
+
+    _statements: collections.OrderedDict[Hashable, str]
+    _lock: threading.Lock
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._statements = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, build: Callable[[], str]) -> str:
+        with self._lock:
+            statement = self._statements.get(key)
+            if statement is not None:
+                self._statements.move_to_end(key)
+                self._hits += 1
+                return statement
+            self._misses += 1
+
+        statement = build()
+
+        with self._lock:
+            self._statements[key] = statement
+            self._statements.move_to_end(key)
+            while len(self._statements) > self.size:
+                self._statements.popitem(last=False)
+                self._evictions += 1
+        return statement
+
+    def clear(self) -> None:
+        with self._lock:
+            self._statements.clear()
+
+    def stats(self) -> StatementCacheStats:
+        with self._lock:
+            return StatementCacheStats(
+                size=self.size,
+                entries=len(self._statements),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
@@ -20,9 +20,12 @@ from src.infra.filter import filter_builder
 from src.infra.http import request as request_http
 from src.infra.jwt import request as jwt_request
 from src.infra.log import request as request_logger
+from src.infra.membership_cache import request as membership_cache_request
 from src.infra.migrator import request as migrator_request
+from src.infra.password import request as password_hasher_request
 from src.infra.server import model as model_server
 from src.infra.server import request as server_request
+from src.infra.uow import async_request as async_uow_request
 from src.infra.uow import request as uow_request
 
 log = getLogger(__name__)
@@ -33,7 +36,7 @@ apps: List[domain.DomainFactory] = [
 ]
 
 
-def _build() -> Dict[str, Any]:
+def _build(prepare: bool = True) -> Dict[str, Any]:
     dependencies: Dict[str, Any] = {}
     configuration = build_configuration()
 
@@ -58,10 +61,22 @@ def _build() -> Dict[str, Any]:
         dependencies=dependencies
     )
 
+    dependencies["async_uow"] = build_async_uow_adapter(
+        configuration
+    ).selected_with_configuration(dependencies=dependencies)
+
     dependencies["migrator"] = build_migrator_adapter(
         configuration
     ).selected_with_configuration(dependencies=dependencies)
 
+    dependencies["membership_cache"] = build_membership_cache_adapter(
+        configuration
+    ).selected_with_configuration(dependencies=dependencies)
+
+    dependencies["password_hasher"] = build_password_hasher_adapter(
+        configuration
+    ).selected_with_configuration(dependencies=dependencies)
+
     dependencies["filter_builder"] = filter_builder
 
     dependencies["repository_getter"] = build_repository_getter(
@@ -84,8 +99,9 @@ def _build() -> Dict[str, Any]:
 
     integrate_cli_entrypoints(dependencies=dependencies, configuration=configuration)
 
-    execute_migrations(dependencies=dependencies, configuration=configuration)
-    execute_pre_scripts(dependencies=dependencies, configuration=configuration)
+    if prepare:
+        execute_migrations(dependencies=dependencies, configuration=configuration)
+        execute_pre_scripts(dependencies=dependencies, configuration=configuration)
 
     return dependencies
 
@@ -95,6 +111,17 @@ def generate_http_server() -> model_server.ServerAdapter:
     return dependencies["server"]
 
 
+def generate_http_app() -> Any:
+    dependencies = _build()
+    return dependencies["http"].execute().instance
+
+
+def generate_http_worker_app() -> Any:
+    # Prefork workers, the supervisor already ran migrations and pre-scripts
+    dependencies = _build(prepare=False)
+    return dependencies["http"].execute().instance
+
+
 def generate_cli_server() -> model_cli.AppCLI:
     dependencies = _build()
     return dependencies["cli"].execute()
@@ -222,6 +249,16 @@ def build_uow_adapter(configuration: settings.BaseSettings) -> base_infra.InfraB
     )
 
 
+def build_async_uow_adapter(
+    configuration: settings.BaseSettings,
+) -> base_infra.InfraBase:
+    return base_infra.InfraBase(
+        request=async_uow_request,
+        logger_adapter=log,
+        configurations=configuration,
+    )
+
+
 def build_migrator_adapter(
     configuration: settings.BaseSettings,
 ) -> base_infra.InfraBase:
@@ -232,6 +269,26 @@ def build_migrator_adapter(
     )
 
 
+def build_membership_cache_adapter(
+    configuration: settings.BaseSettings,
+) -> base_infra.InfraBase:
+    return base_infra.InfraBase(
+        request=membership_cache_request,
+        logger_adapter=log,
+        configurations=configuration,
+    )
+
+
+def build_password_hasher_adapter(
+    configuration: settings.BaseSettings,
+) -> base_infra.InfraBase:
+    return base_infra.InfraBase(
+        request=password_hasher_request,
+        logger_adapter=log,
+        configurations=configuration,
+    )
+
+
 def build_repository_getter(
     configuration: settings.BaseSettings,
     dependencies: Dict[str, Any],
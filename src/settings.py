@@ -1,5 +1,6 @@
 import datetime
 import enum
+import os
 import pathlib
 from typing import Any, Dict
 
@@ -33,6 +34,35 @@ class BaseSettings:
     host: str = "0.0.0.0"
     port: int = 3030
 
+    # Uvicorn tuning, server_loop is "auto", "uvloop" or "asyncio" and
+    # server_http is "auto", "httptools" or "h11", "auto" picks the accelerated
+    # one when installed. A worker exits after server_limit_max_requests and
+    # the prefork server replaces it, the single process server ignores it as
+    # nothing would restart it. Over server_limit_concurrency connections the
+    # server answers 503, 0 disables them
+    server_loop: str = "auto"
+    server_http: str = "auto"
+    server_backlog: int = 2048
+    server_timeout_keep_alive: int = 5
+    server_limit_concurrency: int = 0
+    server_limit_max_requests: int = 0
+
+    # Prefork server, used when server_provider is "uvicorn-prefork". Forks
+    # server_workers processes (0 uses one per CPU) sharing the listen socket,
+    # with server_preload the app is built once in the parent and shared
+    # copy-on-write, otherwise each worker calls server_app_factory, which
+    # builds the app without running migrations or pre-scripts again. SIGHUP
+    # replaces the workers one at a time
+    server_workers: int = 0
+    server_preload: bool = True
+    server_app_factory: str = "src.main:generate_http_worker_app"
+    server_graceful_timeout: float = 30.0
+
+    # Http dispatch, "event-loop" awaits commands on the server loop and
+    # "thread-pool" runs blocking commands in a bounded pool of threads
+    http_dispatch_mode: str = "event-loop"
+    http_dispatch_pool_size: int = 16
+
     # Documentation URL for api if this is required
     docs_url: str = "/docs"
     prefix_api_url: str = "/api"
@@ -45,6 +75,20 @@ class BaseSettings:
     auth_access_token_secret: str = ""
     auth_refresh_token_secret: str = ""
 
+    # Verified access tokens are kept until they expire in a LRU of this size,
+    # 0 verifies every request
+    auth_token_cache_size: int = 4096
+
+    # Passwords are hashed with bcrypt at this cost in password_hasher_workers
+    # processes per server worker (0 splits the CPUs between them), at most
+    # password_hasher_max_concurrency hashes run at once (0 uses the workers)
+    # and password_hasher_max_waiting more wait for a slot before logins are
+    # rejected. Hashes with another cost are rehashed on login
+    password_hash_rounds: int = 12
+    password_hasher_workers: int = 0
+    password_hasher_max_concurrency: int = 0
+    password_hasher_max_waiting: int = 256
+
     # Logger Provider for message outputs system, it can configure
     # using different types of provider,
     # it depends on adapters that you have, this applies la configuration of that logger
@@ -54,9 +98,12 @@ class BaseSettings:
     server_provider: str
     jwt_provider: str
     uow_provider: str
+    async_uow_provider: str
     migrator_provider: str
     repository_provider: str
     cli_provider: str
+    membership_cache_provider: str
+    password_hasher_provider: str
 
     # Postgres Data
     postgres_port: str = "5432"
@@ -65,12 +112,59 @@ class BaseSettings:
     postgres_username: str = ""
     postgres_password: str = ""
 
+    # Primary conninfo, replaces the fields above when set
+    postgres_dsn: str = ""
+
+    # Read replicas, comma separated conninfo strings serving uow.read_session()
+    # balanced "round-robin" or "least-connections". Every
+    # postgres_replica_lag_interval seconds the replication lag is checked and
+    # replicas behind by more than postgres_replica_max_lag seconds are skipped,
+    # 0 disables the check. Reads fall back to the primary without replicas
+    postgres_replicas: str = ""
+    postgres_replica_balancing: str = "round-robin"
+    postgres_replica_max_lag: float = 5.0
+    postgres_replica_lag_interval: float = 5.0
+
+    # Postgres Pool, used when uow_provider is "psycopg-pool"
+    postgres_pool_min_size: int = 2
+    postgres_pool_max_size: int = 10
+    postgres_pool_max_idle: float = 600.0
+    postgres_pool_max_lifetime: float = 3600.0
+    postgres_pool_timeout: float = 30.0
+
+    # Prepared statements, repository SQL shapes are cached in a LRU of this size
+    # and, with the pooled uow providers, prepared once per connection, 0
+    # disables the cache. Other statements, and every statement on connections
+    # opened per session, are prepared after being executed prepare_threshold
+    # times, -1 disables it
+    postgres_statement_cache_size: int = 256
+    postgres_prepare_threshold: int = 5
+
+    # Bulk inserts of at least this many rows stream through COPY, smaller
+    # batches use a multi-row INSERT
+    postgres_copy_threshold: int = 500
+
+    # Task detail reads load only the last changes of the history, 0 loads all
+    task_detail_histories_limit: int = 0
+
+    # Board membership, the roles of the last membership_cache_size boards are
+    # kept for membership_cache_ttl seconds, 0 in any of them disables the cache.
+    # The cache lives in each process, so it is off with more than one worker
+    membership_cache_size: int = 1024
+    membership_cache_ttl: float = 30.0
+
     app_route: pathlib.Path = pathlib.Path(__file__).parent
 
     @property
     def has_debug(self) -> bool:
         return self.debug_level != "NONE"
 
+    @property
+    def server_processes(self) -> int:
+        if self.server_provider != "uvicorn-prefork":
+            return 1
+        return int(self.server_workers) or os.cpu_count() or 1
+
     def inject(self, data: Dict[str, Any]):
         for key, value in data.items():
             setattr(self, key, value)
@@ -88,9 +182,12 @@ class DevSettings(BaseSettings):
     server_provider = "uvicorn"
     jwt_provider = "pyjwt"
     uow_provider = "psycopg"
+    async_uow_provider = "psycopg-pool"
     migrator_provider = "psycopg"
     repository_provider = "psycopg"
     cli_provider = "cyclopts"
+    membership_cache_provider = "memory"
+    password_hasher_provider = "bcrypt-process-pool"
 
     postgres_dbname = "postgres"
     postgres_host = "db"
@@ -107,9 +204,12 @@ class ProdSettings(BaseSettings):
     server_provider = "uvicorn"
     jwt_provider = "pyjwt"
     uow_provider = "psycopg"
+    async_uow_provider = "psycopg-pool"
     migrator_provider = "psycopg"
     repository_provider = "psycopg"
     cli_provider = "cyclopts"
+    membership_cache_provider = "memory"
+    password_hasher_provider = "bcrypt-process-pool"
 
     postgres_dbname = "."
     postgres_host = "."
@@ -1,14 +1,15 @@
+import asyncio
 import datetime
-from unittest.mock import MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 from pydantic import SecretStr
 
 from src.app.security.domain import UserData, UserRepository
 from src.app.security.services import authentication as authentication_service
-from src.domain import libtools
 from src.infra.jwt.model import AuthJWT
 from src.infra.log.model import LogAdapter
+from src.infra.password.model import PasswordHasher
 
 
 @pytest.fixture
@@ -26,7 +27,18 @@ def mock_logger():
     return MagicMock(spec=LogAdapter)
 
 
-def test_authenticate_valid_user(mock_user_repository, mock_jwt, mock_logger):
+@pytest.fixture
+def mock_password_hasher():
+    password_hasher = MagicMock(spec=PasswordHasher)
+    password_hasher.verify = AsyncMock(return_value=True)
+    password_hasher.hash = AsyncMock(return_value="rehashed_password")
+    password_hasher.needs_rehash.return_value = False
+    return password_hasher
+
+
+def test_authenticate_valid_user(
+    mock_user_repository, mock_jwt, mock_logger, mock_password_hasher
+):
     username = "valid_user"
     email = "as@test.co"
     password = SecretStr("correct_password")
@@ -41,7 +53,6 @@ def test_authenticate_valid_user(mock_user_repository, mock_jwt, mock_logger):
     )
     _find_user_by_username = MagicMock(spec=UserData)
     _find_user_by_username.return_value = expect_user_data
-    libtools.check_password = MagicMock(spec=bool)
 
     mock_user_repository.by_username.return_value = expect_user_data
     mock_user_repository.by_email.return_value = expect_user_data
@@ -53,33 +64,85 @@ def test_authenticate_valid_user(mock_user_repository, mock_jwt, mock_logger):
         expiration="2025-07-15T01:00:00",
     )
 
-    result = authentication_service.authenticate(
-        jwt=mock_jwt,
-        user_repository=mock_user_repository,
-        email=email,
-        password=password,
-        logger=mock_logger,
+    result = asyncio.run(
+        authentication_service.authenticate(
+            jwt=mock_jwt,
+            user_repository=mock_user_repository,
+            email=email,
+            password=password,
+            logger=mock_logger,
+            password_hasher=mock_password_hasher,
+        )
     )
 
     assert result.status is True
     assert result.message == "Valid Authorization"
     assert result.type == "Bearer"
     assert result.access_token == "access_token"
+    mock_user_repository.update.assert_not_called()
+
+
+def test_authenticate_rehashes_outdated_password(
+    mock_user_repository, mock_jwt, mock_logger, mock_password_hasher
+):
+    email = "as@test.co"
+    password = SecretStr("correct_password")
+    user_data = UserData(
+        name="nn_name",
+        last_name="ll_name",
+        username="valid_user",
+        email=email,
+        id="id",
+        password=SecretStr("outdated_hash"),
+        permissions=["role:admin"],
+    )
+    user_data.mark_clean()
+    mock_user_repository.by_email.return_value = user_data
+    mock_password_hasher.needs_rehash.return_value = True
+    mock_jwt.encode.return_value = MagicMock(
+        type="Bearer",
+        access_token="access_token",
+        refresh_token="refresh_token",
+        generation="2025-07-15T00:00:00",
+        expiration="2025-07-15T01:00:00",
+    )
+
+    result = asyncio.run(
+        authentication_service.authenticate(
+            jwt=mock_jwt,
+            user_repository=mock_user_repository,
+            email=email,
+            password=password,
+            logger=mock_logger,
+            password_hasher=mock_password_hasher,
+        )
+    )
+
+    assert result.status is True
+    mock_password_hasher.hash.assert_awaited_once_with(password)
+    mock_user_repository.update.assert_called_once_with(id="id", to_update=user_data)
+    assert user_data.password.get_secret_value() == "rehashed_password"
+    assert user_data.dirty_fields == {"password"}
 
 
-def test_authenticate_invalid_email(mock_user_repository, mock_jwt, mock_logger):
+def test_authenticate_invalid_email(
+    mock_user_repository, mock_jwt, mock_logger, mock_password_hasher
+):
     email = "invalid@email.com"
     password = SecretStr("some_password")
 
     mock_user_repository.by_username.return_value = None
     mock_user_repository.by_email.return_value = None
 
-    result = authentication_service.authenticate(
-        jwt=mock_jwt,
-        user_repository=mock_user_repository,
-        email=email,
-        password=password,
-        logger=mock_logger,
+    result = asyncio.run(
+        authentication_service.authenticate(
+            jwt=mock_jwt,
+            user_repository=mock_user_repository,
+            email=email,
+            password=password,
+            logger=mock_logger,
+            password_hasher=mock_password_hasher,
+        )
     )
 
     assert result.status is False
@@ -87,7 +150,9 @@ def test_authenticate_invalid_email(mock_user_repository, mock_jwt, mock_logger)
     mock_logger.warning.assert_called_once_with("User invalid@email.com not found")
 
 
-def test_authenticate_invalid_password(mock_user_repository, mock_jwt, mock_logger):
+def test_authenticate_invalid_password(
+    mock_user_repository, mock_jwt, mock_logger, mock_password_hasher
+):
     username = "valid_user"
     email = "as@test.co"
     password = SecretStr("wrong_password")
@@ -101,17 +166,21 @@ def test_authenticate_invalid_password(mock_user_repository, mock_jwt, mock_logg
         permissions=["role:admin"],
     )
     user_data = MagicMock(spec=UserData)
-    user_data.is_auth.return_value = False
+    user_data.password = SecretStr("hashed_password")
+    mock_password_hasher.verify.return_value = False
 
     mock_user_repository.by_username.return_value = user_data
     mock_user_repository.by_email.return_value = user_data
 
-    result = authentication_service.authenticate(
-        jwt=mock_jwt,
-        user_repository=mock_user_repository,
-        email=email,
-        password=password,
-        logger=mock_logger,
+    result = asyncio.run(
+        authentication_service.authenticate(
+            jwt=mock_jwt,
+            user_repository=mock_user_repository,
+            email=email,
+            password=password,
+            logger=mock_logger,
+            password_hasher=mock_password_hasher,
+        )
     )
 
     assert result.status is False
@@ -119,7 +188,9 @@ def test_authenticate_invalid_password(mock_user_repository, mock_jwt, mock_logg
     mock_logger.warning.assert_called_once_with("User as@test.co not authenticated")
 
 
-def test_authenticate_jwt_encoding_error(mock_user_repository, mock_jwt, mock_logger):
+def test_authenticate_jwt_encoding_error(
+    mock_user_repository, mock_jwt, mock_logger, mock_password_hasher
+):
     username = "valid_user"
     email = "as@test.co"
     password = SecretStr("correct_password")
@@ -140,12 +211,15 @@ def test_authenticate_jwt_encoding_error(mock_user_repository, mock_jwt, mock_lo
     mock_jwt.encode.side_effect = Exception("JWT encoding error")
 
     with pytest.raises(Exception, match="JWT encoding error"):
-        authentication_service.authenticate(
-            jwt=mock_jwt,
-            user_repository=mock_user_repository,
-            email=email,
-            password=password,
-            logger=mock_logger,
+        asyncio.run(
+            authentication_service.authenticate(
+                jwt=mock_jwt,
+                user_repository=mock_user_repository,
+                email=email,
+                password=password,
+                logger=mock_logger,
+                password_hasher=mock_password_hasher,
+            )
         )
 
 
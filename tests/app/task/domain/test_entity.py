@@ -96,6 +96,19 @@ class TestTaskStatusChanges:
         assert history.new_values["status"] == new_status.value
 
 
+class TestTaskDirtyFields:
+    def test_untracked_until_marked_clean(self, basic_task):
+        basic_task.change_status(subject.TaskStatus.DOING)
+        assert basic_task.dirty_fields is None
+
+    def test_tracks_changed_columns(self, basic_task):
+        basic_task.mark_clean()
+        basic_task.change_status(subject.TaskStatus.DOING)
+        basic_task.update(description=basic_task.description)
+        basic_task.change_owner("other-user")
+        assert basic_task.dirty_fields == {"status", "user_id"}
+
+
 class TestTaskUpdates:
     @pytest.fixture
     def updatable_task(self):
@@ -226,3 +239,104 @@ class TestAddMember:
         board.members.append(regular_member)
         with pytest.raises(subject.HasAlreadyIsMemberError):
             board.add_member(regular_member, member_that_update="admin-user")
+
+
+class TestBoardIndexes:
+    @pytest.fixture
+    def board(self):
+        return subject.Board.create(
+            id="board-1", name="Board", description="Description", user_id="admin"
+        )
+
+    def test_member_index_follows_mutators(self, board):
+        member = subject.BoardMember(user_id="viewer", board_id="board-1")
+
+        board.add_member(member, member_that_update="admin")
+        assert board.is_member(member)
+        assert board.get_member_by_user_id("viewer") is member
+
+        board.update_role_member(
+            member_that_update="admin",
+            member_id="viewer",
+            role=subject.RoleMemberType.ADMIN,
+        )
+        assert board.is_admin("viewer")
+
+        board.remove_member(member, member_that_update="admin")
+        assert not board.is_member(member)
+        assert [current.user_id for current in board.members] == ["admin"]
+        with pytest.raises(subject.IsNotMemberofBoardError):
+            board.get_member_by_user_id("viewer")
+
+    def test_indexes_rebuild_when_lists_change_outside(self, board):
+        assert board.is_admin("admin")
+
+        board.members = [
+            subject.BoardMember(
+                user_id="other", board_id="board-1", role=subject.RoleMemberType.ADMIN
+            )
+        ]
+        assert not board.is_admin("admin")
+        assert board.is_admin("other")
+
+        board.members = [
+            *board.members,
+            subject.BoardMember(user_id="late", board_id="board-1"),
+        ]
+        assert board.get_member_by_user_id("late").role == (
+            subject.RoleMemberType.VIEWER
+        )
+
+    def test_indexes_follow_replaced_lists_of_the_same_size(self, board):
+        task = subject.Task.create(
+            id="task-1",
+            name="Task",
+            description="Description",
+            owner="admin",
+            board_id="board-1",
+            priority=subject.PriorityType.LOW,
+        )
+        board.add_task(task, member_that_insert="admin")
+        assert board.has_task("task-1")
+
+        board.tasks = [task.model_copy(update={"id": "task-2"})]
+
+        assert not board.has_task("task-1")
+        assert board.has_task("task-2")
+
+    def test_duplicated_members_and_tasks_are_rejected(self, board):
+        with pytest.raises(subject.HasAlreadyIsMemberError):
+            board.inject_member(
+                subject.BoardMember(user_id="admin", board_id="board-1")
+            )
+        task = subject.Task.create(
+            id="task-1",
+            name="Task",
+            description="Description",
+            owner="admin",
+            board_id="board-1",
+            priority=subject.PriorityType.LOW,
+        )
+        board.add_task(task, member_that_insert="admin")
+        with pytest.raises(ValueError):
+            board.add_task(task, member_that_insert="admin")
+
+        assert [member.user_id for member in board.members] == ["admin"]
+        assert [current.id for current in board.tasks] == ["task-1"]
+
+    def test_task_index_follows_add_task(self, board):
+        task = subject.Task.create(
+            id="task-1",
+            name="Task",
+            description="Description",
+            owner="admin",
+            board_id="board-1",
+            priority=subject.PriorityType.LOW,
+        )
+
+        board.add_task(task, member_that_insert="admin")
+
+        assert board.has_task("task-1")
+        assert board.get_task_by_id("task-1") is task
+        with pytest.raises(ValueError):
+            board.get_task_by_id("task-2")
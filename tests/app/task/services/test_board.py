@@ -7,8 +7,8 @@ from src.app.task.domain import entity as entity_domain
 from src.app.task.domain import entity as entity_repository
 from src.app.task.domain import repository as domain_repository
 from src.app.task.services import board as board_services
+from src.domain.models import entity as domain_entity
 from src.domain.models import repository as repository_model
-from src.domain.models.repository import RepositoryNotFoundError
 from src.infra.log.model import LogAdapter
 
 # Test Environments
@@ -43,76 +43,46 @@ def mock_logger():
 
 
 class TestGetBoardById:
-    def test_success(
-        self, mock_board, mock_board_repository, mock_ownership_repository
-    ):
-        mock_board_repository.get_by_id.return_value = mock_board
-        mock_ownership_repository.get_by_board_id.return_value = [
-            domain_repository.OwnerShipRepositoryData(
-                id="",
-                user_id=VALID_USER_ID,
-                board_id=VALID_BOARD_ID,
-                role=entity_repository.RoleMemberType.VIEWER,
-            )
-        ]
+    def test_success(self, mock_board, mock_board_repository):
+        mock_board_repository.get_aggregate_by_id.return_value = mock_board
 
-        result = board_services.get_board_by_id(
-            VALID_BOARD_ID, mock_board_repository, mock_ownership_repository
-        )
+        result = board_services.get_board_by_id(VALID_BOARD_ID, mock_board_repository)
 
         assert result == mock_board
-        mock_board.inject_member.assert_called_with(
-            member=entity_repository.BoardMember(
-                user_id=VALID_USER_ID,
-                board_id=VALID_BOARD_ID,
-                role=entity_repository.RoleMemberType.VIEWER,
-            )
+        mock_board_repository.get_aggregate_by_id.assert_called_once_with(
+            id=VALID_BOARD_ID, with_tasks=False
         )
+        mock_board_repository.get_by_id.assert_not_called()
 
-    def test_not_found(self, mock_board_repository, mock_ownership_repository):
-        mock_board_repository.get_by_id.side_effect = RepositoryNotFoundError
+    def test_not_found(self, mock_board_repository):
+        mock_board_repository.get_aggregate_by_id.return_value = None
 
-        result = board_services.get_board_by_id(
-            "invalid_id", mock_board_repository, mock_ownership_repository
-        )
+        result = board_services.get_board_by_id("invalid_id", mock_board_repository)
 
         assert result is None
 
-    def test_no_owners(
-        self, mock_board, mock_board_repository, mock_ownership_repository
-    ):
-        mock_board_repository.get_by_id.return_value = mock_board
-        mock_ownership_repository.get_by_board_id.return_value = []
+    def test_with_tasks(self, mock_board, mock_board_repository):
+        mock_board_repository.get_aggregate_by_id.return_value = mock_board
 
         result = board_services.get_board_by_id(
-            VALID_BOARD_ID, mock_board_repository, mock_ownership_repository
+            VALID_BOARD_ID, mock_board_repository, with_tasks=True
         )
 
         assert result == mock_board
-        mock_board.add_member.assert_not_called()
+        mock_board_repository.get_aggregate_by_id.assert_called_once_with(
+            id=VALID_BOARD_ID, with_tasks=True
+        )
 
 
 class TestGetMyselfBoardById:
-    def test_success(
-        self, mock_board, mock_board_repository, mock_ownership_repository
-    ):
+    def test_success(self, mock_board, mock_board_repository):
         mock_board.is_member.return_value = True
-        mock_board_repository.get_by_id.return_value = mock_board
-
-        mock_ownership_repository.get_by_board_id.return_value = [
-            domain_repository.OwnerShipRepositoryData(
-                id="",
-                user_id=VALID_USER_ID,
-                board_id="",
-                role=entity_repository.RoleMemberType.VIEWER,
-            )
-        ]
+        mock_board_repository.get_aggregate_by_id.return_value = mock_board
 
         result = board_services.get_myself_board_by_id(
             user_id=VALID_USER_ID,
             board_id=VALID_BOARD_ID,
             repository_board=mock_board_repository,
-            repository_ownership=mock_ownership_repository,
         )
 
         assert result == mock_board
@@ -124,27 +94,15 @@ class TestGetMyselfBoardById:
             )
         )
 
-    def test_not_member(
-        self, mock_board, mock_board_repository, mock_ownership_repository
-    ):
+    def test_not_member(self, mock_board, mock_board_repository):
         mock_board.is_member.return_value = False
-        mock_board_repository.get_by_id.return_value = mock_board
-
-        mock_ownership_repository.get_by_board_id.return_value = [
-            domain_repository.OwnerShipRepositoryData(
-                id="",
-                user_id="invalid_user_id",
-                board_id="",
-                role=entity_repository.RoleMemberType.VIEWER,
-            )
-        ]
+        mock_board_repository.get_aggregate_by_id.return_value = mock_board
 
         with pytest.raises(ValueError, match="Board not found"):
             board_services.get_myself_board_by_id(
                 user_id=VALID_USER_ID,
                 board_id=VALID_BOARD_ID,
                 repository_board=mock_board_repository,
-                repository_ownership=mock_ownership_repository,
             )
 
 
@@ -161,9 +119,7 @@ class TestCreateBoard:
         self, mock_board_repository, mock_ownership_repository, mock_logger
     ):
         payload = self.get_create_board_payload()
-        mock_board_repository.get_by_id.return_value = None
-
-        mock_ownership_repository.get_by_board_id.return_value = []
+        mock_board_repository.get_aggregate_by_id.return_value = None
 
         result = board_services.create_board(
             payload=payload,
@@ -187,18 +143,18 @@ class TestCreateBoard:
 
         mock_logger.info.assert_called_once_with("Creating Board")
         mock_board_repository.create.assert_called_once_with(new=result)
-        assert mock_ownership_repository.create.call_count == 1
+        mock_ownership_repository.create_many.assert_called_once()
+        ownerships = mock_ownership_repository.create_many.call_args.kwargs["entities"]
+        assert [ownership.user_id for ownership in ownerships] == [VALID_USER_ID]
 
     def test_already_exists(
         self, mock_board_repository, mock_ownership_repository, mock_logger
     ):
         payload = self.get_create_board_payload()
-        mock_board_repository.get_by_id.return_value = Mock(
+        mock_board_repository.get_aggregate_by_id.return_value = Mock(
             spec=entity_repository.Board
         )
 
-        mock_ownership_repository.get_by_board_id.return_value = []
-
         with pytest.raises(ValueError, match="Board already exists"):
             board_services.create_board(
                 payload=payload,
@@ -216,18 +172,30 @@ class MockBoardRepository(domain_repository.BoardRepository):
     def get_by_id(self, id):
         return self.boards.get(id)
 
+    def get_aggregate_by_id(self, id, with_tasks=False):
+        return self.boards.get(id)
+
     def update(self, id, to_update):
         if id in self.boards:
             self.boards[id] = to_update
 
+    def update_where(self, criteria, changes):
+        return []
+
     def create(self, new):
         self.boards[new.id] = new
         return new
 
+    def create_many(self, entities):
+        return [self.create(new=new).id for new in entities]
+
     def delete(self, id):
         if id in self.boards:
             del self.boards[id]
 
+    def delete_where(self, criteria):
+        return []
+
     def filter(self, criteria):
         return list(self.boards.values())
 
@@ -253,6 +221,9 @@ class MockOwnerShipBoardRepository(domain_repository.OwnerShipBoardRepository):
     def get_by_board_id(self, board_id):
         return [o for o in self.ownerships if o.board_id == board_id]
 
+    def get_roles_by_board_id(self, board_id):
+        return {o.user_id: o.role for o in self.get_by_board_id(board_id)}
+
     def get_by_id(self, id):
         for ownership in self.ownerships:
             if ownership.id == id:
@@ -269,12 +240,18 @@ class MockOwnerShipBoardRepository(domain_repository.OwnerShipBoardRepository):
         self.ownerships.append(new)
         return new
 
+    def create_many(self, entities):
+        return [self.create(new=new).id for new in entities]
+
     def update(self, id, to_update):
         for i, ownership in enumerate(self.ownerships):
             if ownership.id == id:
                 self.ownerships[i] = to_update
                 return
 
+    def update_where(self, criteria, changes):
+        return []
+
     def update_role_by_user_id_and_board_id(
         self, user_id: str, board_id: str, to_update: entity_domain.RoleMemberType
     ) -> None:
@@ -286,6 +263,9 @@ class MockOwnerShipBoardRepository(domain_repository.OwnerShipBoardRepository):
     def delete(self, id):
         self.ownerships = [o for o in self.ownerships if o.id != id]
 
+    def delete_where(self, criteria):
+        return []
+
     def filter(self, criteria):
         return self.ownerships
 
@@ -346,7 +326,6 @@ def test_update_board_success(mock_dependencies):
         user_id="admin-user",
         board_id="mock-board-id",
         repository_board=mock_board_repo,
-        repository_ownership=mock_ownership_repo,
         logger=mock_logger,
     )
 
@@ -371,7 +350,6 @@ def test_update_board_not_admin(mock_dependencies):
             user_id="non-admin-user",
             board_id="mock-board-id",
             repository_board=mock_board_repo,
-            repository_ownership=mock_ownership_repo,
             logger=mock_logger,
         )
 
@@ -390,7 +368,6 @@ def test_update_nonexistent_board(mock_dependencies):
             user_id="admin-user",
             board_id="nonexistent-board-id",
             repository_board=mock_board_repo,
-            repository_ownership=mock_ownership_repo,
             logger=mock_logger,
         )
 
@@ -398,21 +375,25 @@ def test_update_nonexistent_board(mock_dependencies):
 def test_delete_board_success():
     mock_board = MagicMock(spec=entity_repository.Board)
     mock_repository_board = MagicMock(spec=domain_repository.BoardRepository)
-    mock_repository_ownership = MagicMock(
-        spec=domain_repository.OwnerShipBoardRepository
-    )
     mock_logger = MagicMock(spec=LogAdapter)
 
+    mock_repository_task = MagicMock(spec=domain_repository.TaskRepository)
+    mock_repository_task_history = MagicMock(
+        spec=domain_repository.TaskHistoryRepository
+    )
+
     mock_board.id = "test_board_id"
-    mock_repository_board.get_by_id.return_value = mock_board
+    mock_repository_board.get_aggregate_by_id.return_value = mock_board
     mock_board.can_delete.return_value = True
+    mock_repository_task.delete_by_board_id.return_value = ["task-1", "task-2"]
 
     with patch("src.app.task.services.board.get_board_by_id", return_value=mock_board):
         result = board_services.delete_board(
             board_id="test_board_id",
             user_id="test_user_id",
             repository_board=mock_repository_board,
-            repository_ownership=mock_repository_ownership,
+            repository_task=mock_repository_task,
+            repository_task_history=mock_repository_task_history,
             logger=mock_logger,
         )
 
@@ -420,13 +401,19 @@ def test_delete_board_success():
     mock_logger.info.assert_called_once_with("Deleting Board")
     mock_board.delete.assert_called_once_with(user_id="test_user_id")
     mock_repository_board.delete.assert_called_once_with(id="test_board_id")
+    mock_repository_task.delete_by_board_id.assert_called_once_with(
+        board_id="test_board_id"
+    )
+    histories = mock_repository_task_history.create_many.call_args.kwargs["entities"]
+    assert [history.task_id for history in histories] == ["task-1", "task-2"]
+    assert all(
+        history.type_of_change == domain_entity.HistoryChangeType.DELETED
+        for history in histories
+    )
 
 
 def test_delete_board_not_found():
     mock_repository_board = MagicMock(spec=domain_repository.BoardRepository)
-    mock_repository_ownership = MagicMock(
-        spec=domain_repository.OwnerShipBoardRepository
-    )
     mock_logger = MagicMock(spec=LogAdapter)
 
     with patch("src.app.task.services.board.get_board_by_id", return_value=None):
@@ -435,7 +422,10 @@ def test_delete_board_not_found():
                 board_id="test_board_id",
                 user_id="test_user_id",
                 repository_board=mock_repository_board,
-                repository_ownership=mock_repository_ownership,
+                repository_task=MagicMock(spec=domain_repository.TaskRepository),
+                repository_task_history=MagicMock(
+                    spec=domain_repository.TaskHistoryRepository
+                ),
                 logger=mock_logger,
             )
 
@@ -456,7 +446,10 @@ def test_delete_board_not_admin(mock_dependencies):
             board_id="mock-board-id",
             user_id="non-admin-user",
             repository_board=mock_board_repo,
-            repository_ownership=mock_ownership_repo,
+            repository_task=MagicMock(spec=domain_repository.TaskRepository),
+            repository_task_history=MagicMock(
+                spec=domain_repository.TaskHistoryRepository
+            ),
             logger=mock_logger,
         )
 
@@ -502,8 +495,7 @@ class TestBoardMemberOperations(BoardTestBase):
     def test_add_member_to_board_success(self):
         self.setUp()
         board = self.create_test_board()
-        self.mock_board_repo.get_by_id.return_value = board
-        self.mock_ownership_repo.get_by_board_id.return_value = []
+        self.mock_board_repo.get_aggregate_by_id.return_value = board
         self.mock_user_repo.get_by_id.return_value = self.NEW_MEMBER_ID
 
         result = self.call_add_member_to_board(
@@ -519,10 +511,7 @@ class TestBoardMemberOperations(BoardTestBase):
     def test_add_member_to_nonexistent_board(self):
         self.setUp()
         nonexistent_board_id = "nonexistent-board-id"
-        self.mock_board_repo.get_by_id.side_effect = (
-            repository_model.RepositoryNotFoundError()
-        )
-        self.mock_ownership_repo.get_by_board_id.return_value = []
+        self.mock_board_repo.get_aggregate_by_id.return_value = None
 
         with pytest.raises(ValueError, match=f"Board {nonexistent_board_id} not found"):
             self.call_add_member_to_board(
@@ -533,8 +522,7 @@ class TestBoardMemberOperations(BoardTestBase):
         self.setUp()
         nonexistent_member = "nonexistent-member-id"
         board = self.create_test_board()
-        self.mock_board_repo.get_by_id.return_value = board
-        self.mock_ownership_repo.get_by_board_id.return_value = []
+        self.mock_board_repo.get_aggregate_by_id.return_value = board
         self.mock_user_repo.get_by_id.side_effect = (
             repository_model.RepositoryNotFoundError()
         )
@@ -554,8 +542,7 @@ class TestBoardMemberOperations(BoardTestBase):
             role=entity_repository.RoleMemberType.VIEWER,
         )
         board.inject_member(existing_member)
-        self.mock_board_repo.get_by_id.return_value = board
-        self.mock_ownership_repo.get_by_board_id.return_value = []
+        self.mock_board_repo.get_aggregate_by_id.return_value = board
         self.mock_user_repo.get_by_id.return_value = existing_member_id
 
         with pytest.raises(
@@ -577,14 +564,14 @@ def test_update_role_in_member_success():
     mock_board.update_role_member.return_value = None
 
     repository_board = MagicMock(spec=domain_repository.BoardRepository)
-    repository_board.get_by_id.return_value = mock_board
+    repository_board.get_aggregate_by_id.return_value = mock_board
 
     repository_ownership = MagicMock(spec=domain_repository.OwnerShipBoardRepository)
     repository_ownership.update_role_by_user_id_and_board_id.return_value = None
 
     logger = MagicMock(spec=LogAdapter)
 
-    repository_board.get_by_id.return_value = mock_board
+    repository_board.get_aggregate_by_id.return_value = mock_board
 
     result = board_services.update_role_in_member(
         board_id=board_id,
@@ -615,7 +602,7 @@ def test_update_role_in_member_board_not_found():
     new_role = entity_repository.RoleMemberType.EDITOR
 
     repository_board = MagicMock(spec=domain_repository.BoardRepository)
-    repository_board.get_by_id.return_value = None
+    repository_board.get_aggregate_by_id.return_value = None
 
     repository_ownership = MagicMock(spec=domain_repository.OwnerShipBoardRepository)
     logger = MagicMock(spec=LogAdapter)
@@ -4,9 +4,8 @@ import pytest
 
 from src.app.task.domain import entity as entity_domain
 from src.app.task.domain import repository as repository_domain
-from src.app.task.domain.entity import Board, Task
+from src.app.task.domain.entity import Task
 from src.app.task.domain.repository import (
-    BoardRepository,
     OwnerShipBoardRepository,
     TaskHistoryRepository,
     TaskRepository,
@@ -16,6 +15,7 @@ from src.app.task.services.task import delete_task
 from src.domain.models.filter import FilterBuilder, Paginator
 from src.domain.services.command import CommandQueryRequest
 from src.infra.log.model import LogAdapter
+from src.infra.membership_cache.model import MembershipCache
 
 
 def paginate_task_of_board_valid():
@@ -92,11 +92,9 @@ def create_task_success():
     repository_task = MagicMock(spec=repository_domain.TaskRepository)
     repository_task_history = MagicMock(spec=repository_domain.TaskHistoryRepository)
     repository_board = MagicMock(spec=repository_domain.BoardRepository)
-    repository_ownership = MagicMock(spec=repository_domain.OwnerShipBoardRepository)
 
     repository_task.get_by_task_id.return_value = None
-    repository_board.get_by_id.return_value = MagicMock()
-    repository_ownership.get_by_user_id_and_board_id.return_value = MagicMock()
+    repository_board.get_aggregate_by_id.return_value = MagicMock()
 
     result = task_service.create_task(
         payload,
@@ -106,7 +104,6 @@ def create_task_success():
         repository_task,
         repository_task_history,
         repository_board,
-        repository_ownership,
     )
 
     assert isinstance(result, entity_domain.Task)
@@ -129,7 +126,6 @@ def create_task_task_already_exists():
     repository_task = MagicMock(spec=repository_domain.TaskRepository)
     repository_task_history = MagicMock(spec=repository_domain.TaskHistoryRepository)
     repository_board = MagicMock(spec=repository_domain.BoardRepository)
-    repository_ownership = MagicMock(spec=repository_domain.OwnerShipBoardRepository)
 
     repository_task.get_by_task_id.return_value = MagicMock()
 
@@ -142,7 +138,6 @@ def create_task_task_already_exists():
             repository_task,
             repository_task_history,
             repository_board,
-            repository_ownership,
         )
 
     logger.info.assert_not_called()
@@ -162,10 +157,9 @@ def create_task_board_not_found():
     repository_task = MagicMock(spec=repository_domain.TaskRepository)
     repository_task_history = MagicMock(spec=repository_domain.TaskHistoryRepository)
     repository_board = MagicMock(spec=repository_domain.BoardRepository)
-    repository_ownership = MagicMock(spec=repository_domain.OwnerShipBoardRepository)
 
     repository_task.get_by_task_id.return_value = None
-    repository_board.get_by_id.return_value = None
+    repository_board.get_aggregate_by_id.return_value = None
 
     with pytest.raises(ValueError, match="Board not found"):
         task_service.create_task(
@@ -176,28 +170,33 @@ def create_task_board_not_found():
             repository_task,
             repository_task_history,
             repository_board,
-            repository_ownership,
         )
 
 
 # Update
 
 
+def _membership_cache(roles=None):
+    membership_cache = MagicMock(spec=MembershipCache)
+    membership_cache.get.return_value = roles
+    return membership_cache
+
+
 def test_update_task_success():
     mock_logger = MagicMock(spec=LogAdapter)
     mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
     mock_task_history_repo = MagicMock(spec=repository_domain.TaskHistoryRepository)
-    mock_board_repo = MagicMock(spec=repository_domain.BoardRepository)
     mock_ownership_repo = MagicMock(spec=repository_domain.OwnerShipBoardRepository)
+    membership_cache = _membership_cache()
 
     mock_task = MagicMock(spec=entity_domain.Task)
     mock_task.histories = [MagicMock()]
     mock_task.board_id = "board_1"
 
-    mock_board = MagicMock(spec=entity_domain.Board)
-
-    mock_task_repo.get_by_id.return_value = mock_task
-    mock_board_repo.get_by_id.return_value = mock_board
+    mock_task_repo.get_with_histories_by_id.return_value = mock_task
+    mock_ownership_repo.get_roles_by_board_id.return_value = {
+        "user_1": entity_domain.RoleMemberType.EDITOR
+    }
 
     payload = task_service.UpdateTaskCommandRequest(
         name="Updated Task",
@@ -213,8 +212,8 @@ def test_update_task_success():
         logger=mock_logger,
         repository_task=mock_task_repo,
         repository_task_history=mock_task_history_repo,
-        repository_board=mock_board_repo,
         repository_ownership=mock_ownership_repo,
+        membership_cache=membership_cache,
     )
 
     assert result == mock_task
@@ -225,8 +224,13 @@ def test_update_task_success():
         priority=entity_domain.PriorityType.HIGH,
         icon_url=None,
     )
-    mock_board.update_task.assert_called_once_with(
-        task=mock_task, member_that_update="user_1"
+    mock_ownership_repo.get_roles_by_board_id.assert_called_once_with(
+        board_id="board_1"
+    )
+    membership_cache.set.assert_called_once_with(
+        "board_1",
+        {"user_1": entity_domain.RoleMemberType.EDITOR},
+        version=membership_cache.version.return_value,
     )
     mock_task_repo.update.assert_called_once_with(id="task_1", to_update=mock_task)
     mock_task_history_repo.create.assert_called_once_with(new=mock_task.histories[-1])
@@ -236,10 +240,9 @@ def test_update_task_raises_task_not_found():
     mock_logger = MagicMock(spec=LogAdapter)
     mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
     mock_task_history_repo = MagicMock(spec=repository_domain.TaskHistoryRepository)
-    mock_board_repo = MagicMock(spec=repository_domain.BoardRepository)
     mock_ownership_repo = MagicMock(spec=repository_domain.OwnerShipBoardRepository)
 
-    mock_task_repo.get_by_id.return_value = None
+    mock_task_repo.get_with_histories_by_id.return_value = None
 
     payload = task_service.UpdateTaskCommandRequest(
         name="Updated Task",
@@ -256,8 +259,8 @@ def test_update_task_raises_task_not_found():
             logger=mock_logger,
             repository_task=mock_task_repo,
             repository_task_history=mock_task_history_repo,
-            repository_board=mock_board_repo,
             repository_ownership=mock_ownership_repo,
+            membership_cache=_membership_cache(),
         )
 
 
@@ -265,14 +268,13 @@ def test_update_task_raises_board_not_found():
     mock_logger = MagicMock(spec=LogAdapter)
     mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
     mock_task_history_repo = MagicMock(spec=repository_domain.TaskHistoryRepository)
-    mock_board_repo = MagicMock(spec=repository_domain.BoardRepository)
     mock_ownership_repo = MagicMock(spec=repository_domain.OwnerShipBoardRepository)
 
     mock_task = MagicMock(spec=entity_domain.Task)
     mock_task.board_id = "board_1"
 
-    mock_task_repo.get_by_id.return_value = mock_task
-    mock_board_repo.get_by_id.return_value = None
+    mock_task_repo.get_with_histories_by_id.return_value = mock_task
+    mock_ownership_repo.get_roles_by_board_id.return_value = {}
 
     payload = task_service.UpdateTaskCommandRequest(
         name="Updated Task",
@@ -289,17 +291,51 @@ def test_update_task_raises_board_not_found():
             logger=mock_logger,
             repository_task=mock_task_repo,
             repository_task_history=mock_task_history_repo,
-            repository_board=mock_board_repo,
             repository_ownership=mock_ownership_repo,
+            membership_cache=_membership_cache(),
         )
 
 
+def test_update_task_uses_cached_roles():
+    mock_logger = MagicMock(spec=LogAdapter)
+    mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
+    mock_task_history_repo = MagicMock(spec=repository_domain.TaskHistoryRepository)
+    mock_ownership_repo = MagicMock(spec=repository_domain.OwnerShipBoardRepository)
+
+    mock_task = MagicMock(spec=entity_domain.Task)
+    mock_task.board_id = "board_1"
+
+    mock_task_repo.get_with_histories_by_id.return_value = mock_task
+
+    payload = task_service.UpdateTaskCommandRequest(
+        name="Updated Task",
+        description="Updated Description",
+        priority=entity_domain.PriorityType.HIGH,
+        icon_url=None,
+    )
+
+    with pytest.raises(entity_domain.IsNotEditorOfBoardError):
+        task_service.update_task(
+            id="task_1",
+            user_id="user_1",
+            payload=payload,
+            logger=mock_logger,
+            repository_task=mock_task_repo,
+            repository_task_history=mock_task_history_repo,
+            repository_ownership=mock_ownership_repo,
+            membership_cache=_membership_cache({"user_1": "viewer"}),
+        )
+
+    mock_ownership_repo.get_roles_by_board_id.assert_not_called()
+    mock_task.update.assert_not_called()
+    mock_task_repo.update.assert_not_called()
+
+
 def test_delete_task_success():
     # Arrange
     mock_logger = Mock(spec=LogAdapter)
     mock_repository_task = Mock(spec=TaskRepository)
     mock_repository_task_history = Mock(spec=TaskHistoryRepository)
-    mock_repository_board = Mock(spec=BoardRepository)
     mock_repository_ownership = Mock(spec=OwnerShipBoardRepository)
 
     task_id = "test_task_id"
@@ -310,16 +346,7 @@ def test_delete_task_success():
     mock_task.histories = []
     type(mock_task).histories = PropertyMock(return_value=[Mock()])
 
-    mock_board = Mock(spec=Board)
-    mock_board.owners = []
-    mock_board.members = []
-    mock_board.is_member = Mock(return_value=True)
-    mock_board.delete_task = Mock()
-
-    mock_repository_task.get_by_id.return_value = mock_task
-    mock_repository_board.get_by_id.return_value = mock_board
-    mock_repository_ownership.get_by_board_id.return_value = []
-    mock_repository_task_history.get_by_task_id.return_value = []
+    mock_repository_task.get_with_histories_by_id.return_value = mock_task
 
     # Act
     result = delete_task(
@@ -328,17 +355,15 @@ def test_delete_task_success():
         logger=mock_logger,
         repository_task=mock_repository_task,
         repository_task_history=mock_repository_task_history,
-        repository_board=mock_repository_board,
         repository_ownership=mock_repository_ownership,
+        membership_cache=_membership_cache({user_id: "admin"}),
     )
 
     # Assert
     assert result == mock_task
     mock_logger.info.assert_called_with("Deleting Task")
     mock_task.delete.assert_called_once()
-    mock_board.delete_task.assert_called_once_with(
-        task=mock_task, member_that_delete=user_id
-    )
+    mock_repository_ownership.get_roles_by_board_id.assert_not_called()
     mock_repository_task.delete.assert_called_once_with(id=task_id)
     mock_repository_task_history.create.assert_called_once()
 
@@ -347,13 +372,12 @@ def test_delete_task_not_found():
     mock_logger = Mock(spec=LogAdapter)
     mock_repository_task = Mock(spec=TaskRepository)
     mock_repository_task_history = Mock(spec=TaskHistoryRepository)
-    mock_repository_board = Mock(spec=BoardRepository)
     mock_repository_ownership = Mock(spec=OwnerShipBoardRepository)
 
     task_id = "non_existent_task_id"
     user_id = "test_user_id"
 
-    mock_repository_task.get_by_id.return_value = None
+    mock_repository_task.get_with_histories_by_id.return_value = None
 
     with pytest.raises(ValueError, match="Task not found"):
         delete_task(
@@ -362,37 +386,295 @@ def test_delete_task_not_found():
             logger=mock_logger,
             repository_task=mock_repository_task,
             repository_task_history=mock_repository_task_history,
-            repository_board=mock_repository_board,
             repository_ownership=mock_repository_ownership,
+            membership_cache=_membership_cache(),
         )
 
 
-def test_delete_task_board_not_found():
+def test_delete_task_not_member():
     # Arrange
     mock_logger = MagicMock(spec=LogAdapter)
     mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
     mock_task_history_repo = MagicMock(spec=repository_domain.TaskHistoryRepository)
-    mock_board_repo = MagicMock(spec=repository_domain.BoardRepository)
     mock_ownership_repo = MagicMock(spec=repository_domain.OwnerShipBoardRepository)
 
     mock_task = MagicMock(spec=entity_domain.Task)
     mock_task.board_id = "board_1"
     mock_task.histories = []
 
-    mock_task_repo.get_by_id.return_value = mock_task
-    mock_board_repo.get_by_id.return_value = None
+    mock_task_repo.get_with_histories_by_id.return_value = mock_task
+    mock_ownership_repo.get_roles_by_board_id.return_value = {
+        "user_2": entity_domain.RoleMemberType.ADMIN
+    }
 
     # Act & Assert
-    with pytest.raises(ValueError, match="Board not found"):
+    with pytest.raises(entity_domain.IsNotMemberofBoardError):
         task_service.delete_task(
             id="task_1",
             user_id="user_1",
             logger=mock_logger,
             repository_task=mock_task_repo,
             repository_task_history=mock_task_history_repo,
-            repository_board=mock_board_repo,
             repository_ownership=mock_ownership_repo,
+            membership_cache=_membership_cache(),
         )
 
-    mock_task_repo.get_by_id.assert_called_once_with(id="task_1")
-    mock_board_repo.get_by_id.assert_called_once_with(id="board_1")
+    mock_task_repo.get_with_histories_by_id.assert_called_once_with(
+        id="task_1", last_histories=0
+    )
+    mock_ownership_repo.get_roles_by_board_id.assert_called_once_with(
+        board_id="board_1"
+    )
+    mock_task.delete.assert_not_called()
+
+
+def test_get_detailed_task_by_id_loads_last_histories_with_owner():
+    mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
+    mock_task = MagicMock(spec=entity_domain.Task)
+    mock_task_repo.get_with_histories_by_id.return_value = mock_task
+
+    result = task_service.get_detailed_task_by_id(
+        id="task_1", repository_task=mock_task_repo, last_histories=5
+    )
+
+    assert result == mock_task
+    mock_task_repo.get_with_histories_by_id.assert_called_once_with(
+        id="task_1", with_owner=True, last_histories=5
+    )
+
+
+def test_get_detailed_task_by_id_not_found():
+    mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
+    mock_task_repo.get_with_histories_by_id.return_value = None
+
+    with pytest.raises(ValueError, match="Task not found"):
+        task_service.get_detailed_task_by_id(
+            id="task_1", repository_task=mock_task_repo
+        )
+
+
+def test_update_and_delete_task_do_not_load_histories():
+    mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
+    mock_task_history_repo = MagicMock(spec=repository_domain.TaskHistoryRepository)
+    mock_task_repo.get_with_histories_by_id.side_effect = lambda **_: (
+        entity_domain.Task(
+            id="task_1",
+            name="Task",
+            description="Task",
+            owner="user_1",
+            board_id="board_1",
+        )
+    )
+    dependencies = {
+        "user_id": "user_1",
+        "logger": MagicMock(spec=LogAdapter),
+        "repository_task": mock_task_repo,
+        "repository_task_history": mock_task_history_repo,
+        "repository_ownership": MagicMock(
+            spec=repository_domain.OwnerShipBoardRepository
+        ),
+        "membership_cache": _membership_cache(
+            {"user_1": entity_domain.RoleMemberType.EDITOR}
+        ),
+    }
+
+    updated = task_service.update_task(
+        id="task_1",
+        payload=task_service.UpdateTaskCommandRequest(
+            name="Updated Task",
+            description="Updated Description",
+            priority=entity_domain.PriorityType.HIGH,
+        ),
+        **dependencies,
+    )
+    deleted = task_service.delete_task(id="task_1", **dependencies)
+
+    assert mock_task_repo.get_with_histories_by_id.call_count == 2
+    for call in mock_task_repo.get_with_histories_by_id.call_args_list:
+        assert call.kwargs == {"id": "task_1", "last_histories": 0}
+    assert len(updated.histories) == 1
+    assert len(deleted.histories) == 1
+    assert [
+        call.kwargs["new"] for call in mock_task_history_repo.create.call_args_list
+    ] == [updated.histories[0], deleted.histories[0]]
+
+
+def _batch_board(role=entity_domain.RoleMemberType.ADMIN):
+    board = entity_domain.Board.create(
+        id="board_1", name="Board", description="Board", user_id="user_1"
+    )
+    board.members[0].role = role
+    board.tasks.append(
+        entity_domain.Task(
+            id="task_1",
+            name="Task",
+            description="Task",
+            owner="user_1",
+            board_id="board_1",
+        )
+    )
+    board.tasks[0].mark_clean()
+    return board
+
+
+def test_batch_tasks_applies_operations_and_bulk_inserts_histories():
+    mock_logger = MagicMock(spec=LogAdapter)
+    mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
+    mock_task_history_repo = MagicMock(spec=repository_domain.TaskHistoryRepository)
+    mock_board_repo = MagicMock(spec=repository_domain.BoardRepository)
+    mock_board_repo.get_aggregate_by_id.return_value = _batch_board()
+    mock_task_repo.get_existing_ids.return_value = set()
+
+    payload = task_service.BatchTaskCommandRequest(
+        operations=[
+            {"operation": "create", "id": "task_2", "name": "New", "description": "d"},
+            {"operation": "status", "id": "task_1", "status": "doing"},
+            {"operation": "delete", "id": "task_1"},
+        ]
+    )
+
+    result = task_service.batch_tasks(
+        payload=payload,
+        user_id="user_1",
+        board_id="board_1",
+        logger=mock_logger,
+        repository_task=mock_task_repo,
+        repository_task_history=mock_task_history_repo,
+        repository_board=mock_board_repo,
+    )
+
+    assert [item.success for item in result.results] == [True, True, True]
+    mock_board_repo.get_aggregate_by_id.assert_called_once_with(
+        id="board_1", with_tasks=True
+    )
+    mock_task_repo.get_existing_ids.assert_called_once_with(ids=["task_2"])
+    created = mock_task_repo.create_many.call_args.kwargs["entities"]
+    assert [task.id for task in created] == ["task_2"]
+    mock_task_repo.update.assert_not_called()
+    mock_task_repo.delete.assert_called_once_with(id="task_1")
+    histories = mock_task_history_repo.create_many.call_args.kwargs["entities"]
+    assert len(histories) == 3
+    assert len(result.results[1].task.histories) == 1
+    assert len(result.results[2].task.histories) == 2
+
+
+def test_batch_tasks_drops_tasks_created_and_deleted_in_the_same_batch():
+    mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
+    mock_task_history_repo = MagicMock(spec=repository_domain.TaskHistoryRepository)
+    mock_board_repo = MagicMock(spec=repository_domain.BoardRepository)
+    mock_board_repo.get_aggregate_by_id.return_value = _batch_board()
+    mock_task_repo.get_existing_ids.return_value = set()
+
+    payload = task_service.BatchTaskCommandRequest(
+        operations=[
+            {"operation": "create", "id": "task_2", "name": "New", "description": "d"},
+            {"operation": "update", "id": "task_2", "name": "Renamed"},
+            {"operation": "delete", "id": "task_2"},
+            {"operation": "status", "id": "task_1", "status": "doing"},
+        ]
+    )
+
+    result = task_service.batch_tasks(
+        payload=payload,
+        user_id="user_1",
+        board_id="board_1",
+        logger=MagicMock(spec=LogAdapter),
+        repository_task=mock_task_repo,
+        repository_task_history=mock_task_history_repo,
+        repository_board=mock_board_repo,
+    )
+
+    assert [item.success for item in result.results] == [True, True, True, True]
+    assert [item.task.name for item in result.results[:2]] == ["New", "Renamed"]
+    mock_task_repo.create_many.assert_called_once_with(entities=[])
+    (update_call,) = mock_task_repo.update.call_args_list
+    assert update_call.kwargs["id"] == "task_1"
+    mock_task_repo.delete.assert_not_called()
+    histories = mock_task_history_repo.create_many.call_args.kwargs["entities"]
+    assert [history.task_id for history in histories] == ["task_1"]
+
+
+def test_batch_tasks_reports_failures_per_item():
+    mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
+    mock_board_repo = MagicMock(spec=repository_domain.BoardRepository)
+    mock_board_repo.get_aggregate_by_id.return_value = _batch_board(
+        role=entity_domain.RoleMemberType.VIEWER
+    )
+
+    payload = task_service.BatchTaskCommandRequest(
+        operations=[
+            {"operation": "update", "id": "missing", "name": "x"},
+            {"operation": "status", "id": "task_1", "status": "done"},
+        ]
+    )
+
+    result = task_service.batch_tasks(
+        payload=payload,
+        user_id="user_1",
+        board_id="board_1",
+        logger=MagicMock(spec=LogAdapter),
+        repository_task=mock_task_repo,
+        repository_task_history=MagicMock(spec=repository_domain.TaskHistoryRepository),
+        repository_board=mock_board_repo,
+    )
+
+    assert [item.success for item in result.results] == [False, False]
+    assert result.results[1].error["type"] == "IsNotEditorOfBoardError"
+    mock_task_repo.update.assert_not_called()
+
+
+def test_batch_tasks_skips_deleted_updates_and_rejects_existing_ids():
+    mock_task_repo = MagicMock(spec=repository_domain.TaskRepository)
+    mock_task_history_repo = MagicMock(spec=repository_domain.TaskHistoryRepository)
+    mock_board_repo = MagicMock(spec=repository_domain.BoardRepository)
+    mock_board_repo.get_aggregate_by_id.return_value = _batch_board()
+    mock_task_repo.get_existing_ids.return_value = {"task_9"}
+
+    payload = task_service.BatchTaskCommandRequest(
+        operations=[
+            {"operation": "update", "id": "task_1", "name": "Renamed"},
+            {"operation": "delete", "id": "task_1"},
+            {"operation": "create", "id": "task_9", "name": "New", "description": "d"},
+        ]
+    )
+
+    result = task_service.batch_tasks(
+        payload=payload,
+        user_id="user_1",
+        board_id="board_1",
+        logger=MagicMock(spec=LogAdapter),
+        repository_task=mock_task_repo,
+        repository_task_history=mock_task_history_repo,
+        repository_board=mock_board_repo,
+    )
+
+    assert [item.success for item in result.results] == [True, True, False]
+    assert result.results[2].error == {
+        "message": "Task task_9 already exists",
+        "type": "ValueError",
+    }
+    mock_task_repo.create_many.assert_called_once_with(entities=[])
+    mock_task_repo.update.assert_not_called()
+    mock_task_repo.delete.assert_called_once_with(id="task_1")
+    histories = mock_task_history_repo.create_many.call_args.kwargs["entities"]
+    assert len(histories) == 2
+
+
+def test_batch_tasks_board_not_found():
+    mock_board_repo = MagicMock(spec=repository_domain.BoardRepository)
+    mock_board_repo.get_aggregate_by_id.return_value = None
+
+    with pytest.raises(ValueError, match="Board not found"):
+        task_service.batch_tasks(
+            payload=task_service.BatchTaskCommandRequest(
+                operations=[{"operation": "delete", "id": "task_1"}]
+            ),
+            user_id="user_1",
+            board_id="board_1",
+            logger=MagicMock(spec=LogAdapter),
+            repository_task=MagicMock(spec=repository_domain.TaskRepository),
+            repository_task_history=MagicMock(
+                spec=repository_domain.TaskHistoryRepository
+            ),
+            repository_board=mock_board_repo,
+        )
@@ -2,6 +2,7 @@ from typing import Any, List
 
 import pytest
 
+from src.domain.models import exceptions
 from src.domain.models import filter as filter_domain
 from src.infra.filter import postgres as filter_postgres
 
@@ -326,3 +327,59 @@ def test_or_group_filters() -> None:
 
     assert definition_group_filter.to_definition() == "(test = %s) OR (test2 = %s)"
     assert definition_group_filter.get_values() == ["abc", "def"]
+
+
+def test_keyset_uniform_order_uses_row_comparison() -> None:
+    keyset = filter_postgres.PostgresKeyset()
+    order_by: List[filter_domain.Ordered] = [
+        filter_postgres.AscPostgresOrder("created_at"),
+        filter_postgres.AscPostgresOrder("id"),
+    ]
+
+    assert (
+        keyset.to_definition(order_by, filter_domain.CursorDirection.NEXT)
+        == "(created_at, id) > (%s, %s)"
+    )
+    assert (
+        keyset.to_definition(order_by, filter_domain.CursorDirection.PREVIOUS)
+        == "(created_at, id) < (%s, %s)"
+    )
+    assert (
+        keyset.to_order(order_by, filter_domain.CursorDirection.PREVIOUS)
+        == "created_at DESC, id DESC"
+    )
+    assert keyset.get_values(order_by, ["2024-01-01", "a"]) == ["2024-01-01", "a"]
+
+
+def test_keyset_mixed_order_expands_comparison() -> None:
+    keyset = filter_postgres.PostgresKeyset()
+    order_by: List[filter_domain.Ordered] = [
+        filter_postgres.DescPostgresOrder("created_at"),
+        filter_postgres.AscPostgresOrder("id"),
+    ]
+
+    assert (
+        keyset.to_definition(order_by, filter_domain.CursorDirection.NEXT)
+        == "((created_at < %s) OR (created_at = %s AND id > %s))"
+    )
+    assert (
+        keyset.to_order(order_by, filter_domain.CursorDirection.NEXT)
+        == "created_at DESC, id ASC"
+    )
+    assert keyset.get_values(order_by, ["2024-01-01", "a"]) == [
+        "2024-01-01",
+        "2024-01-01",
+        "a",
+    ]
+
+
+def test_cursor_encode_decode() -> None:
+    cursor = filter_domain.Cursor(
+        values=["2024-01-01 00:00:00", 3],
+        direction=filter_domain.CursorDirection.PREVIOUS,
+    )
+
+    assert filter_domain.Cursor.decode(cursor.encode()) == cursor
+
+    with pytest.raises(exceptions.BadRequestError):
+        filter_domain.Cursor.decode("not-a-cursor")
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+
+import pytest
+
+from src import settings
+from src.domain.services import command
+from src.infra.http import executor
+
+
+class ThreadNameCommand(command.Command):
+    async def execute(self) -> command.CommandResponse:
+        return command.CommandResponse(
+            trace_id=command.CommandRequest().trace_id,
+            payload={"thread": threading.current_thread().name},
+        )
+
+
+class AsyncThreadNameCommand(ThreadNameCommand):
+    blocking = False
+
+
+def test_thread_pool_runs_blocking_commands_off_loop() -> None:
+    configuration = settings.DevSettings()
+    configuration.http_dispatch_mode = "thread-pool"
+    configuration.http_dispatch_pool_size = 2
+    dispatcher = executor.build_dispatcher(configuration)
+
+    async def run() -> list[command.CommandResponse]:
+        return await asyncio.gather(
+            *[dispatcher.dispatch("route-a", ThreadNameCommand()) for _ in range(5)],
+            dispatcher.dispatch("route-b", AsyncThreadNameCommand()),
+        )
+
+    responses = asyncio.run(run())
+    dispatcher.shutdown()
+
+    for response in responses[:5]:
+        assert response.payload["thread"].startswith("http-dispatch")
+    assert responses[5].payload["thread"] == threading.main_thread().name
+
+    stats = dispatcher.stats()
+    assert stats["route-a"].completed == 5
+    assert stats["route-a"].queued == 0
+    assert stats["route-a"].running == 0
+    assert stats["route-b"].completed == 1
+
+
+def test_build_dispatcher_with_invalid_mode() -> None:
+    configuration = settings.DevSettings()
+    configuration.http_dispatch_mode = "unknown"
+
+    with pytest.raises(ValueError):
+        executor.build_dispatcher(configuration)
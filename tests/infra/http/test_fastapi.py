@@ -1,12 +1,23 @@
+import asyncio
+import uuid
 from logging import getLogger
 from typing import cast
+from unittest import mock
+
+import httpx
+import pytest
+import starlette.types
 
 from src import settings
+from src.app.shared.services import common
+from src.app.task.infra.repositories.psycopg import task as task_repository
 from src.domain.entrypoint import http as entrypoint_http
 from src.domain.entrypoint import model as entrypoint_model
-from src.domain.services import command
+from src.domain.models import filter
+from src.domain.services import command, user
 from src.fastapi_ddd_abs_libs import base as base_infra
-from src.infra.http import model, request
+from src.infra.filter import filter_builder
+from src.infra.http import fastapi, model, request
 from src.infra.jwt import pyjwt
 from src.infra.log import logging
 from src.infra.log import model as log_model
@@ -79,3 +90,245 @@ def test_fastapi_add_and_inject_route() -> None:
 
     assert len(http_adapter.routes) == 1
     assert app_executed.instance is not None
+
+
+class EchoCommandTest(command.Command):
+    barrier: asyncio.Barrier
+    executed: list[int]
+
+    def __init__(self):
+        super().__init__(requirements=["logger"])
+        self.executed = []
+
+    async def execute(self) -> command.CommandResponse:
+        request = cast(command.CommandRequest, self.request)
+        self.executed.append(id(self))
+        await self.barrier.wait()
+        return command.CommandResponse(
+            trace_id=request.trace_id,
+            payload={"value": self.parameters["value"]},
+        )
+
+
+def test_fastapi_concurrent_requests_get_their_own_command() -> None:
+    configuration = settings.DevSettings()
+    logger = logging.LoggingAdapter(configuration)
+    jwt_adapter = pyjwt.AuthPyJWT(configuration=configuration, logger=logger)
+    http_adapter = fastapi.FastApiAdapter(
+        configuration=configuration, logger=logger, jwt=jwt_adapter
+    )
+
+    prototype = EchoCommandTest()
+    prototype.inject_dependencies({"logger": logger})
+    http_adapter.add_route(
+        entrypoint_http.EntrypointHttp(
+            cmd=prototype,
+            security=entrypoint_model.EntrypointSecurity(),
+            route="/echo/{value}",
+            name="echo",
+            documentation=my_doc,
+            path_parameters=["value"],
+        )
+    )
+    app = cast(starlette.types.ASGIApp, http_adapter.execute().instance)
+    trace_ids = [uuid.uuid4(), uuid.uuid4()]
+
+    async def run() -> list[httpx.Response]:
+        prototype.barrier = asyncio.Barrier(len(trace_ids))
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await asyncio.gather(
+                *[
+                    client.get(f"/echo/{index}", params={"trace_id": str(trace_id)})
+                    for index, trace_id in enumerate(trace_ids)
+                ]
+            )
+
+    responses = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    for index, response in enumerate(responses):
+        body = response.json()
+        assert body["trace_id"] == str(trace_ids[index])
+        assert body["payload"] == {"value": str(index)}
+    assert len(prototype.executed) == 2
+    assert len(set(prototype.executed)) == 2
+    assert id(prototype) not in prototype.executed
+    assert prototype.request is None
+    assert prototype.parameters == {}
+
+
+def test_fastapi_compiles_route_audiences_on_registration() -> None:
+    configuration = settings.DevSettings()
+    logger = logging.LoggingAdapter(configuration)
+    jwt_adapter = pyjwt.AuthPyJWT(configuration=configuration, logger=logger)
+    http_adapter = fastapi.FastApiAdapter(
+        configuration=configuration, logger=logger, jwt=jwt_adapter
+    )
+    security = entrypoint_model.EntrypointSecurity(
+        require_security=True, audiences=["profile:get", "task:get"]
+    )
+    http_adapter.add_route(
+        entrypoint_http.EntrypointHttp(
+            cmd=MyCommandTest(),
+            security=security,
+            route="/secure",
+            name="secure",
+            documentation=my_doc,
+        )
+    )
+
+    http_adapter.execute()
+
+    assert security.audiences_mask == (
+        user.AUDIENCE_MASKS[user.Audience.GET_PROFILE]
+        | user.AUDIENCE_MASKS[user.Audience.GET_TASK]
+    )
+
+    unknown = entrypoint_model.EntrypointSecurity(audiences=["profile:unknown"])
+    with pytest.raises(ValueError):
+        unknown.compile()
+
+
+class InvalidCursorCommandTest(command.Command):
+    def __init__(self):
+        super().__init__(requirements=[])
+
+    async def execute(self) -> command.CommandResponse:
+        filter.Cursor.decode("not-a-cursor")
+        return command.CommandResponse(trace_id=uuid.uuid4())
+
+
+def test_fastapi_maps_bad_request_errors_to_bad_request() -> None:
+    configuration = settings.DevSettings()
+    logger = logging.LoggingAdapter(configuration)
+    jwt_adapter = pyjwt.AuthPyJWT(configuration=configuration, logger=logger)
+    http_adapter = fastapi.FastApiAdapter(
+        configuration=configuration, logger=logger, jwt=jwt_adapter
+    )
+    http_adapter.add_route(
+        entrypoint_http.EntrypointHttp(
+            cmd=InvalidCursorCommandTest(),
+            security=entrypoint_model.EntrypointSecurity(),
+            route="/cursor",
+            name="cursor",
+            documentation=my_doc,
+        )
+    )
+    app = cast(starlette.types.ASGIApp, http_adapter.execute().instance)
+
+    async def run() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.get("/cursor")
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 400
+    assert response.json()["errors"] == [
+        {"message": "Cursor not valid", "type": "BadRequestError"}
+    ]
+
+
+class NotFoundCommandTest(command.Command):
+    def __init__(self):
+        super().__init__(requirements=[])
+
+    async def execute(self) -> command.CommandResponse:
+        raise ValueError("Board not found")
+
+
+def test_fastapi_keeps_value_errors_in_response_body() -> None:
+    configuration = settings.DevSettings()
+    logger = logging.LoggingAdapter(configuration)
+    jwt_adapter = pyjwt.AuthPyJWT(configuration=configuration, logger=logger)
+    http_adapter = fastapi.FastApiAdapter(
+        configuration=configuration, logger=logger, jwt=jwt_adapter
+    )
+    http_adapter.add_route(
+        entrypoint_http.EntrypointHttp(
+            cmd=NotFoundCommandTest(),
+            security=entrypoint_model.EntrypointSecurity(),
+            route="/board",
+            name="board",
+            documentation=my_doc,
+        )
+    )
+    app = cast(starlette.types.ASGIApp, http_adapter.execute().instance)
+
+    async def run() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.get("/board")
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert response.json()["errors"] == [
+        {"message": "Board not found", "type": "ValueError"}
+    ]
+
+
+class SortedTasksCommandTest(command.Command):
+    def __init__(self):
+        super().__init__(
+            requirements=["logger", "configuration"],
+            request_type=command.CommandQueryRequest,
+        )
+
+    async def execute(self) -> command.CommandResponse:
+        query = cast(command.CommandQueryRequest, self.request)
+        repository = task_repository.PostgresTaskRepository(
+            configuration=self._deps["configuration"],
+            log=self._deps["logger"],
+            session=mock.MagicMock(),
+            filter_builder=filter_builder,
+        )
+        repository.filter(
+            criteria=common.command_query_to_criteria(query, filter_builder)
+        )
+        return command.CommandResponse(trace_id=query.trace_id)
+
+
+def test_fastapi_rejects_sort_by_not_allowed_field() -> None:
+    configuration = settings.DevSettings()
+    logger = logging.LoggingAdapter(configuration)
+    jwt_adapter = pyjwt.AuthPyJWT(configuration=configuration, logger=logger)
+    http_adapter = fastapi.FastApiAdapter(
+        configuration=configuration, logger=logger, jwt=jwt_adapter
+    )
+    cmd = SortedTasksCommandTest()
+    cmd.inject_dependencies({"logger": logger, "configuration": configuration})
+    http_adapter.add_route(
+        entrypoint_http.EntrypointHttp(
+            cmd=cmd,
+            security=entrypoint_model.EntrypointSecurity(),
+            route="/tasks",
+            name="tasks",
+            documentation=my_doc,
+            path_parameters=["query"],
+        )
+    )
+    app = cast(starlette.types.ASGIApp, http_adapter.execute().instance)
+
+    async def run() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.get("/tasks", params={"order_by": "-board_id"})
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 400
+    assert response.json()["errors"] == [
+        {
+            "message": "Sort by board_id not allowed in tbl_task",
+            "type": "RepositorySortNotAllowedError",
+        }
+    ]
@@ -1,7 +1,12 @@
+import datetime
+from unittest import mock
+
+import jwt
+
 from src import settings
 from src.domain.entrypoint import model as entrypoint_model
 from src.domain.services import user
-from src.infra.jwt import pyjwt
+from src.infra.jwt import model, pyjwt
 from src.infra.log import logging
 
 _TEST_TOKEN = (
@@ -62,3 +67,85 @@ def test_pyjwt_encode_ok() -> None:
 
     assert token_model.access_token
     assert token_model.refresh_token
+
+
+def test_pyjwt_check_authentication_caches_verified_token() -> None:
+    configuration = settings.DevSettings()
+    configuration.auth_access_token_secret = "123"
+    configuration.auth_refresh_token_secret = "123"
+    configuration.auth_token_cache_size = 1
+    logger = logging.LoggingAdapter(configuration)
+    jwt_adapter = pyjwt.AuthPyJWT(configuration=configuration, logger=logger)
+
+    tokens = [
+        jwt_adapter.encode(
+            current_user=user.AuthUser(
+                id=id, name="Gabriel", last_name="Vargas", username="vmgabriel"
+            ),
+            aud=["role:client"],
+        ).access_token
+        for id in ("1", "2")
+    ]
+
+    with mock.patch("jwt.decode", wraps=jwt.decode) as decode:
+        first = jwt_adapter.check_and_decode(
+            token=tokens[0], allowed_aud=["profile:get"]
+        )
+        second = jwt_adapter.check_and_decode(
+            token=tokens[0], allowed_aud=["profile:create"]
+        )
+        jwt_adapter.check_and_decode(token=tokens[1], allowed_aud=["profile:get"])
+        jwt_adapter.check_and_decode(token=tokens[0], allowed_aud=["profile:get"])
+
+    assert first.type is entrypoint_model.StatusType.OK
+    assert second.type is entrypoint_model.StatusType.NOT_PERMISSIONS
+    assert decode.call_count == 3
+    assert jwt_adapter.tokens is not None
+    stats = jwt_adapter.tokens.stats()
+    assert stats.entries == 1
+    assert stats.hits == 1
+    assert stats.misses == 3
+    assert stats.evictions == 2
+    assert stats.hit_rate == 0.25
+
+
+def test_pyjwt_check_authentication_cache_expires_with_token() -> None:
+    configuration = settings.DevSettings()
+    configuration.auth_access_token_secret = "123"
+    configuration.auth_refresh_token_secret = "123"
+    logger = logging.LoggingAdapter(configuration)
+    jwt_adapter = pyjwt.AuthPyJWT(configuration=configuration, logger=logger)
+
+    token = jwt_adapter.encode(
+        current_user=user.AuthUser(
+            id="1", name="Gabriel", last_name="Vargas", username="vmgabriel"
+        ),
+        aud=["role:client"],
+        expiration=datetime.timedelta(seconds=30),
+    ).access_token
+
+    assert jwt_adapter.check_and_decode(token=token, allowed_aud=["profile:get"])
+    with mock.patch("time.time", return_value=datetime.datetime.now().timestamp() + 60):
+        assert jwt_adapter.tokens is not None
+        assert jwt_adapter.tokens.get(token) is None
+
+    assert jwt_adapter.tokens.stats().expirations == 1
+
+
+def test_jwt_data_permission_mask_matches_role_and_audiences() -> None:
+    data = model.JWTData(
+        user=user.AuthUser(
+            id="1", name="Gabriel", last_name="Vargas", username="vmgabriel"
+        ),
+        aud=["role:client", "profile:create", "unknown:audience"],
+        gen=datetime.datetime.now(),
+        exp=datetime.datetime.now(),
+    )
+
+    for audience in user.Audience:
+        assert data.has_permission(audiences_mask=user.audiences_mask([audience]))
+    assert not data.has_permission(audiences_mask=0)
+    assert data.permissions_mask == (
+        user.ROLE_MASKS[user.Role.CLIENT]
+        | user.AUDIENCE_MASKS[user.Audience.CREATE_PROFILE]
+    )
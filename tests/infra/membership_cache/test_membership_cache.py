@@ -0,0 +1,107 @@
+from unittest import mock
+
+from src import settings
+from src.infra.log import logging
+from src.infra.membership_cache import memory
+
+
+def _configuration(size: int = 2, ttl: float = 30.0) -> settings.BaseSettings:
+    configuration = settings.DevSettings()
+    configuration.membership_cache_size = size
+    configuration.membership_cache_ttl = ttl
+    return configuration
+
+
+def test_memory_membership_cache_evicts_least_recent_board() -> None:
+    configuration = _configuration()
+    cache = memory.MemoryMembershipCache(
+        configuration=configuration, logger=logging.LoggingAdapter(configuration)
+    )
+
+    assert cache.get("a") is None
+    cache.set("a", {"user": "admin"})
+    cache.set("b", {"user": "viewer"})
+    assert cache.get("a") == {"user": "admin"}
+    cache.set("c", {"user": "editor"})
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"user": "editor"}
+
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.hits == 2
+    assert stats.misses == 2
+    assert stats.evictions == 1
+    assert stats.hit_rate == 0.5
+
+
+def test_memory_membership_cache_expires_and_invalidates() -> None:
+    configuration = _configuration(ttl=10.0)
+    cache = memory.MemoryMembershipCache(
+        configuration=configuration, logger=logging.LoggingAdapter(configuration)
+    )
+
+    with mock.patch("time.monotonic", return_value=100.0):
+        cache.set("a", {"user": "admin"})
+        cache.set("b", {"user": "admin"})
+    with mock.patch("time.monotonic", return_value=105.0):
+        assert cache.get("a") == {"user": "admin"}
+    with mock.patch("time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+
+    cache.invalidate("b")
+
+    stats = cache.stats()
+    assert stats.entries == 0
+    assert stats.invalidations == 1
+
+
+def test_memory_membership_cache_disabled_with_zero_size() -> None:
+    configuration = _configuration(size=0)
+    cache = memory.MemoryMembershipCache(
+        configuration=configuration, logger=logging.LoggingAdapter(configuration)
+    )
+
+    cache.set("a", {"user": "admin"})
+
+    assert cache.get("a") is None
+    assert cache.stats().entries == 0
+
+
+def test_memory_membership_cache_disabled_with_several_workers() -> None:
+    configuration = _configuration()
+    configuration.server_provider = "uvicorn-prefork"
+    configuration.server_workers = 2
+    cache = memory.MemoryMembershipCache(
+        configuration=configuration, logger=logging.LoggingAdapter(configuration)
+    )
+
+    cache.set("a", {"user": "admin"})
+
+    assert not cache.enabled
+    assert cache.get("a") is None
+    assert cache.stats().entries == 0
+
+
+def test_membership_cache_drops_roles_read_before_invalidation() -> None:
+    configuration = _configuration(size=1)
+    cache = memory.MemoryMembershipCache(
+        configuration=configuration, logger=logging.LoggingAdapter(configuration)
+    )
+
+    stale_version = cache.version("a")
+    cache.invalidate("a")
+    cache.set("a", {"user": "admin"}, version=stale_version)
+
+    assert cache.get("a") is None
+
+    cache.set("a", {"user": "viewer"}, version=cache.version("a"))
+
+    assert cache.get("a") == {"user": "viewer"}
+
+    stale_version = cache.version("b")
+    cache.invalidate("b")
+    cache.invalidate("c")
+    cache.set("b", {"user": "admin"}, version=stale_version)
+
+    assert cache.get("b") is None
@@ -0,0 +1,417 @@
+from typing import Any, Iterable, List, Tuple
+from unittest import mock
+
+import pytest
+
+from src import settings
+from src.app.task.domain import entity as entity_domain
+from src.app.task.infra.repositories.psycopg import board as board_repository
+from src.app.task.infra.repositories.psycopg import task as task_repository
+from src.domain.models import exceptions, filter
+from src.domain.models import repository as repository_domain
+from src.infra.filter import filter_builder
+from src.infra.log import logging
+from src.infra.uow import model, statement
+
+
+class FakeSession(model.Session):
+    executed: List[Tuple[str, Any]]
+    copied: List[Tuple[str, List[Tuple[Any, ...]]]]
+    rows: List[Tuple[Any, ...]]
+    row: Tuple[Any, ...]
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.executed = []
+        self.copied = []
+        self.rows = []
+        self.row = (0,)
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        return None
+
+    def flush(self) -> None:
+        return None
+
+    def atomic_execute(
+        self,
+        query: str,
+        params: Tuple[str, ...] | None = None,
+        prepare: bool | None = None,
+    ) -> object:
+        self.executed.append((query, params))
+        response = mock.MagicMock()
+        response.fetchone.return_value = self.row
+        response.fetchall.return_value = self.rows
+        return response
+
+    def copy_rows(self, query: str, rows: Iterable[Tuple[Any, ...]]) -> int:
+        self.copied.append((query, list(rows)))
+        return len(self.copied[-1][1])
+
+
+def _criteria(board_id: str, status: str) -> filter.Criteria:
+    eq_filter = filter_builder.build(type_filter=filter.FilterType.EQUAL)
+    or_filter = filter_builder.build_group_filter(filter.GroupFilterType.OR)
+    return filter.Criteria(
+        filters=[
+            eq_filter("board_id")(board_id),
+            or_filter([eq_filter("status")(status), eq_filter("is_activated")(True)]),
+        ],
+        order_by=[],
+        page_quantity=10,
+        page_number=1,
+    )
+
+
+def _repository(
+    statements: statement.StatementCache | None = None,
+) -> Tuple[task_repository.PostgresTaskRepository, FakeSession]:
+    configuration = settings.DevSettings()
+    logger = logging.LoggingAdapter(configuration)
+    session = FakeSession(
+        configuration=configuration,
+        logger=logger,
+        _session=None,
+        _connection=None,
+        statements=statements,
+    )
+    repository = task_repository.PostgresTaskRepository(
+        configuration=configuration,
+        log=logger,
+        session=session,
+        filter_builder=filter_builder,
+    )
+    return repository, session
+
+
+def test_filter_reuses_compiled_template_for_same_shape() -> None:
+    statements = statement.StatementCache(size=16)
+    repository, session = _repository(statements)
+
+    repository.filter(criteria=_criteria("board-1", "TODO"))
+    repository.filter(criteria=_criteria("board-2", "DONE"))
+
+    (data_1, params_1), (data_2, params_2) = session.executed
+
+    assert data_1 is data_2
+    assert params_1 == ("board-1", "TODO", "true", 10, 0)
+    assert params_2 == ("board-2", "DONE", "true", 10, 0)
+    assert statements.stats().hits == 2
+
+
+def _row(id: str) -> Tuple[Any, ...]:
+    return (
+        id,
+        "user-1",
+        "name",
+        "description",
+        "todo",
+        None,
+        True,
+        "2024-01-01T00:00:00",
+        "2024-01-01T00:00:00",
+        None,
+        "board-1",
+        "low",
+    )
+
+
+def test_filter_reads_total_from_window_count_in_one_round_trip() -> None:
+    repository, session = _repository()
+    session.rows = [(*_row("task-1"), "task-1", 42)]
+
+    paginator = repository.filter(criteria=_criteria("board-1", "TODO"))
+
+    assert len(session.executed) == 1
+    assert "COUNT(*) OVER ()" in session.executed[0][0]
+    assert paginator.total == 42
+    assert len(paginator.elements) == 1
+
+
+def test_filter_falls_back_to_count_query_past_last_page() -> None:
+    repository, session = _repository()
+    criteria = _criteria("board-1", "TODO")
+    criteria.page_number = 5
+
+    paginator = repository.filter(criteria=criteria)
+
+    assert len(session.executed) == 2
+    assert session.executed[1][0].startswith("SELECT COUNT(*) FROM")
+    assert paginator.total == 0
+
+
+def test_filter_offset_page_returns_next_cursor() -> None:
+    repository, session = _repository()
+    session.rows = [(*_row("task-1"), "task-1", 42), (*_row("task-2"), "task-2", 42)]
+
+    paginator = repository.filter(criteria=_criteria("board-1", "TODO"))
+
+    assert "ORDER BY tbl_task.id ASC" in session.executed[0][0]
+    assert paginator.prev_cursor is None
+    assert paginator.next_cursor is not None
+    assert filter.Cursor.decode(paginator.next_cursor).values == ["task-2"]
+
+
+def test_filter_with_cursor_uses_keyset_predicate() -> None:
+    repository, session = _repository()
+    criteria = _criteria("board-1", "TODO")
+    criteria.page_quantity = 2
+    criteria.cursor = filter.Cursor(values=["task-2"])
+    session.rows = [(*_row(id), id) for id in ("task-3", "task-4", "task-5")]
+
+    paginator = repository.filter(criteria=criteria)
+
+    script, params = session.executed[0]
+    assert len(session.executed) == 1
+    assert "(tbl_task.id) > (%s)" in script
+    assert "COUNT(*) OVER ()" not in script
+    assert params == ("board-1", "TODO", "true", "task-2", 3)
+    assert [element.id for element in paginator.elements] == ["task-3", "task-4"]
+    assert paginator.total is None
+    assert paginator.count == 2
+    assert filter.Cursor.decode(paginator.next_cursor or "").values == ["task-4"]
+    previous = filter.Cursor.decode(paginator.prev_cursor or "")
+    assert previous.values == ["task-3"]
+    assert previous.direction == filter.CursorDirection.PREVIOUS
+
+
+def test_filter_with_previous_cursor_reverses_page() -> None:
+    repository, session = _repository()
+    criteria = _criteria("board-1", "TODO")
+    criteria.page_quantity = 2
+    criteria.cursor = filter.Cursor(
+        values=["task-3"], direction=filter.CursorDirection.PREVIOUS
+    )
+    session.rows = [(*_row(id), id) for id in ("task-2", "task-1")]
+
+    paginator = repository.filter(criteria=criteria)
+
+    script, _ = session.executed[0]
+    assert "(tbl_task.id) < (%s)" in script
+    assert "ORDER BY tbl_task.id DESC" in script
+    assert [element.id for element in paginator.elements] == ["task-1", "task-2"]
+    assert paginator.prev_cursor is None
+    assert filter.Cursor.decode(paginator.next_cursor or "").values == ["task-2"]
+
+
+def test_filter_with_cursor_without_keyset_is_rejected() -> None:
+    repository, session = _repository()
+    criteria = _criteria("board-1", "TODO")
+    criteria.cursor = filter.Cursor(values=["task-2"])
+
+    with mock.patch.object(filter_builder, "keyset", None):
+        with pytest.raises(exceptions.BadRequestError):
+            repository.filter(criteria=criteria)
+
+    assert session.executed == []
+
+
+def test_detailed_board_filter_rejects_cursor() -> None:
+    _, session = _repository()
+    repository = board_repository.PostgresDetailedBoardRepository(
+        configuration=session.configuration,
+        log=session.logger,
+        session=session,
+        filter_builder=filter_builder,
+    )
+    criteria = filter.Criteria(
+        filters=[],
+        order_by=[],
+        page_quantity=10,
+        page_number=1,
+        cursor=filter.Cursor(values=["board-2"]),
+    )
+
+    with pytest.raises(exceptions.BadRequestError):
+        repository.filter_by_user_id(user_id="user-1", criteria=criteria)
+
+    assert session.executed == []
+
+
+def test_filter_orders_by_whitelisted_fields_with_id_tie_break() -> None:
+    repository, session = _repository()
+    criteria = _criteria("board-1", "TODO")
+    criteria.order_by = [filter_builder.build_order(filter.OrderType.DESC)("priority")]
+
+    repository.filter(criteria=criteria)
+
+    script, _ = session.executed[0]
+    assert "ORDER BY tbl_task.priority DESC, tbl_task.id ASC LIMIT" in script
+
+
+def test_filter_rejects_sort_outside_whitelist() -> None:
+    repository, session = _repository()
+    criteria = _criteria("board-1", "TODO")
+    criteria.order_by = [
+        filter_builder.build_order(filter.OrderType.ASC)("description")
+    ]
+
+    with pytest.raises(repository_domain.RepositorySortNotAllowedError):
+        repository.filter(criteria=criteria)
+
+    assert session.executed == []
+
+
+def test_filter_offsets_by_whole_pages() -> None:
+    repository, session = _repository()
+    criteria = _criteria("board-1", "TODO")
+    criteria.page_number = 3
+    session.rows = [(*_row("task-21"), "task-21", 21)]
+
+    paginator = repository.filter(criteria=criteria)
+
+    assert session.executed[0][1][-2:] == (10, 20)
+    assert paginator.total_pages == 3
+    assert paginator.has_previous
+    assert not paginator.has_next
+
+
+def test_paginator_pages() -> None:
+    paginator = filter.Paginator(total=25, page=1, count=10)
+
+    assert paginator.total_pages == 3
+    assert not paginator.has_previous
+    assert paginator.has_next
+    assert filter.Paginator().total_pages == 0
+    assert not filter.Paginator().has_next
+
+
+def test_task_with_histories_loads_in_one_statement() -> None:
+    repository, session = _repository()
+    history = [
+        "history-1",
+        "task-1",
+        "2024-01-01T00:00:00",
+        "inserted",
+        None,
+        {"name": "name"},
+        True,
+        "2024-01-01T00:00:00",
+        "2024-01-01T00:00:00",
+        None,
+    ]
+    session.row = (*_row("task-1"), [history])
+
+    task = repository.get_with_histories_by_id(id="task-1", last_histories=1)
+
+    assert len(session.executed) == 1
+    assert "LIMIT %s" in session.executed[0][0]
+    assert session.executed[0][1] == (1, "task-1")
+    assert task is not None
+    assert [history.id for history in task.histories] == ["history-1"]
+
+
+def _task(id: str) -> entity_domain.Task:
+    return entity_domain.Task(
+        id=id, name="name", description="description", owner="user-1", board_id="b"
+    )
+
+
+def test_create_many_uses_multi_row_values_for_small_batches() -> None:
+    repository, session = _repository()
+    session.rows = [("task-2",), ("task-1",)]
+
+    ids = repository.create_many(entities=[_task("task-2"), _task("task-1")])
+
+    assert ids == ["task-2", "task-1"]
+    ((script, params),) = session.executed
+    assert script.count("(%s,") == 2
+    assert script.endswith("RETURNING id;")
+    assert params[0] == "task-2" and len(params) == 24
+    assert session.copied == []
+
+
+def test_create_many_streams_large_batches_through_copy() -> None:
+    repository, session = _repository()
+    session.configuration.postgres_copy_threshold = 3
+    tasks = [_task(f"task-{index}") for index in range(3)]
+
+    ids = repository.create_many(entities=tasks)
+
+    assert ids == ["task-0", "task-1", "task-2"]
+    assert session.executed == []
+    ((script, rows),) = session.copied
+    assert script.startswith("COPY tbl_task (id,board_id,")
+    assert [row[0] for row in rows] == ids
+
+
+def test_update_where_compiles_to_one_returning_statement() -> None:
+    repository, session = _repository()
+    session.rows = [("task-1",), ("task-2",)]
+
+    ids = repository.update_where(
+        criteria=_criteria("board-1", "TODO"), changes={"priority": "high"}
+    )
+
+    assert ids == ["task-1", "task-2"]
+    ((script, params),) = session.executed
+    assert script.startswith("UPDATE tbl_task SET priority = %s,updated_at = %s")
+    assert script.endswith("RETURNING id;")
+    assert params[0] == "high" and params[2:] == ("board-1", "TODO", "true")
+
+
+def test_update_where_rejects_unknown_fields_and_empty_criteria() -> None:
+    repository, _ = _repository()
+    criteria = _criteria("board-1", "TODO")
+
+    with pytest.raises(ValueError):
+        repository.update_where(criteria=criteria, changes={"owner": "user-2"})
+    with pytest.raises(ValueError):
+        repository.update_where(
+            criteria=filter.Criteria(
+                filters=[], order_by=[], page_quantity=1, page_number=1
+            ),
+            changes={"priority": "high"},
+        )
+
+
+def test_delete_where_soft_deletes_matching_rows() -> None:
+    repository, session = _repository()
+    session.rows = [("task-1",)]
+
+    ids = repository.delete_by_board_id(board_id="board-1")
+
+    assert ids == ["task-1"]
+    ((script, params),) = session.executed
+    assert "SET deleted_at = %s, is_activated = %s" in script
+    assert "WHERE (board_id = %s) AND (is_activated = %s) RETURNING id" in script
+    assert params[1:] == ("false", "board-1", "true")
+
+
+def test_update_sets_only_dirty_columns() -> None:
+    repository, session = _repository()
+    task = _task("task-1")
+    task.mark_clean()
+    task.change_status(entity_domain.TaskStatus.DOING)
+
+    repository.update(id="task-1", to_update=task)
+
+    ((script, params),) = session.executed
+    assert script == "UPDATE tbl_task SET status = %s,updated_at = %s WHERE id = %s;"
+    assert params[0] == entity_domain.TaskStatus.DOING and params[-1] == "task-1"
+    assert task.dirty_fields == set()
+
+
+def test_update_skips_statement_when_nothing_changed() -> None:
+    repository, session = _repository()
+    task = _task("task-1")
+    task.mark_clean()
+    task.update(name=task.name)
+
+    repository.update(id="task-1", to_update=task)
+
+    assert session.executed == []
+
+
+def test_update_writes_every_column_for_untracked_entities() -> None:
+    repository, session = _repository()
+
+    repository.update(id="task-1", to_update=_task("task-1"))
+
+    ((script, params),) = session.executed
+    assert script.count("= %s") == 12
+    assert len(params) == 12
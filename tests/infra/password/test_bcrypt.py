@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+from pydantic import SecretStr
+
+from src import settings
+from src.infra.log import logging
+from src.infra.password import bcrypt, model
+
+
+def _hasher(
+    rounds: int = 4, max_concurrency: int = 0, max_waiting: int = 256
+) -> bcrypt.ThreadPoolBcryptHasher:
+    configuration = settings.DevSettings()
+    configuration.password_hash_rounds = rounds
+    configuration.password_hasher_workers = 2
+    configuration.password_hasher_max_concurrency = max_concurrency
+    configuration.password_hasher_max_waiting = max_waiting
+    return bcrypt.ThreadPoolBcryptHasher(
+        configuration=configuration, logger=logging.LoggingAdapter(configuration)
+    )
+
+
+def test_bcrypt_hasher_hashes_and_verifies() -> None:
+    hasher = _hasher()
+
+    async def scenario():
+        hashed = SecretStr(await hasher.hash(SecretStr("secret")))
+        return (
+            hashed,
+            await hasher.verify(SecretStr("secret"), hashed),
+            await hasher.verify(SecretStr("other"), hashed),
+        )
+
+    hashed, valid, invalid = asyncio.run(scenario())
+    hasher.shutdown()
+
+    assert hashed.get_secret_value().startswith("$2b$04$")
+    assert valid is True
+    assert invalid is False
+    assert hasher.needs_rehash(hashed) is False
+    assert _hasher(rounds=5).needs_rehash(hashed) is True
+
+    stats = hasher.stats()
+    assert stats.completed == 3
+    assert stats.running == 0
+    assert stats.waiting == 0
+
+
+def test_bcrypt_hasher_rejects_when_queue_is_full() -> None:
+    hasher = _hasher(max_concurrency=1, max_waiting=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking() -> str:
+        started.set()
+        release.wait(5)
+        return "done"
+
+    async def scenario():
+        running = asyncio.ensure_future(hasher._run(blocking))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        waiting = asyncio.ensure_future(hasher._run(lambda: "queued"))
+        await asyncio.sleep(0)
+        assert hasher.stats().waiting == 1
+
+        with pytest.raises(model.PasswordHasherBusyError):
+            await hasher._run(lambda: "rejected")
+
+        release.set()
+        return await running, await waiting
+
+    assert asyncio.run(scenario()) == ("done", "queued")
+    hasher.shutdown()
+
+    stats = hasher.stats()
+    assert stats.rejected == 1
+    assert stats.completed == 2
+    assert stats.running == 0
+
+
+def test_process_pool_hasher_splits_cpus_between_server_workers() -> None:
+    configuration = settings.DevSettings()
+    configuration.password_hasher_workers = 0
+    configuration.server_provider = "uvicorn-prefork"
+    logger = logging.LoggingAdapter(configuration)
+
+    with mock.patch("os.cpu_count", return_value=8):
+        configuration.server_workers = 4
+        split = bcrypt.ProcessPoolBcryptHasher(
+            configuration=configuration, logger=logger
+        )
+        configuration.server_workers = 16
+        minimum = bcrypt.ProcessPoolBcryptHasher(
+            configuration=configuration, logger=logger
+        )
+        configuration.server_provider = "uvicorn"
+        single = bcrypt.ProcessPoolBcryptHasher(
+            configuration=configuration, logger=logger
+        )
+
+    assert split.workers == 2
+    assert minimum.workers == 1
+    assert single.workers == 8
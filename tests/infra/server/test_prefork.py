@@ -0,0 +1,65 @@
+import importlib
+import unittest.mock as mock
+
+from src import main, settings
+from src.infra.log import logging
+from src.infra.server import prefork
+
+
+def _adapter(workers: int = 2) -> prefork.UvicornPreforkAdapter:
+    configuration = settings.DevSettings()
+    configuration.server_workers = workers
+    log = logging.LoggingAdapter(configuration=configuration)
+    return prefork.UvicornPreforkAdapter(
+        configuration=configuration, http=mock.MagicMock(), logger=log
+    )
+
+
+def test_prefork_rolling_restart_replaces_workers_one_at_a_time() -> None:
+    adapter = _adapter()
+    adapter._workers = {1: 0.0, 2: 0.0}
+    calls = []
+    new_pids = iter([3, 4])
+
+    def spawn(sock):
+        pid = next(new_pids)
+        adapter._workers[pid] = 0.0
+        calls.append(("spawn", pid))
+        return pid
+
+    def stop(pids):
+        for pid in pids:
+            adapter._workers.pop(pid)
+        calls.append(("stop", pids))
+
+    with (
+        mock.patch.object(adapter, "_spawn", side_effect=spawn),
+        mock.patch.object(adapter, "_stop", side_effect=stop),
+    ):
+        adapter._rolling_restart(mock.MagicMock())
+
+    assert calls == [("spawn", 3), ("stop", [1]), ("spawn", 4), ("stop", [2])]
+    assert set(adapter._workers) == {3, 4}
+
+
+@mock.patch("os.waitpid", side_effect=[(1, 256), (0, 0)])
+def test_prefork_reap_forgets_exited_workers(waitpid: mock.MagicMock) -> None:
+    adapter = _adapter()
+    adapter._workers = {1: 0.0, 2: 0.0}
+
+    adapter._reap()
+
+    assert set(adapter._workers) == {2}
+    assert waitpid.call_count == 2
+
+
+def test_prefork_worker_factory_skips_migrations() -> None:
+    configuration = settings.DevSettings()
+    dependencies = {"http": mock.MagicMock()}
+
+    with mock.patch.object(main, "_build", return_value=dependencies) as build:
+        module, _, factory = configuration.server_app_factory.partition(":")
+        app = getattr(importlib.import_module(module), factory)()
+
+    build.assert_called_once_with(prepare=False)
+    assert app is dependencies["http"].execute.return_value.instance
@@ -20,3 +20,50 @@ def test_get_uvicorn_ok(
     adapter.execute()
 
     run.assert_called()
+
+
+@mock.patch("importlib.util.find_spec", return_value=None)
+def test_uvicorn_options_fall_back_without_accelerators(
+    find_spec: mock.MagicMock,
+) -> None:
+    configuration = settings.DevSettings()
+    configuration.server_loop = "uvloop"
+    log = mock.MagicMock()
+
+    options = uvicorn.server_options(configuration, log)
+
+    assert options["loop"] == "asyncio"
+    assert options["http"] == "h11"
+    assert options["limit_concurrency"] is None
+    assert options["limit_max_requests"] is None
+    log.warning.assert_called_once()
+
+
+@mock.patch("importlib.util.find_spec", return_value=object())
+def test_uvicorn_options_use_accelerators_and_limits(
+    find_spec: mock.MagicMock,
+) -> None:
+    configuration = settings.DevSettings()
+    configuration.server_limit_concurrency = 100
+    configuration.server_limit_max_requests = 10_000
+
+    options = uvicorn.server_options(configuration, mock.MagicMock(), supervised=True)
+
+    assert options["loop"] == "uvloop"
+    assert options["http"] == "httptools"
+    assert options["backlog"] == 2048
+    assert options["limit_concurrency"] == 100
+    assert options["limit_max_requests"] == 10_000
+
+
+def test_uvicorn_options_ignore_max_requests_without_supervisor() -> None:
+    configuration = settings.DevSettings()
+    configuration.server_limit_max_requests = 10_000
+    log = mock.MagicMock()
+
+    options = uvicorn.server_options(configuration, log)
+
+    assert options["limit_max_requests"] is None
+    log.warning.assert_called_with(
+        "Server limit max requests is ignored without the prefork server"
+    )
@@ -1,3 +1,4 @@
+import asyncio
 from unittest import mock
 
 import psycopg
@@ -26,3 +27,141 @@ def test_can_open_close_and_generate_session(connect: mock.MagicMock) -> None:
     with adapter.session() as session:
         assert session is not None
         assert isinstance(session, infra_psycopg.PsycopgSession)
+
+
+@mock.patch("psycopg.connect")
+def test_session_connects_on_first_query(connect: mock.MagicMock) -> None:
+    configuration = settings.DevSettings()
+    logger = logging.LoggingAdapter(configuration)
+    adapter = infra_psycopg.PsycopgUOW(logger=logger, configuration=configuration)
+
+    with adapter.session() as session:
+        session.commit()
+        session.rollback()
+
+    connect.assert_not_called()
+
+    with adapter.session(read_only=True) as session:
+        assert session.read_only
+        session.atomic_execute("SELECT 1")
+        assert session.acquired
+
+    connect.assert_called_once_with(conninfo=mock.ANY, autocommit=True)
+    connection = connect.return_value
+    connection.cursor.return_value.close.assert_called_once()
+    connection.cursor.return_value.connection.close.assert_called_once()
+
+
+@mock.patch("psycopg_pool.ConnectionPool")
+def test_pool_reuses_connections_and_exposes_stats(pool: mock.MagicMock) -> None:
+    configuration = settings.DevSettings()
+    logger = logging.LoggingAdapter(configuration)
+    adapter = infra_psycopg.PsycopgPoolUOW(
+        logger=logger,
+        configuration=configuration,
+    )
+
+    pool.return_value.closed = False
+    connection = pool.return_value.getconn.return_value
+    pool.return_value.get_stats.return_value = {
+        "pool_max": 10,
+        "pool_size": 4,
+        "pool_available": 1,
+        "requests_queued": 2,
+        "requests_wait_ms": 30,
+    }
+
+    with adapter.session() as session:
+        assert isinstance(session, infra_psycopg.PsycopgSession)
+        pool.return_value.getconn.assert_not_called()
+        session.atomic_execute("SELECT 1")
+        session.atomic_execute("SELECT 2")
+
+    pool.return_value.getconn.assert_called_once()
+    pool.return_value.putconn.assert_called_once_with(
+        connection.cursor.return_value.connection
+    )
+
+    stats = adapter.stats()
+    assert stats.in_use == 3
+    assert stats.saturation == 0.3
+    assert stats.average_wait_ms == 15
+
+
+@mock.patch("psycopg_pool.AsyncConnectionPool")
+def test_async_pool_session_returns_connection(pool: mock.MagicMock) -> None:
+    configuration = settings.DevSettings()
+    logger = logging.LoggingAdapter(configuration)
+    adapter: model.AsyncUOW = infra_psycopg.AsyncPsycopgPoolUOW(
+        logger=logger,
+        configuration=configuration,
+    )
+
+    pool.return_value.closed = False
+    pool.return_value.getconn = mock.AsyncMock()
+    pool.return_value.putconn = mock.AsyncMock()
+    connection = pool.return_value.getconn.return_value
+    connection.set_autocommit = mock.AsyncMock()
+    connection.cursor = mock.MagicMock()
+    connection.cursor.return_value.execute = mock.AsyncMock()
+    connection.cursor.return_value.close = mock.AsyncMock()
+    connection.cursor.return_value.connection = connection
+    connection.info.transaction_status = psycopg.pq.TransactionStatus.IDLE
+
+    async def run() -> None:
+        async with adapter.session(read_only=True) as session:
+            assert isinstance(session, infra_psycopg.AsyncPsycopgSession)
+            await session.atomic_execute("SELECT 1")
+
+    asyncio.run(run())
+
+    pool.return_value.getconn.assert_awaited_once()
+    connection.set_autocommit.assert_awaited_once_with(True)
+    pool.return_value.putconn.assert_awaited_once_with(connection)
+
+
+@mock.patch("psycopg.connect")
+@mock.patch("psycopg_pool.ConnectionPool")
+def test_pool_probes_replica_lag_through_its_pool(
+    pool: mock.MagicMock, connect: mock.MagicMock
+) -> None:
+    configuration = settings.DevSettings()
+    configuration.postgres_replicas = "host=replica-a"
+    logger = logging.LoggingAdapter(configuration)
+    adapter = infra_psycopg.PsycopgPoolUOW(logger=logger, configuration=configuration)
+
+    pool.return_value.closed = False
+    connection = pool.return_value.connection.return_value.__enter__.return_value
+    connection.execute.return_value.fetchone.return_value = (2.5,)
+
+    assert adapter.replicas is not None
+    (chosen,) = adapter.replicas.replicas
+    assert adapter._replica_lag(chosen) == 2.5
+
+    connect.assert_not_called()
+    pool.return_value.connection.assert_called_once_with()
+
+
+@mock.patch("psycopg.AsyncConnection.connect")
+@mock.patch("psycopg_pool.AsyncConnectionPool")
+def test_async_pool_probes_replica_lag_through_its_pool(
+    pool: mock.MagicMock, connect: mock.MagicMock
+) -> None:
+    configuration = settings.DevSettings()
+    configuration.postgres_replicas = "host=replica-a"
+    logger = logging.LoggingAdapter(configuration)
+    adapter = infra_psycopg.AsyncPsycopgPoolUOW(
+        logger=logger, configuration=configuration
+    )
+
+    pool.return_value.closed = False
+    connection = pool.return_value.connection.return_value.__aenter__.return_value
+    connection.execute = mock.AsyncMock()
+    connection.execute.return_value.fetchone = mock.AsyncMock(return_value=(0.0,))
+
+    assert adapter.replicas is not None
+    (chosen,) = adapter.replicas.replicas
+
+    assert asyncio.run(adapter._replica_lag(chosen)) == 0.0
+    connect.assert_not_called()
+    pool.return_value.connection.assert_called_once_with()
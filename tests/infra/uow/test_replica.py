@@ -0,0 +1,119 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+from src import settings
+from src.infra.log import logging
+from src.infra.uow import model, replica
+
+
+class FakeSession(model.Session):
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        return None
+
+    def flush(self) -> None:
+        return None
+
+    def atomic_execute(
+        self,
+        query: str,
+        params: Tuple[str, ...] | None = None,
+        prepare: bool | None = None,
+    ) -> object:
+        return self._acquired_session()
+
+    def copy_rows(self, query: str, rows: Iterable[Tuple[Any, ...]]) -> int:
+        return 0
+
+
+class FakeUOW(model.UOW):
+    lags: Dict[str, float | None]
+    closed: List[str]
+
+    def __init__(self, *args, **kwargs) -> None:
+        kwargs["session_factory"] = FakeSession
+        super().__init__(*args, **kwargs)
+        self.lags = {}
+        self.closed = []
+
+    def _open(self, read_only: bool = False) -> Tuple[object, object]:
+        return "primary", "primary"
+
+    def _close(self, session: object | None) -> None:
+        if session:
+            self.closed.append(str(session))
+
+    def _open_replica(self, chosen: replica.Replica) -> Tuple[object, object]:
+        return chosen.name, chosen.name
+
+    def _replica_lag(self, chosen: replica.Replica) -> float | None:
+        return self.lags.get(chosen.name, 0.0)
+
+
+def _uow(balancing: str = "round-robin", max_lag: float = 5.0) -> FakeUOW:
+    configuration = settings.DevSettings()
+    configuration.postgres_replicas = "host=replica-a,host=replica-b"
+    configuration.postgres_replica_balancing = balancing
+    configuration.postgres_replica_max_lag = max_lag
+    configuration.postgres_replica_lag_interval = 60.0
+    return FakeUOW(
+        logger=logging.LoggingAdapter(configuration), configuration=configuration
+    )
+
+
+def _read(uow: FakeUOW) -> object:
+    with uow.read_session() as session:
+        assert session.read_only
+        return session.atomic_execute("SELECT 1")
+
+
+def test_read_sessions_round_robin_between_replicas() -> None:
+    uow = _uow()
+
+    assert [_read(uow) for _ in range(4)] == [
+        "replica-0",
+        "replica-1",
+        "replica-0",
+        "replica-1",
+    ]
+    assert uow.closed == ["replica-0", "replica-1", "replica-0", "replica-1"]
+    assert [stats.active for stats in uow.replicas.stats()] == [0, 0]
+    assert [stats.acquired for stats in uow.replicas.stats()] == [2, 2]
+
+
+def test_read_sessions_pick_least_connected_replica() -> None:
+    uow = _uow(balancing="least-connections")
+
+    with uow.read_session() as first:
+        first.atomic_execute("SELECT 1")
+        assert _read(uow) == "replica-1"
+        assert first.atomic_execute("SELECT 1") == "replica-0"
+
+    assert _read(uow) == "replica-0"
+
+
+def test_read_sessions_skip_lagging_replicas_and_fall_back_to_primary() -> None:
+    uow = _uow()
+    uow.lags = {"replica-0": 30.0}
+
+    assert [_read(uow) for _ in range(3)] == ["replica-1"] * 3
+
+    healthy = {stats.name: stats.healthy for stats in uow.replicas.stats()}
+    assert healthy == {"replica-0": False, "replica-1": True}
+
+    lagging = _uow()
+    lagging.lags = {"replica-0": 30.0, "replica-1": None}
+
+    assert _read(lagging) == "primary"
+    assert lagging.closed == ["primary"]
+
+
+def test_uow_without_replicas_reads_from_primary() -> None:
+    configuration = settings.DevSettings()
+    uow = FakeUOW(
+        logger=logging.LoggingAdapter(configuration), configuration=configuration
+    )
+
+    assert uow.replicas is None
+    assert _read(uow) == "primary"
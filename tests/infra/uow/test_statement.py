@@ -0,0 +1,86 @@
+from unittest import mock
+
+from src import settings
+from src.infra.log import logging
+from src.infra.uow import psycopg as infra_psycopg
+from src.infra.uow import statement
+
+
+def test_statement_cache_builds_once_and_evicts_least_recent() -> None:
+    cache = statement.StatementCache(size=2)
+    build = mock.MagicMock(side_effect=lambda: "SELECT 1;")
+
+    assert cache.get("a", build) == "SELECT 1;"
+    assert cache.get("a", build) == "SELECT 1;"
+    assert build.call_count == 1
+
+    cache.get("b", lambda: "SELECT 2;")
+    cache.get("a", build)
+    cache.get("c", lambda: "SELECT 3;")
+    cache.get("b", lambda: "SELECT 4;")
+
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.hits == 2
+    assert stats.misses == 4
+    assert stats.evictions == 2
+    assert stats.hit_rate == 2 / 6
+
+
+@mock.patch("psycopg_pool.ConnectionPool")
+def test_pool_session_prepares_cached_statements(pool: mock.MagicMock) -> None:
+    configuration = settings.DevSettings()
+    configuration.postgres_statement_cache_size = 8
+    logger = logging.LoggingAdapter(configuration)
+    adapter = infra_psycopg.PsycopgPoolUOW(logger=logger, configuration=configuration)
+
+    with adapter.session() as session:
+        query = session.cached_query("key", lambda: "SELECT %s;")
+        session.atomic_execute(query=query, params=("1",), prepare=True)
+
+    cursor = pool.return_value.getconn.return_value.cursor.return_value
+    cursor.execute.assert_called_once_with(
+        query="SELECT %s;", params=("1",), prepare=True
+    )
+    assert adapter.statements is not None
+    assert adapter.statements.stats().entries == 1
+
+
+@mock.patch("psycopg.connect")
+def test_session_per_connection_leaves_prepare_to_threshold(
+    connect: mock.MagicMock,
+) -> None:
+    configuration = settings.DevSettings()
+    configuration.postgres_statement_cache_size = 8
+    logger = logging.LoggingAdapter(configuration)
+    adapter = infra_psycopg.PsycopgUOW(logger=logger, configuration=configuration)
+
+    with adapter.session() as session:
+        query = session.cached_query("key", lambda: "SELECT %s;")
+        session.atomic_execute(query=query, params=("1",), prepare=True)
+
+    cursor = connect.return_value.cursor.return_value
+    cursor.execute.assert_called_once_with(
+        query="SELECT %s;", params=("1",), prepare=None
+    )
+    assert connect.return_value.prepared_max == 8
+    assert connect.return_value.prepare_threshold == 5
+    assert adapter.statements is not None
+    assert adapter.statements.stats().entries == 1
+
+
+@mock.patch("psycopg.connect")
+def test_session_without_statement_cache_does_not_force_prepare(
+    connect: mock.MagicMock,
+) -> None:
+    configuration = settings.DevSettings()
+    configuration.postgres_statement_cache_size = 0
+    logger = logging.LoggingAdapter(configuration)
+    adapter = infra_psycopg.PsycopgUOW(logger=logger, configuration=configuration)
+
+    with adapter.session() as session:
+        session.atomic_execute(query="SELECT 1;", prepare=True)
+
+    cursor = connect.return_value.cursor.return_value
+    cursor.execute.assert_called_once_with(query="SELECT 1;", params=None, prepare=None)
+    assert adapter.statements is None